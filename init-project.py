@@ -4,23 +4,75 @@ Initialize a new engineering project with the AI toolkit.
 
 Usage:
     python init-project.py <project-name> [options]
+    python init-project.py --from manifest.yaml [--workers N]
 
 Examples:
     python init-project.py pump-design
     python init-project.py turbine --full
     python init-project.py motor-controller --venv --rag
+    python init-project.py --from projects.yaml --link reflink
 """
 
 import argparse
+import errno
+import hashlib
+import json
+import platform
+import os
 import re
 import shutil
 import subprocess
 import sys
+import time
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from toolkit_manifest import hash_files, toolkit_files, toolkit_version, write_version_file
+
 TOOLKIT_ROOT = Path(__file__).parent.resolve()
 
+# How non-template files are materialized in the new project:
+#   auto     - reflink (copy-on-write clone) where supported, else copy
+#   reflink  - same as auto; reported separately for clarity in timings
+#   hardlink - share the toolkit's inode (read-only use only: editing the
+#              project copy in place edits the toolkit file too)
+#   copy     - plain copy
+LINK_MODES = ["auto", "reflink", "hardlink", "copy"]
+
+# Linux FICLONE ioctl (btrfs, XFS with reflink=1, bcachefs, ...)
+FICLONE = 0x40049409
+
+COPY_IGNORE = {"__pycache__", ".ipynb_checkpoints"}
+
+# Devices where reflink failed once - don't retry for every file
+_no_reflink_devices = set()
+
+# How --venv provisions .venv:
+#   fresh     - independent project venv installed from the package index
+#   wheelhouse - independent project venv installed offline from cached wheels
+#   cache     - small project venv linked (via .pth) to a shared pre-built env;
+#               the project's interpreter breaks if the toolkit's cache moves
+VENV_MODES = ["fresh", "wheelhouse", "cache"]
+
+# Shared across projects; override with TOOLKIT_ENV_CACHE
+ENV_CACHE_ROOT = Path(os.environ.get("TOOLKIT_ENV_CACHE", TOOLKIT_ROOT / ".env-cache"))
+
+REQUIREMENT_FILES = [
+    Path("requirements-engineering.txt"),
+    Path("scripts") / "requirements-rag.txt",
+]
+
+CACHE_PTH_NAME = "_toolkit_env_cache.pth"
+COMPLETE_MARKER = ".complete"
+LOCK_POLL_SECONDS = 0.5
+LOCK_STALE_SECONDS = 3 * 3600   # A build holding the lock longer than this is assumed dead
+
+_env_cache_locks = {}
+_env_cache_locks_guard = threading.Lock()
+
 
 def validate_project_name(name: str) -> bool:
     """Validate project name - no spaces, no special chars."""
@@ -35,6 +87,207 @@ def process_template(content: str, replacements: dict) -> str:
     return content
 
 
+def reflink_file(src: Path, dest: Path) -> bool:
+    """Clone src to dest copy-on-write. Returns False if unsupported here."""
+    if sys.platform != "linux":
+        return False
+    try:
+        device = dest.parent.stat().st_dev
+    except OSError:
+        return False
+    if device in _no_reflink_devices:
+        return False
+
+    import fcntl
+    try:
+        with open(src, "rb") as fsrc, open(dest, "wb") as fdst:
+            fcntl.ioctl(fdst.fileno(), FICLONE, fsrc.fileno())
+    except OSError as e:
+        dest.unlink(missing_ok=True)
+        if e.errno in (errno.EOPNOTSUPP, errno.ENOTTY, errno.EXDEV, errno.EINVAL, errno.ENOSYS):
+            _no_reflink_devices.add(device)
+            return False
+        raise
+    shutil.copystat(src, dest)
+    return True
+
+
+def place_file(src: Path, dest: Path, link_mode: str = "auto") -> str:
+    """Materialize src at dest using the cheapest allowed method. Returns the method used."""
+    if link_mode in ("auto", "reflink") and reflink_file(src, dest):
+        return "reflink"
+    if link_mode == "hardlink":
+        try:
+            os.link(src, dest)
+            return "hardlink"
+        except OSError:
+            pass  # Cross-device or unsupported - fall back to copy
+    shutil.copy2(src, dest)
+    return "copy"
+
+
+def collect_files(src_dir: Path, dest_dir: Path) -> list:
+    """List (src, dest) pairs for every file under src_dir, skipping caches."""
+    jobs = []
+    for root, dirs, files in os.walk(src_dir):
+        dirs[:] = [d for d in dirs if d not in COPY_IGNORE]
+        rel_root = Path(root).relative_to(src_dir)
+        for filename in files:
+            if filename.endswith((".pyc", ".pyo")):
+                continue
+            jobs.append((Path(root) / filename, dest_dir / rel_root / filename))
+    return jobs
+
+
+def copy_files(jobs: list, executor: ThreadPoolExecutor, link_mode: str = "auto") -> dict:
+    """Copy (src, dest) pairs concurrently. Returns counts per method used."""
+    for parent in sorted({dest.parent for _, dest in jobs}):
+        parent.mkdir(parents=True, exist_ok=True)
+
+    methods = {}
+    for method in executor.map(lambda job: place_file(job[0], job[1], link_mode), jobs):
+        methods[method] = methods.get(method, 0) + 1
+    return methods
+
+
+def venv_python(venv_path: Path) -> Path:
+    """Path of the interpreter inside a virtual environment."""
+    if sys.platform == "win32":
+        return venv_path / "Scripts" / "python.exe"
+    return venv_path / "bin" / "python"
+
+
+def venv_site_packages(venv_path: Path) -> Path:
+    """Ask a virtual environment for its site-packages directory."""
+    result = subprocess.run(
+        [str(venv_python(venv_path)), "-c", "import sysconfig; print(sysconfig.get_paths()['purelib'])"],
+        capture_output=True, text=True, check=True
+    )
+    return Path(result.stdout.strip())
+
+
+def requirements_key(root: Path) -> str:
+    """Hash of the requirement files plus interpreter/platform - the env cache key."""
+    digest = hashlib.sha256()
+    digest.update(f"{sys.version_info.major}.{sys.version_info.minor}|{sys.platform}|{platform.machine()}".encode())
+    for rel_path in REQUIREMENT_FILES:
+        req = root / rel_path
+        digest.update(str(rel_path).encode())
+        digest.update(req.read_bytes() if req.is_file() else b"")
+    return digest.hexdigest()[:16]
+
+
+@contextmanager
+def env_cache_lock(path: Path):
+    """
+    Per-entry lock so concurrent batch workers and concurrent init-project.py
+    processes build each cache entry once.
+
+    Threads of this process queue on a threading.Lock; processes on a
+    '<entry>.lock' file created with O_CREAT | O_EXCL.
+    """
+    with _env_cache_locks_guard:
+        thread_lock = _env_cache_locks.setdefault(str(path), threading.Lock())
+    lock_path = path.with_name(path.name + ".lock")
+    with thread_lock:
+        lock_path.parent.mkdir(parents=True, exist_ok=True)
+        while True:
+            try:
+                fd = os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+                break
+            except FileExistsError:
+                try:
+                    if time.time() - lock_path.stat().st_mtime > LOCK_STALE_SECONDS:
+                        lock_path.unlink()
+                        continue
+                except FileNotFoundError:
+                    continue
+                time.sleep(LOCK_POLL_SECONDS)
+        try:
+            os.write(fd, f"{os.getpid()}\n".encode())
+            os.close(fd)
+            yield
+        finally:
+            try:
+                lock_path.unlink()
+            except FileNotFoundError:
+                pass
+
+
+def requirement_args(root: Path) -> list:
+    """pip '-r file' arguments for the requirement files present under root."""
+    args = []
+    for rel_path in REQUIREMENT_FILES:
+        if (root / rel_path).is_file():
+            args += ["-r", str(root / rel_path)]
+    return args
+
+
+def ensure_cached_env(root: Path, output=None) -> Path:
+    """Build the shared environment for root's requirements once; reuse afterwards."""
+    env_path = ENV_CACHE_ROOT / "envs" / requirements_key(root)
+    with env_cache_lock(env_path):
+        if (env_path / COMPLETE_MARKER).is_file():
+            return env_path
+        if env_path.exists():
+            shutil.rmtree(env_path)  # Interrupted build
+        env_path.parent.mkdir(parents=True, exist_ok=True)
+        subprocess.run([sys.executable, "-m", "venv", str(env_path)], check=True, stdout=output)
+        subprocess.run([str(venv_python(env_path)), "-m", "pip", "install", *requirement_args(root)],
+                       check=True, stdout=output)
+        (env_path / COMPLETE_MARKER).write_text(datetime.now().isoformat() + "\n")
+    return env_path
+
+
+def ensure_wheelhouse(root: Path, output=None) -> Path:
+    """Build wheels for root's requirements once for offline installs."""
+    wheel_dir = ENV_CACHE_ROOT / "wheelhouse" / requirements_key(root)
+    with env_cache_lock(wheel_dir):
+        if (wheel_dir / COMPLETE_MARKER).is_file():
+            return wheel_dir
+        wheel_dir.mkdir(parents=True, exist_ok=True)
+        subprocess.run([sys.executable, "-m", "pip", "wheel", "--wheel-dir", str(wheel_dir), *requirement_args(root)],
+                       check=True, stdout=output)
+        (wheel_dir / COMPLETE_MARKER).write_text(datetime.now().isoformat() + "\n")
+    return wheel_dir
+
+
+def create_project_venv(target_path: Path, venv_mode: str = "fresh", verbose: bool = True):
+    """Create target_path/.venv with the engineering and RAG requirements."""
+    venv_path = target_path / ".venv"
+    output = None if verbose else subprocess.DEVNULL
+
+    if venv_mode == "cache":
+        cached_env = ensure_cached_env(target_path, output)
+        # pip comes from the shared env (python -m pip) and installs into the project venv
+        subprocess.run([sys.executable, "-m", "venv", "--without-pip", str(venv_path)], check=True, stdout=output)
+        # Appended after the project's own site-packages, so local installs take precedence
+        pth = venv_site_packages(venv_path) / CACHE_PTH_NAME
+        pth.write_text(f"{venv_site_packages(cached_env)}\n", encoding='utf-8')
+        return cached_env
+
+    subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True, stdout=output)
+    pip = [str(venv_python(venv_path)), "-m", "pip", "install"]
+    if venv_mode == "wheelhouse":
+        wheel_dir = ensure_wheelhouse(target_path, output)
+        subprocess.run([*pip, "--no-index", "--find-links", str(wheel_dir), *requirement_args(target_path)],
+                       check=True, stdout=output)
+        return wheel_dir
+
+    subprocess.run([*pip, *requirement_args(target_path)], check=True, stdout=output)
+    return None
+
+
+def print_timings(timings: dict):
+    """Print per-phase timings."""
+    total = sum(timings.values())
+    print(" PHASE TIMINGS")
+    print(" -------------")
+    for phase, seconds in timings.items():
+        print(f" {phase:<22} {seconds * 1000:9.1f} ms")
+    print(f" {'total':<22} {total * 1000:9.1f} ms")
+
+
 def init_project(
     name: str,
     target_path: Path = None,
@@ -45,9 +298,27 @@ def init_project(
     create_dashboard: bool = False,
     git_remote: str = None,
     no_git: bool = False,
-    dry_run: bool = False
-):
-    """Initialize a new project with toolkit files."""
+    dry_run: bool = False,
+    link_mode: str = "auto",
+    venv_mode: str = "fresh",
+    copy_workers: int = 8,
+    verbose: bool = True
+) -> dict:
+    """
+    Initialize a new project with toolkit files.
+
+    Returns:
+        dict: Seconds spent per phase (empty for dry runs)
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
+    timings = {}
+    phase_start = time.perf_counter()
+
+    def end_phase(phase):
+        nonlocal phase_start
+        now = time.perf_counter()
+        timings[phase] = now - phase_start
+        phase_start = now
 
     # Validate project name
     if not validate_project_name(name):
@@ -79,12 +350,12 @@ def init_project(
         print(f"  Name: {name}")
         print(f"  Description: {replacements['PROJECT_DESCRIPTION']}")
         print(f"  Type: {project_type}")
-        print(f"  Options: venv={create_venv}, rag={init_rag}, dashboard={create_dashboard}")
+        print(f"  Options: venv={create_venv} ({venv_mode}), rag={init_rag}, dashboard={create_dashboard}")
         print(f"  Git: {'no' if no_git else 'yes'}" + (f", remote={git_remote}" if git_remote else ""))
-        return
+        return timings
 
-    print(f"Creating project '{name}' at: {target_path}")
-    print()
+    log(f"Creating project '{name}' at: {target_path}")
+    log()
 
     # Step 1: Create target directory
     target_path.mkdir(parents=True, exist_ok=True)
@@ -95,109 +366,107 @@ def init_project(
         print(f"ERROR: Scaffold not found at {scaffold}")
         sys.exit(1)
 
-    print("[1/7] Copying project scaffold...")
-    for item in scaffold.rglob("*"):
-        if item.is_file():
-            rel_path = item.relative_to(scaffold)
-            dest = target_path / rel_path
-            dest.parent.mkdir(parents=True, exist_ok=True)
-
+    methods = {}
+    with ThreadPoolExecutor(max_workers=copy_workers) as executor:
+        log("[1/7] Copying project scaffold...")
+        plain_jobs = []
+        for src, dest in collect_files(scaffold, target_path):
             # Handle .template files
-            if item.suffix == ".template":
+            if src.suffix == ".template":
                 dest = dest.with_suffix("")  # Remove .template extension
-                content = item.read_text(encoding='utf-8')
+                dest.parent.mkdir(parents=True, exist_ok=True)
+                content = src.read_text(encoding='utf-8')
                 content = process_template(content, replacements)
                 dest.write_text(content, encoding='utf-8')
             else:
-                shutil.copy2(item, dest)
-
-    # Step 3: Copy .claude directory
-    print("[2/7] Copying Claude configuration...")
-    claude_src = TOOLKIT_ROOT / "claude"
-    claude_dest = target_path / ".claude"
-    if claude_src.exists():
-        shutil.copytree(claude_src, claude_dest)
-
-        # Rename settings.json.template to settings.json
-        settings_template = claude_dest / "settings.json.template"
-        settings_dest = claude_dest / "settings.json"
-        if settings_template.exists():
-            settings_template.rename(settings_dest)
-
-    # Step 4: Copy scripts
-    print("[3/7] Copying scripts...")
-    scripts_src = TOOLKIT_ROOT / "scripts"
-    scripts_dest = target_path / "scripts"
-    if scripts_src.exists():
-        shutil.copytree(scripts_src, scripts_dest)
-
-    # Step 5: Copy templates
-    print("[4/7] Copying templates...")
-    templates_src = TOOLKIT_ROOT / "templates"
-    templates_dest = target_path / "templates"
-    if templates_src.exists():
-        shutil.copytree(templates_src, templates_dest)
+                plain_jobs.append((src, dest))
+        for method, count in copy_files(plain_jobs, executor, link_mode).items():
+            methods[method] = methods.get(method, 0) + count
+        end_phase("scaffold")
+
+        # Step 3: Copy .claude directory
+        log("[2/7] Copying Claude configuration...")
+        claude_src = TOOLKIT_ROOT / "claude"
+        claude_dest = target_path / ".claude"
+        if claude_src.exists():
+            jobs = collect_files(claude_src, claude_dest)
+            # Rename settings.json.template to settings.json
+            jobs = [(src, dest.with_name("settings.json") if dest == claude_dest / "settings.json.template" else dest)
+                    for src, dest in jobs]
+            for method, count in copy_files(jobs, executor, link_mode).items():
+                methods[method] = methods.get(method, 0) + count
+        end_phase("claude")
+
+        # Step 4: Copy scripts
+        log("[3/7] Copying scripts...")
+        scripts_src = TOOLKIT_ROOT / "scripts"
+        if scripts_src.exists():
+            for method, count in copy_files(collect_files(scripts_src, target_path / "scripts"),
+                                            executor, link_mode).items():
+                methods[method] = methods.get(method, 0) + count
+        end_phase("scripts")
+
+        # Step 5: Copy templates
+        log("[4/7] Copying templates...")
+        templates_src = TOOLKIT_ROOT / "templates"
+        if templates_src.exists():
+            for method, count in copy_files(collect_files(templates_src, target_path / "templates"),
+                                            executor, link_mode).items():
+                methods[method] = methods.get(method, 0) + count
+        end_phase("templates")
 
     # Step 6: Copy requirements
     req_src = TOOLKIT_ROOT / "requirements-engineering.txt"
     if req_src.exists():
         shutil.copy2(req_src, target_path / "requirements-engineering.txt")
 
-    # Step 7: Write toolkit version marker
-    version_file = TOOLKIT_ROOT / "VERSION"
-    version = version_file.read_text().strip() if version_file.exists() else "1.0.0"
-    (target_path / ".toolkit-version").write_text(f"{version}\n")
+    # Step 7: Write toolkit version marker and manifest of installed toolkit files
+    version = toolkit_version(TOOLKIT_ROOT)
+    manifest = hash_files(toolkit_files(TOOLKIT_ROOT), workers=copy_workers)
+    write_version_file(target_path / ".toolkit-version", version, manifest)
+    end_phase("version")
 
     # Optional: Create virtual environment
     if create_venv:
-        print("[5/7] Creating virtual environment...")
-        venv_path = target_path / ".venv"
-        subprocess.run([sys.executable, "-m", "venv", str(venv_path)], check=True)
-
-        # Install requirements
-        if sys.platform == "win32":
-            pip_path = venv_path / "Scripts" / "pip.exe"
-        else:
-            pip_path = venv_path / "bin" / "pip"
-
-        req_eng = target_path / "requirements-engineering.txt"
-        req_rag = target_path / "scripts" / "requirements-rag.txt"
-
-        if req_eng.exists():
-            subprocess.run([str(pip_path), "install", "-r", str(req_eng)], check=True)
-        if req_rag.exists():
-            subprocess.run([str(pip_path), "install", "-r", str(req_rag)], check=True)
+        log(f"[5/7] Creating virtual environment ({venv_mode})...")
+        source = create_project_venv(target_path, venv_mode, verbose)
+        if source is not None:
+            log(f"      Using shared {'environment' if venv_mode == 'cache' else 'wheelhouse'}: {source}")
     else:
-        print("[5/7] Skipping virtual environment (use --venv to enable)")
+        log("[5/7] Skipping virtual environment (use --venv to enable)")
+    end_phase("venv")
 
     # Optional: Initialize RAG
     if init_rag:
-        print("[6/7] Initializing RAG index...")
+        log("[6/7] Initializing RAG index...")
         setup_rag = target_path / "scripts" / "setup_rag.py"
         if setup_rag.exists():
             # Just create the chroma_db directory - actual setup needs PDFs
             (target_path / "chroma_db").mkdir(exist_ok=True)
-            print("      Empty RAG index created. Add PDFs to docs/reference/ then run:")
-            print("      python scripts/setup_rag.py --setup")
+            log("      Empty RAG index created. Add PDFs to docs/reference/ then run:")
+            log("      python scripts/setup_rag.py --setup")
     else:
-        print("[6/7] Skipping RAG initialization (use --rag to enable)")
+        log("[6/7] Skipping RAG initialization (use --rag to enable)")
+    end_phase("rag")
 
     # Optional: Generate dashboard
     if create_dashboard:
-        print("[7/7] Generating dashboard...")
+        log("[7/7] Generating dashboard...")
         dashboard_script = target_path / "scripts" / "generate_dashboard.py"
         if dashboard_script.exists():
             try:
-                subprocess.run([sys.executable, str(dashboard_script)], cwd=str(target_path), check=True)
+                subprocess.run([sys.executable, str(dashboard_script)], cwd=str(target_path), check=True,
+                               stdout=None if verbose else subprocess.DEVNULL)
             except subprocess.CalledProcessError:
-                print("      Dashboard generation failed (may need dependencies)")
+                log("      Dashboard generation failed (may need dependencies)")
     else:
-        print("[7/7] Skipping dashboard (use --dashboard to enable)")
+        log("[7/7] Skipping dashboard (use --dashboard to enable)")
+    end_phase("dashboard")
 
     # Git initialization
     if not no_git:
-        print()
-        print("Initializing git repository...")
+        log()
+        log("Initializing git repository...")
         subprocess.run(["git", "init"], cwd=str(target_path), check=True, capture_output=True)
         subprocess.run(["git", "add", "-A"], cwd=str(target_path), check=True, capture_output=True)
         subprocess.run(
@@ -209,46 +478,178 @@ def init_project(
 
         if git_remote:
             subprocess.run(["git", "remote", "add", "origin", git_remote], cwd=str(target_path), check=True)
-            print(f"      Remote added: {git_remote}")
+            log(f"      Remote added: {git_remote}")
+    end_phase("git")
 
     # Print success message
+    log()
+    log("=" * 80)
+    log(f" PROJECT INITIALIZED: {name}")
+    log(f" Location: {target_path}")
+    log(f" Toolkit Version: {version}")
+    log("=" * 80)
+    log()
+    log(" GETTING STARTED CHECKLIST")
+    log(" -------------------------")
+    log(f" [ ] 1. Open project in VS Code:")
+    log(f'        code "{target_path}"')
+    log()
+    log(" [ ] 2. Read workflow documentation:")
+    log("        - WORKFLOW.md (daily workflow)")
+    log("        - .claude/README.md (hook system)")
+    log()
+    log(" [ ] 3. Customize project_params.py with your parameters")
+    log()
+    log(" [ ] 4. Add PDFs to docs/reference/, then:")
+    log("        python scripts/setup_rag.py --setup")
+    log()
+    log(" [ ] 5. Update CONTEXT.md with project state")
+    log()
+    log(" [ ] 6. Run /prime in Claude Code to orient yourself")
+    log()
+    log(" KEY COMMANDS")
+    log(" ------------")
+    log(" /prime              - Read essential project context")
+    log(" /understand [sys]   - Research before designing")
+    log(" /research [topic]   - Web search and document")
+    log(" /decision [title]   - Create decision record")
+    log()
+    log(" DASHBOARD")
+    log(" ---------")
+    log(" python scripts/generate_dashboard.py")
+    log(" Open dashboard.html in browser")
+    log("=" * 80)
+    if verbose:
+        print()
+        print(" Files placed: " + ", ".join(f"{count} {method}" for method, count in sorted(methods.items())))
+        print_timings(timings)
+
+    return timings
+
+
+def load_manifest(manifest_path: Path) -> list:
+    """
+    Load a batch manifest (YAML or JSON).
+
+    Format:
+        defaults:            # optional, applied to every project
+          type: mechanical
+          no_git: false
+        projects:
+          - name: pump-design
+            description: Centrifugal pump
+            path: ../projects/pump-design   # optional
+            venv: true
+
+    Returns:
+        list: One dict of init_project options per project
+    """
+    text = manifest_path.read_text(encoding='utf-8')
+    if manifest_path.suffix.lower() == ".json":
+        data = json.loads(text)
+    else:
+        try:
+            import yaml
+        except ImportError:
+            print("ERROR: PyYAML is required for YAML manifests (pip install PyYAML) - or use a .json manifest")
+            sys.exit(1)
+        data = yaml.safe_load(text)
+
+    if isinstance(data, list):
+        data = {"projects": data}
+    defaults = data.get("defaults") or {}
+    projects = []
+    for entry in data.get("projects") or []:
+        if isinstance(entry, str):
+            entry = {"name": entry}
+        options = {**defaults, **entry}
+        if "name" not in options:
+            print(f"ERROR: Manifest entry without a name: {entry}")
+            sys.exit(1)
+        projects.append(options)
+    return projects
+
+
+def manifest_kwargs(options: dict, manifest_dir: Path) -> dict:
+    """Map manifest keys (CLI option names) to init_project arguments."""
+    full = bool(options.get("full"))
+    path = options.get("path")
+    if path is not None:
+        path = Path(path)
+        if not path.is_absolute():
+            path = manifest_dir / path
+    return {
+        "name": options["name"],
+        "target_path": path,
+        "description": options.get("description", ""),
+        "project_type": options.get("type", "general"),
+        "create_venv": full or bool(options.get("venv")),
+        "venv_mode": options.get("venv_mode", "fresh"),
+        "init_rag": full or bool(options.get("rag")),
+        "create_dashboard": full or bool(options.get("dashboard")),
+        "git_remote": options.get("git_remote"),
+        "no_git": bool(options.get("no_git")),
+    }
+
+
+def init_batch(manifest_path: Path, workers: int = 4, link_mode: str = "auto", dry_run: bool = False) -> int:
+    """Create every project in a manifest concurrently. Returns the number of failures."""
+    manifest_path = manifest_path.resolve()
+    projects = [manifest_kwargs(options, manifest_path.parent) for options in load_manifest(manifest_path)]
+
+    names = [p["name"] for p in projects]
+    duplicates = sorted({n for n in names if names.count(n) > 1})
+    if duplicates:
+        print(f"ERROR: Duplicate project names in manifest: {', '.join(duplicates)}")
+        sys.exit(1)
+
+    if dry_run:
+        for kwargs in projects:
+            init_project(**kwargs, dry_run=True)
+        return 0
+
+    print(f"Creating {len(projects)} projects from {manifest_path} ({workers} workers, link mode: {link_mode})")
     print()
-    print("=" * 80)
-    print(f" PROJECT INITIALIZED: {name}")
-    print(f" Location: {target_path}")
-    print(f" Toolkit Version: {version}")
-    print("=" * 80)
-    print()
-    print(" GETTING STARTED CHECKLIST")
-    print(" -------------------------")
-    print(f" [ ] 1. Open project in VS Code:")
-    print(f'        code "{target_path}"')
-    print()
-    print(" [ ] 2. Read workflow documentation:")
-    print("        - WORKFLOW.md (daily workflow)")
-    print("        - .claude/README.md (hook system)")
-    print()
-    print(" [ ] 3. Customize project_params.py with your parameters")
-    print()
-    print(" [ ] 4. Add PDFs to docs/reference/, then:")
-    print("        python scripts/setup_rag.py --setup")
-    print()
-    print(" [ ] 5. Update CONTEXT.md with project state")
-    print()
-    print(" [ ] 6. Run /prime in Claude Code to orient yourself")
-    print()
-    print(" KEY COMMANDS")
-    print(" ------------")
-    print(" /prime              - Read essential project context")
-    print(" /understand [sys]   - Research before designing")
-    print(" /research [topic]   - Web search and document")
-    print(" /decision [title]   - Create decision record")
+
+    def run(kwargs):
+        start = time.perf_counter()
+        try:
+            timings = init_project(**kwargs, link_mode=link_mode, verbose=False)
+            return kwargs["name"], "ok", timings, time.perf_counter() - start
+        except SystemExit:
+            # init_project already printed the ERROR line
+            return kwargs["name"], "FAILED", {}, time.perf_counter() - start
+        except (OSError, subprocess.CalledProcessError) as e:
+            print(f"ERROR: {kwargs['name']}: {e}")
+            return kwargs["name"], "FAILED", {}, time.perf_counter() - start
+
+    results = []
+    batch_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(run, kwargs) for kwargs in projects]
+        for future in as_completed(futures):
+            name, status, timings, elapsed = future.result()
+            print(f"  [{status}] {name} ({elapsed:.2f} s)")
+            results.append((name, status, timings, elapsed))
+    batch_elapsed = time.perf_counter() - batch_start
+
+    phases = []
+    for _, _, timings, _ in results:
+        phases.extend(p for p in timings if p not in phases)
+
     print()
-    print(" DASHBOARD")
-    print(" ---------")
-    print(" python scripts/generate_dashboard.py")
-    print(" Open dashboard.html in browser")
     print("=" * 80)
+    print(" BATCH SUMMARY (ms per phase)")
+    print("=" * 80)
+    print(f" {'Project':<24}{'Status':<8}" + "".join(f"{p[:9]:>10}" for p in phases) + f"{'total':>10}")
+    for name, status, timings, elapsed in sorted(results):
+        print(f" {name[:23]:<24}{status:<8}"
+              + "".join(f"{timings.get(p, 0) * 1000:>10.0f}" for p in phases)
+              + f"{elapsed * 1000:>10.0f}")
+    failures = sum(1 for r in results if r[1] != "ok")
+    print("-" * 80)
+    print(f" {len(results) - failures} created, {failures} failed in {batch_elapsed:.2f} s")
+    return failures
 
 
 if __name__ == "__main__":
@@ -260,24 +661,44 @@ Examples:
   python init-project.py pump-design
   python init-project.py turbine --full
   python init-project.py motor --description "BLDC motor controller" --venv
+  python init-project.py --from projects.yaml --workers 8
         """
     )
 
-    parser.add_argument("name", help="Project name (letters, numbers, hyphens, underscores)")
+    parser.add_argument("name", nargs="?", help="Project name (letters, numbers, hyphens, underscores)")
     parser.add_argument("--path", help="Custom target directory (default: ../projects/<name>)")
     parser.add_argument("--description", "-d", help="Project description")
     parser.add_argument("--type", "-t", choices=["general", "mechanical", "electrical", "thermal"],
                         default="general", help="Project type (default: general)")
     parser.add_argument("--venv", action="store_true", help="Create Python virtual environment")
+    parser.add_argument("--venv-mode", choices=VENV_MODES, default="fresh",
+                        help="fresh: install from the package index (default); wheelhouse: offline install "
+                             "from cached wheels; cache: link a shared pre-built env (needs the toolkit "
+                             "checkout to stay in place)")
     parser.add_argument("--rag", action="store_true", help="Initialize empty RAG index")
     parser.add_argument("--dashboard", action="store_true", help="Generate initial dashboard")
     parser.add_argument("--full", action="store_true", help="Enable --venv --rag --dashboard")
     parser.add_argument("--git-remote", help="Add git remote origin URL")
     parser.add_argument("--no-git", action="store_true", help="Skip git initialization")
     parser.add_argument("--dry-run", action="store_true", help="Show what would be created")
+    parser.add_argument("--from", dest="manifest", metavar="MANIFEST",
+                        help="Create every project listed in a YAML/JSON manifest")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Projects created concurrently with --from (default: 4)")
+    parser.add_argument("--link", choices=LINK_MODES, default="auto",
+                        help="How non-template files are placed: auto (reflink if supported, else copy), "
+                             "reflink, hardlink (shares inodes with the toolkit - read-only use), copy")
 
     args = parser.parse_args()
 
+    if args.manifest:
+        if args.name:
+            parser.error("give either a project name or --from MANIFEST, not both")
+        failures = init_batch(Path(args.manifest), workers=args.workers, link_mode=args.link, dry_run=args.dry_run)
+        sys.exit(1 if failures else 0)
+    if not args.name:
+        parser.error("a project name is required (or use --from MANIFEST)")
+
     # Handle --full flag
     if args.full:
         args.venv = True
@@ -296,5 +717,7 @@ Examples:
         create_dashboard=args.dashboard,
         git_remote=args.git_remote,
         no_git=args.no_git,
-        dry_run=args.dry_run
+        dry_run=args.dry_run,
+        link_mode=args.link,
+        venv_mode=args.venv_mode
     )
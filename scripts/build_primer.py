@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Session Primer Builder
+
+Condenses what a new session needs to know - project state, system status,
+critical parameters, recent decisions, the last session's handoff, open
+tasks - from CONTEXT.md, docs/decisions, docs/systems, project_params.py,
+TODO.md and WORKFLOW.md into one primer that fits a token budget, so /prime
+is a single read instead of a dozen.
+
+The primer records a hash of its sources and is only rebuilt when one of
+them changed (or the budget did).
+
+Run:
+    python scripts/build_primer.py                 # rebuild if stale
+    python scripts/build_primer.py --print         # rebuild if stale, then print it (/prime)
+    python scripts/build_primer.py --budget 1500 --force
+Store: .toolkit-cache/primer.md (safe to delete, rebuilt on demand)
+"""
+
+import argparse
+import hashlib
+import os
+import re
+import sys
+from pathlib import Path
+
+from decisions import DEC_FILE_PATTERN, update_index
+from generate_dashboard import find_parameter_drift, parse_context_md, parse_critical_parameters, parse_system_status
+from param_registry import PARAMS_PATH, PROJECT_ROOT, load_registry
+
+PRIMER_PATH = PROJECT_ROOT / ".toolkit-cache" / "primer.md"
+PRIMER_FORMAT = 1
+DEFAULT_BUDGET = 2500       # tokens
+CHARS_PER_TOKEN = 4         # rough estimate for English markdown
+FOOTER_RESERVE = 60         # tokens kept free for the "not included" footer
+
+CONTEXT_PATH = PROJECT_ROOT / "CONTEXT.md"
+TODO_PATH = PROJECT_ROOT / "TODO.md"
+WORKFLOW_PATH = PROJECT_ROOT / "WORKFLOW.md"
+DECISIONS_DIR = PROJECT_ROOT / "docs" / "decisions"
+SYSTEMS_DIR = PROJECT_ROOT / "docs" / "systems"
+UNDERSTANDING_DOC = "current-understanding.md"
+
+STAMP_PATTERN = re.compile(r'^<!-- primer (\w+) -->')
+DATE_PATTERN = re.compile(r'\d{4}-\d{2}-\d{2}')
+
+
+def estimate_tokens(text: str) -> int:
+    return -(-len(text) // CHARS_PER_TOKEN)
+
+
+def read_text(path: Path) -> str:
+    try:
+        return path.read_text(encoding="utf-8")
+    except OSError:
+        return ""
+
+
+def source_files() -> list:
+    """Every file the primer is built from (existing ones only)."""
+    files = [CONTEXT_PATH, TODO_PATH, WORKFLOW_PATH, PARAMS_PATH]
+    if DECISIONS_DIR.is_dir():
+        files += sorted(p for p in DECISIONS_DIR.iterdir() if DEC_FILE_PATTERN.match(p.name))
+    if SYSTEMS_DIR.is_dir():
+        files += sorted(SYSTEMS_DIR.glob(f"*/{UNDERSTANDING_DOC}"))
+    return [p for p in files if p.is_file()]
+
+
+def sources_digest(budget: int) -> str:
+    digest = hashlib.sha256(f"{PRIMER_FORMAT}:{budget}".encode())
+    for path in source_files():
+        digest.update(path.relative_to(PROJECT_ROOT).as_posix().encode() + b"\0")
+        digest.update(hashlib.sha256(path.read_bytes()).digest())
+    return digest.hexdigest()[:16]
+
+
+def markdown_section(content: str, heading: str) -> str:
+    """Body of a `## heading` section ('' if missing)."""
+    match = re.search(rf'^## {re.escape(heading)}\s*\n(.*?)(?=^## |\Z)', content, re.MULTILINE | re.DOTALL)
+    return match.group(1).strip() if match else ""
+
+
+def filled_rows(rows: list) -> list:
+    return [row for row in rows if any(value.strip() for value in row.values())]
+
+
+def state_lines(context: str) -> list:
+    info = parse_context_md(context)
+    lines = [f"- Phase: {info['phase']}"]
+    blocking = [line.strip() for line in info["blocking"].split("\n") if line.strip()]
+    lines += ["- Blocking:"] + [f"  {line}" for line in blocking] if blocking else ["- Blocking: none"]
+    lines += ["- Next actions:"] + [f"  - [ ] {action}" for action in info["next_actions"]]
+    return lines
+
+
+def system_lines(context: str) -> list:
+    """System status table rows, marking which systems have an understanding doc (required before design)."""
+    systems = filled_rows(parse_system_status(context))
+    documented = {p.parent.name for p in SYSTEMS_DIR.glob(f"*/{UNDERSTANDING_DOC}")} if SYSTEMS_DIR.is_dir() else set()
+    lines = []
+    for system in systems:
+        slug = re.sub(r'[^a-z0-9]+', '-', system["name"].lower()).strip("-")
+        understanding = "understanding doc" if slug in documented else "NO understanding doc"
+        lines.append(f"- {system['name']}: {system['status'] or '?'} ({understanding})")
+        documented.discard(slug)
+    lines += [f"- {slug}: not in CONTEXT.md System Status (understanding doc)" for slug in sorted(documented)]
+    return lines
+
+
+def parameter_lines(context: str) -> list:
+    context_params = filled_rows(parse_critical_parameters(context))
+    context_lines = [f"- {row['name']} = {row['value']}" + (f" ({row['source']})" if row["source"] else "")
+                     for row in context_params]
+    try:
+        registry = load_registry(PARAMS_PATH)
+    except (SyntaxError, ValueError) as e:
+        # Half-edited file - still build the primer, from the CONTEXT.md table
+        return [f"- project_params.py does not parse ({e}) - values below are from CONTEXT.md"] + context_lines
+    params = [p for p in registry.critical() if p.name not in ("PROJECT_NAME", "PROJECT_DESCRIPTION")]
+    if not params:
+        return context_lines
+    lines = [f"- {p.name} = {p.format_value()}" + (f" ({p.source})" if p.source else "") for p in params]
+    registry_rows = [{"name": p.name, "raw_value": p.value} for p in registry]
+    lines += [f"- DRIFT: {warning}" for warning in find_parameter_drift(context_params, registry_rows)]
+    return lines
+
+
+def decision_lines() -> list:
+    """Decisions still in force, newest first."""
+    decisions = update_index(DECISIONS_DIR, PROJECT_ROOT / ".toolkit-cache" / "decisions-index.json")
+    current = [d for d in decisions if d["superseded_by"] is None]
+    return [f"- {d['id']} {d['title']} ({d['status']}" + (f", {d['date']})" if d["date"] else ")")
+            for d in sorted(current, key=lambda d: d["number"], reverse=True)]
+
+
+def last_session_lines(context: str) -> list:
+    """The newest `### date` entry of the Session History."""
+    history = markdown_section(context, "Session History")
+    entries = re.findall(r'^### (.+?)\n(.*?)(?=^### |\Z)', history, re.MULTILINE | re.DOTALL)
+    if not entries:
+        return []
+    dated = [(DATE_PATTERN.search(title).group(0) if DATE_PATTERN.search(title) else "", i)
+             for i, (title, _) in enumerate(entries)]
+    title, body = entries[max(dated)[1]]
+    return [f"- {title}"] + [f"  {line.strip()}" for line in body.split("\n") if line.strip()]
+
+
+def task_lines(todo: str) -> list:
+    return [line.strip() for line in markdown_section(todo, "High Priority").split("\n")
+            if line.strip().startswith("- [ ]") and line.strip() != "- [ ]"]
+
+
+def knowledge_lines(context: str) -> list:
+    section = markdown_section(context, "Claude's Learned Knowledge")
+    return [line.strip() for line in section.split("\n")
+            if line.strip().startswith("- ") and "(none yet)" not in line]
+
+
+def quick_reference_lines(workflow: str) -> list:
+    return [line for line in markdown_section(workflow, "Quick Reference").split("\n") if line.startswith("|")]
+
+
+def collect_sections() -> list:
+    """(title, lines, where the rest lives) in priority order - the budget cuts from the end."""
+    context = read_text(CONTEXT_PATH)
+    sections = []
+    if context:
+        sections += [("Project State", state_lines(context), "CONTEXT.md"),
+                     ("Systems", system_lines(context), "CONTEXT.md / docs/systems/"),
+                     ("Critical Parameters", parameter_lines(context), "project_params.py")]
+    sections.append(("Decisions In Force", decision_lines(), "docs/decisions/"))
+    if context:
+        sections.append(("Last Session", last_session_lines(context), "CONTEXT.md Session History"))
+    sections.append(("High-Priority Tasks", task_lines(read_text(TODO_PATH)), "TODO.md"))
+    if context:
+        sections.append(("Learned Knowledge", knowledge_lines(context), "CONTEXT.md / docs/reference/"))
+    sections.append(("Quick Reference", quick_reference_lines(read_text(WORKFLOW_PATH)), "WORKFLOW.md"))
+    return sections
+
+
+def fit_to_budget(sections: list, budget: int) -> tuple:
+    """
+    Render sections in order within `budget` tokens.
+
+    A section that does not fit is cut line by line with a pointer to where
+    the rest lives; sections with no room at all are listed in a footer.
+
+    Returns:
+        tuple: (list of output lines, list of omitted section titles with their source)
+    """
+    out, omitted = [], []
+    used = 0
+    limit = budget - FOOTER_RESERVE
+    for title, lines, source in sections:
+        if not lines:
+            continue
+        heading = ["", f"## {title}"]
+        cost = sum(estimate_tokens(line) + 1 for line in heading)
+        more = f"- ... {len(lines)} more in {source}"
+        if used + cost + estimate_tokens(lines[0]) + estimate_tokens(more) + 2 > limit:
+            omitted.append(f"{title} ({source})")
+            continue
+        out += heading
+        used += cost
+        for i, line in enumerate(lines):
+            rest = f"- ... {len(lines) - i} more in {source}"
+            if used + estimate_tokens(line) + 1 + estimate_tokens(rest) + 1 > limit and i < len(lines) - 1:
+                out.append(rest)
+                used += estimate_tokens(rest) + 1
+                break
+            out.append(line)
+            used += estimate_tokens(line) + 1
+    return out, omitted
+
+
+def build_primer(budget: int = DEFAULT_BUDGET, path: Path = PRIMER_PATH, force: bool = False) -> tuple:
+    """
+    Rebuild the primer if its sources changed.
+
+    Returns:
+        tuple: (primer text, rebuilt?)
+    """
+    digest = sources_digest(budget)
+    existing = read_text(path)
+    match = STAMP_PATTERN.match(existing)
+    if not force and match and match.group(1) == digest:
+        return existing, False
+
+    context = read_text(CONTEXT_PATH)
+    title = re.search(r'^# (.+)', context, re.MULTILINE)
+    name = re.sub(r'\s*-\s*AI Context$', '', title.group(1)) if title else PROJECT_ROOT.name
+    body, omitted = fit_to_budget(collect_sections(), budget)
+    lines = [f"<!-- primer {digest} -->",
+             f"# {name} - Session Primer",
+             "",
+             "Generated by scripts/build_primer.py from CONTEXT.md, decisions, systems, parameters and TODO.md.",
+             "Read the full source files before editing them."] + body
+    if omitted:
+        lines += ["", f"Not included (token budget): {'; '.join(omitted)}"]
+    text = "\n".join(lines) + "\n"
+
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp_path.write_text(text, encoding="utf-8")
+    os.replace(tmp_path, path)
+    return text, True
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the token-budgeted session primer used by /prime")
+    parser.add_argument("--budget", type=int, default=DEFAULT_BUDGET,
+                        help=f"Approximate token budget (default: {DEFAULT_BUDGET})")
+    parser.add_argument("--print", action="store_true", help="Print the primer")
+    parser.add_argument("--force", action="store_true", help="Rebuild even if no source changed")
+
+    args = parser.parse_args()
+    if args.budget < FOOTER_RESERVE * 2:
+        print(f"ERROR: --budget must be at least {FOOTER_RESERVE * 2} tokens")
+        sys.exit(1)
+    if not CONTEXT_PATH.exists():
+        print(f"WARNING: {CONTEXT_PATH} not found - primer will only cover decisions, tasks and workflow")
+
+    text, rebuilt = build_primer(args.budget, force=args.force)
+    if args.print:
+        print(text, end="")
+    else:
+        state = "rebuilt" if rebuilt else "up to date"
+        print(f"Primer {state}: {PRIMER_PATH} (~{estimate_tokens(text)} tokens)")
+
+
+if __name__ == "__main__":
+    main()
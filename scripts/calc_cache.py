@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Calculation Result Cache
+
+Disk memoization for expensive functions in calculation notebooks - Cantera
+equilibrium, TESPy off-design, CoolProp property sweeps (docs/calculation-stack.md).
+A result is stored under a key made of:
+
+    - the function's source code
+    - its arguments (hashed via pickle, so NumPy arrays and pint quantities work)
+    - the values of the module-level constants it reads (globals that are not
+      functions, classes or modules - e.g. GAMMA = 1.4 defined in an earlier cell)
+    - the versions of the libraries it uses (auto-detected from the modules it
+      references, plus any named in versions=...) and the Python version
+
+so editing the function, changing a constant it uses or upgrading CoolProp
+makes new entries; re-opening a notebook reuses old ones. The cache is
+size-bounded: least recently used entries are evicted once it exceeds its limit.
+
+In a notebook (calculations/<system>/):
+    sys.path.append('../../scripts')
+    from calc_cache import memoize
+
+    @memoize
+    def equilibrium(T, P, phi):
+        gas = ct.Solution('gri30.yaml')
+        ...
+
+    @memoize(versions=["CoolProp"])
+    def property_sweep(fluid, T_array):
+        ...
+
+Helpers called by a memoized function are not part of its key - memoize the
+helper too, or pass versions=/salt= to invalidate by hand.
+
+Run:
+    python scripts/calc_cache.py report          # hit rates and compute time saved
+    python scripts/calc_cache.py prune --max-mb 500
+    python scripts/calc_cache.py clear
+Store: .toolkit-cache/calc-results/ (limit: $TOOLKIT_CALC_CACHE_MB, default 2048 MB)
+"""
+
+import argparse
+import atexit
+import functools
+import hashlib
+import inspect
+import json
+import os
+import pickle
+import platform
+import shutil
+import sys
+import textwrap
+import threading
+import time
+import types
+from pathlib import Path
+
+from param_registry import PROJECT_ROOT
+
+CACHE_DIR = PROJECT_ROOT / ".toolkit-cache" / "calc-results"
+DEFAULT_MAX_MB = int(os.environ.get("TOOLKIT_CALC_CACHE_MB", "2048"))
+ENTRY_SUFFIX = ".pkl"
+STATS_NAME = "stats.jsonl"
+STATS_COMPACT_LINES = 5000
+KEY_FORMAT = 2
+
+
+def function_source(func) -> str:
+    """Source text of a function, or its bytecode when the source is unavailable."""
+    try:
+        return textwrap.dedent(inspect.getsource(func))
+    except (OSError, TypeError):
+        code = func.__code__
+        return code.co_code.hex() + repr(code.co_consts) + repr(code.co_names)
+
+
+def referenced_modules(func) -> set:
+    """Top-level packages of modules the function refers to by global name (np, ct, CP...)."""
+    packages = set()
+    for name in func.__code__.co_names:
+        value = func.__globals__.get(name)
+        if isinstance(value, types.ModuleType):
+            packages.add(value.__name__.split(".")[0])
+        elif value is not None and getattr(value, "__module__", None):
+            packages.add(value.__module__.split(".")[0])  # from CoolProp.CoolProp import PropsSI
+    return packages - {"builtins", "__main__", func.__module__.split(".")[0]}
+
+
+def global_values(func) -> bytes:
+    """
+    Serialized values of the data globals a function reads.
+
+    Names come from the function's bytecode and that of nested functions,
+    lambdas and comprehensions. Functions, classes and modules are skipped -
+    their code is not part of the key (see the module docstring).
+    """
+    names, codes = set(), [func.__code__]
+    while codes:
+        code = codes.pop()
+        names.update(code.co_names)
+        codes += [const for const in code.co_consts if isinstance(const, types.CodeType)]
+    parts = []
+    for name in sorted(names):
+        if name not in func.__globals__:
+            continue
+        value = func.__globals__[name]
+        if callable(value) or isinstance(value, types.ModuleType):
+            continue
+        try:
+            value_bytes = pickle.dumps(value, protocol=4)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            value_bytes = repr(value).encode("utf-8")
+        parts.append(name.encode("utf-8") + b"\x00" + hashlib.sha256(value_bytes).digest())
+    return b"".join(parts)
+
+
+def library_versions(packages) -> dict:
+    versions = {"python": platform.python_version()}
+    for package in sorted(packages):
+        module = sys.modules.get(package)
+        if module is None:
+            try:
+                module = __import__(package)
+            except ImportError:
+                versions[package] = "missing"
+                continue
+        versions[package] = str(getattr(module, "__version__", "unknown"))
+    return versions
+
+
+class ResultCache:
+    """Size-bounded, content-addressed store of pickled function results."""
+
+    def __init__(self, directory=CACHE_DIR, max_mb: float = DEFAULT_MAX_MB):
+        self.directory = Path(directory)
+        self.max_bytes = int(max_mb * 1024 * 1024)
+        self.total_bytes = None     # Size on disk, scanned once then tracked per put
+        self.stats = {}     # function -> {"hits", "misses", "compute_s", "saved_s"} (this process)
+        self.lock = threading.Lock()
+        atexit.register(self.flush_stats)
+
+    def entry_path(self, key: str) -> Path:
+        return self.directory / key[:2] / (key + ENTRY_SUFFIX)
+
+    def make_key(self, func, args, kwargs, versions: dict, salt="") -> str:
+        try:
+            arg_bytes = pickle.dumps((args, sorted(kwargs.items())), protocol=4)
+        except (pickle.PicklingError, TypeError, AttributeError) as e:
+            raise TypeError(f"{func.__qualname__}: arguments cannot be cached ({e})") from e
+        digest = hashlib.sha256()
+        for part in (str(KEY_FORMAT), func.__module__, func.__qualname__, function_source(func),
+                     json.dumps(versions, sort_keys=True), str(salt)):
+            digest.update(part.encode("utf-8") + b"\x00")
+        digest.update(global_values(func))
+        digest.update(arg_bytes)
+        return digest.hexdigest()
+
+    def get(self, key: str):
+        """Return (True, value, meta) for a cached key, else (False, None, None)."""
+        path = self.entry_path(key)
+        try:
+            with open(path, "rb") as f:
+                meta, value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError, ValueError):
+            return False, None, None
+        try:
+            os.utime(path)  # Recency for LRU eviction
+        except OSError:
+            pass
+        return True, value, meta
+
+    def put(self, key: str, value, meta: dict):
+        path = self.entry_path(key)
+        try:
+            payload = pickle.dumps((meta, value), protocol=pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, TypeError, AttributeError):
+            return  # Result cannot be stored - still returned to the caller
+        try:
+            previous = path.stat().st_size
+        except OSError:
+            previous = 0
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_name(path.name + f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(payload)
+            os.replace(tmp_path, path)
+        except OSError:
+            return  # Read-only or full disk - caching is best effort
+        with self.lock:
+            if self.total_bytes is None:
+                self.total_bytes = sum(size for _, size, _ in self.entries())
+            else:
+                self.total_bytes += len(payload) - previous
+            over_limit = self.total_bytes > self.max_bytes
+        if over_limit:
+            self.evict()
+
+    def entries(self) -> list:
+        """(mtime, size, path) of every entry, oldest first."""
+        found = []
+        if not self.directory.is_dir():
+            return found
+        with os.scandir(self.directory) as shards:
+            for shard in shards:
+                if not shard.is_dir():
+                    continue
+                with os.scandir(shard.path) as it:
+                    for entry in it:
+                        if entry.name.endswith(ENTRY_SUFFIX):
+                            stat = entry.stat()
+                            found.append((stat.st_mtime, stat.st_size, entry.path))
+        found.sort()
+        return found
+
+    def evict(self, max_bytes=None) -> tuple:
+        """Delete least recently used entries until under the limit. Returns (removed, freed bytes)."""
+        max_bytes = self.max_bytes if max_bytes is None else max_bytes
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = freed = 0
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+            removed += 1
+            freed += size
+        with self.lock:
+            self.total_bytes = total    # Re-synced with the disk (other processes write here too)
+        return removed, freed
+
+    def record(self, name: str, hit: bool, seconds: float):
+        with self.lock:
+            stats = self.stats.setdefault(name, {"hits": 0, "misses": 0, "compute_s": 0.0, "saved_s": 0.0})
+            if hit:
+                stats["hits"] += 1
+                stats["saved_s"] += seconds
+            else:
+                stats["misses"] += 1
+                stats["compute_s"] += seconds
+
+    def flush_stats(self):
+        """Append this process's counters to the shared stats log."""
+        with self.lock:
+            lines = [json.dumps({"function": name, **counts}) for name, counts in self.stats.items()]
+            self.stats = {}
+        if not lines:
+            return
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(self.directory / STATS_NAME, "a", encoding="utf-8") as f:
+                f.write("\n".join(lines) + "\n")
+        except OSError:
+            pass
+
+    def read_stats(self) -> dict:
+        """Totals per function across all runs (compacts the log when it grows large)."""
+        self.flush_stats()
+        path = self.directory / STATS_NAME
+        totals, line_count = {}, 0
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    line_count += 1
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    total = totals.setdefault(record.pop("function"),
+                                              {"hits": 0, "misses": 0, "compute_s": 0.0, "saved_s": 0.0})
+                    for field in total:
+                        total[field] += record.get(field, 0)
+        except OSError:
+            return totals
+        if line_count > STATS_COMPACT_LINES:
+            tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+            tmp_path.write_text("".join(json.dumps({"function": name, **counts}) + "\n"
+                                        for name, counts in totals.items()), encoding="utf-8")
+            os.replace(tmp_path, path)
+        return totals
+
+    def memoize(self, func=None, *, versions=None, salt=""):
+        """
+        Decorator caching a function's results on disk.
+
+        Args:
+            versions: Extra package names whose versions belong in the key
+            salt: Any string - change it to invalidate entries by hand
+        """
+        if func is None:
+            return functools.partial(self.memoize, versions=versions, salt=salt)
+
+        name = f"{func.__module__}.{func.__qualname__}"
+        key_versions = None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            nonlocal key_versions
+            if key_versions is None:
+                key_versions = library_versions(referenced_modules(func) | set(versions or ()))
+            key = self.make_key(func, args, kwargs, key_versions, salt)
+            found, value, meta = self.get(key)
+            if found:
+                self.record(name, True, meta.get("seconds", 0.0))
+                return value
+            start = time.perf_counter()
+            value = func(*args, **kwargs)
+            elapsed = time.perf_counter() - start
+            self.record(name, False, elapsed)
+            self.put(key, value, {"function": name, "seconds": elapsed, "created": time.time(),
+                                  "versions": key_versions})
+            return value
+
+        wrapper.cache = self
+        return wrapper
+
+
+_default_cache = None
+
+
+def default_cache() -> ResultCache:
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ResultCache()
+    return _default_cache
+
+
+def memoize(func=None, *, versions=None, salt=""):
+    """Memoize with the project's cache (.toolkit-cache/calc-results). See ResultCache.memoize."""
+    return default_cache().memoize(func, versions=versions, salt=salt)
+
+
+def print_report(cache: ResultCache):
+    entries = cache.entries()
+    size = sum(s for _, s, _ in entries)
+    totals = cache.read_stats()
+
+    print(f"Cache: {cache.directory}")
+    print(f"  {len(entries)} entries, {size / 2**20:.1f} MB of {cache.max_bytes / 2**20:.0f} MB limit")
+    if not totals:
+        print("  No calls recorded yet")
+        return
+    print()
+    print(f" {'Function':<44}{'Calls':>8}{'Hit rate':>10}{'Computed':>11}{'Saved':>11}")
+    print("-" * 85)
+    all_calls = all_hits = 0
+    all_compute = all_saved = 0.0
+    for name, t in sorted(totals.items(), key=lambda item: -item[1]["saved_s"]):
+        calls = t["hits"] + t["misses"]
+        all_calls += calls
+        all_hits += t["hits"]
+        all_compute += t["compute_s"]
+        all_saved += t["saved_s"]
+        rate = t["hits"] / calls if calls else 0
+        print(f" {name[-43:]:<44}{calls:>8}{rate:>9.0%}{t['compute_s']:>10.1f}s{t['saved_s']:>10.1f}s")
+    print("-" * 85)
+    rate = all_hits / all_calls if all_calls else 0
+    print(f" {'Total':<44}{all_calls:>8}{rate:>9.0%}{all_compute:>10.1f}s{all_saved:>10.1f}s")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Inspect and manage the calculation result cache")
+    sub = parser.add_subparsers(dest="command", required=True)
+    sub.add_parser("report", help="Entries, hit rates and compute time saved")
+    prune_parser = sub.add_parser("prune", help="Evict least recently used entries")
+    prune_parser.add_argument("--max-mb", type=float, default=DEFAULT_MAX_MB, help="Size to prune down to")
+    sub.add_parser("clear", help="Delete every cached result and the statistics")
+
+    args = parser.parse_args()
+    cache = default_cache()
+
+    if args.command == "report":
+        print_report(cache)
+    elif args.command == "prune":
+        removed, freed = cache.evict(int(args.max_mb * 1024 * 1024))
+        print(f"Removed {removed} entries ({freed / 2**20:.1f} MB)")
+    elif args.command == "clear":
+        if cache.directory.is_dir():
+            shutil.rmtree(cache.directory)
+        print(f"Cleared {cache.directory}")
+
+
+if __name__ == "__main__":
+    main()
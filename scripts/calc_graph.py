@@ -0,0 +1,370 @@
+#!/usr/bin/env python3
+"""
+Calculation Dependency Graph
+
+Tracks which calculations (notebooks and scripts in calculations/) read which
+parameters of project_params.py, and which parameters are derived from others
+or produced by a calculation (`source: calculations/...` annotation). When a
+value changes, only the calculations downstream of it are reported stale.
+
+Nodes:   parameters, calculations
+Edges:   parameter -> derived parameter   (NAME = OTHER * 2)
+         parameter -> calculation          (calculation code uses NAME)
+         calculation -> parameter          (NAME = ...  # mm | source: calculations/x.ipynb)
+
+A calculation is stale when its code changed, a parameter it reads has a
+different value than when it was last marked current, or a calculation it
+depends on (through a produced parameter) is stale. Parameter values are
+compared, not file timestamps, so editing an unrelated parameter - or
+re-saving project_params.py unchanged - makes nothing stale.
+
+Run:
+    python scripts/calc_graph.py stale                 # what needs re-running, and why
+    python scripts/calc_graph.py impact SHAFT_DIAMETER_MM
+    python scripts/calc_graph.py impact SHAFT_DIAMETER_MM --run   # and re-run the stale ones
+    python scripts/calc_graph.py mark [calc ...]       # record calculations as current
+Store: .toolkit-cache/calc-graph.json (scan results cached by mtime/size)
+"""
+
+import argparse
+import ast
+import hashlib
+import json
+import os
+import re
+import sys
+from pathlib import Path
+
+from param_registry import PROJECT_ROOT, load_registry
+
+CALCULATIONS_DIR = PROJECT_ROOT / "calculations"
+STATE_PATH = PROJECT_ROOT / ".toolkit-cache" / "calc-graph.json"
+STATE_FORMAT = 1
+
+CALC_SUFFIXES = (".ipynb", ".py")
+SKIP_DIRS = {".ipynb_checkpoints", "__pycache__"}
+PARAMS_IMPORT_PATTERN = re.compile(r'^\s*(?:from\s+project_params\s+import|import\s+project_params)', re.MULTILINE)
+NAME_PATTERN = re.compile(r'\b[A-Z][A-Z0-9_]*\b')
+STRING_PATTERN = re.compile(r'"[^"\n]*"|\'[^\'\n]*\'')
+
+# Descriptive entries every notebook may print - not calculation inputs
+METADATA_PARAMS = {"PROJECT_NAME", "PROJECT_DESCRIPTION"}
+SOURCE_TOKEN_SPLIT = re.compile(r'[\s,;]+')
+
+
+def value_key(value) -> str:
+    """Comparable fingerprint of a parameter value."""
+    return repr(value)
+
+
+def code_names(code: str) -> set:
+    """UPPER_CASE names read by a block of code (a notebook cell or script)."""
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        # IPython magics etc. - fall back to a token scan without strings/comments
+        names = set()
+        for line in code.splitlines():
+            names.update(NAME_PATTERN.findall(STRING_PATTERN.sub("", line.split("#", 1)[0])))
+        return names
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Load):
+            names.add(node.id)
+        elif isinstance(node, ast.Attribute):  # import project_params as P; P.NAME
+            names.add(node.attr)
+    return names
+
+
+def scan_calculation(path: Path) -> dict:
+    """Parse one calculation into {'code_hash', 'names'} (names read, if it imports project_params)."""
+    text = path.read_text(encoding="utf-8")
+    if path.suffix == ".ipynb":
+        try:
+            cells = json.loads(text).get("cells", [])
+        except (json.JSONDecodeError, AttributeError):
+            cells = []
+        chunks = ["".join(c.get("source", "")) for c in cells if c.get("cell_type") == "code"]
+    else:
+        chunks = [text]
+
+    # Hash code only, so re-running a notebook (new outputs) does not change it
+    code_hash = hashlib.sha256("\n\x00".join(chunks).encode("utf-8")).hexdigest()
+    names = set()
+    if PARAMS_IMPORT_PATTERN.search("\n".join(chunks)):
+        for chunk in chunks:
+            names |= code_names(chunk)
+    return {"code_hash": code_hash, "names": sorted(names)}
+
+
+def load_state(path=STATE_PATH) -> dict:
+    try:
+        state = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        state = None
+    if not state or state.get("format") != STATE_FORMAT:
+        return {"format": STATE_FORMAT, "scans": {}, "marks": {}}
+    return state
+
+
+def save_state(state: dict, path=STATE_PATH):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(state, separators=(",", ":")), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def scan_calculations(state: dict, calc_dir=CALCULATIONS_DIR, root=PROJECT_ROOT) -> tuple:
+    """
+    Bring the cached calculation scans up to date.
+
+    Only files whose mtime or size changed are re-read.
+
+    Returns:
+        tuple: ({relative path: scan}, changed)
+    """
+    scans = state["scans"]
+    seen = set()
+    changed = False
+    for dirpath, dirs, files in os.walk(calc_dir):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS and not d.startswith("."))
+        for filename in sorted(files):
+            if not filename.endswith(CALC_SUFFIXES):
+                continue
+            path = Path(dirpath) / filename
+            rel_path = path.relative_to(root).as_posix()
+            seen.add(rel_path)
+            stat = path.stat()
+            cached = scans.get(rel_path)
+            if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                continue
+            try:
+                scan = scan_calculation(path)
+            except (OSError, UnicodeDecodeError):
+                continue
+            scan.update(mtime_ns=stat.st_mtime_ns, size=stat.st_size)
+            scans[rel_path] = scan
+            changed = True
+
+    for rel_path in set(scans) - seen:
+        del scans[rel_path]
+        changed = True
+    return {p: scans[p] for p in sorted(seen) if p in scans}, changed
+
+
+def source_paths(source: str) -> set:
+    """Paths named in a source annotation: 'calculations/a.ipynb cell 3, DEC-002' -> {'calculations/a.ipynb'}."""
+    paths = set()
+    for token in SOURCE_TOKEN_SPLIT.split(source):
+        token = token.lstrip("(['\"").rstrip(".)]'\":")
+        if "/" in token:
+            paths.add(Path(token).as_posix())
+    return paths
+
+
+class CalcGraph:
+    """Dependency graph between parameters and calculations."""
+
+    def __init__(self, registry, scans: dict):
+        self.registry = registry
+        self.calcs = scans
+        self.values = {p.name: value_key(p.value) for p in registry}
+        self.downstream = {}    # node -> set of nodes that depend on it
+        self.inputs = {}        # calculation -> parameters it reads
+        self.producers = {}     # parameter -> calculation named as its source
+
+        for p in registry:
+            for dep in p.depends:
+                self.add_edge(dep, p.name)
+            # Whole paths only: calculations/shaft.py must not match calculations/shaft.py.bak
+            for calc in sorted(source_paths(p.source) & set(scans))[:1]:
+                self.producers[p.name] = calc
+                self.add_edge(calc, p.name)
+        for calc, scan in scans.items():
+            self.inputs[calc] = sorted(n for n in scan["names"] if n in registry and n not in METADATA_PARAMS)
+            for name in self.inputs[calc]:
+                self.add_edge(name, calc)
+
+    def add_edge(self, source, target):
+        self.downstream.setdefault(source, set()).add(target)
+
+    def impact(self, names) -> list:
+        """Every node downstream of the given parameters/calculations, breadth first."""
+        seen, order = set(names), []
+        queue = list(names)
+        while queue:
+            node = queue.pop(0)
+            for target in sorted(self.downstream.get(node, ())):
+                if target not in seen:
+                    seen.add(target)
+                    order.append(target)
+                    queue.append(target)
+        return order
+
+    def is_calc(self, node) -> bool:
+        return node in self.calcs
+
+    def stale(self, marks: dict) -> dict:
+        """
+        Calculations that need re-running.
+
+        Returns:
+            dict: {calculation: [reasons]} in dependency order (upstream first)
+        """
+        direct = {}
+        for calc in self.calcs:
+            mark = marks.get(calc)
+            if mark is None:
+                direct[calc] = ["never marked current"]
+                continue
+            reasons = []
+            if mark["code_hash"] != self.calcs[calc]["code_hash"]:
+                reasons.append("code changed")
+            for name in self.inputs[calc]:
+                recorded = mark["inputs"].get(name)
+                if recorded is None:
+                    reasons.append(f"now reads {name}")
+                elif recorded != self.values[name]:
+                    reasons.append(f"{name}: {recorded} -> {self.values[name]}")
+            if reasons:
+                direct[calc] = reasons
+
+        result = {calc: list(reasons) for calc, reasons in direct.items()}
+        for calc in self.topological_calcs():
+            if calc not in result:
+                continue
+            for node in self.impact([calc]):
+                if self.is_calc(node) and node != calc:
+                    reason = f"upstream {calc} is stale"
+                    if reason not in result.setdefault(node, []):
+                        result[node].append(reason)
+        order = self.topological_calcs()
+        return {calc: result[calc] for calc in order if calc in result}
+
+    def topological_calcs(self) -> list:
+        """Calculations ordered so producers come before their consumers."""
+        indegree = {calc: 0 for calc in self.calcs}
+        calc_edges = {calc: set() for calc in self.calcs}
+        for calc in self.calcs:
+            for node in self.impact([calc]):
+                if self.is_calc(node) and node != calc and node not in calc_edges[calc]:
+                    calc_edges[calc].add(node)
+                    indegree[node] += 1
+        ready = sorted(c for c, d in indegree.items() if d == 0)
+        order = []
+        while ready:
+            calc = ready.pop(0)
+            order.append(calc)
+            for target in sorted(calc_edges[calc]):
+                indegree[target] -= 1
+                if indegree[target] == 0:
+                    ready.append(target)
+        # Cycles (a calculation feeding itself via parameters) go last, in name order
+        return order + sorted(set(self.calcs) - set(order))
+
+    def mark(self, marks: dict, calcs):
+        """Record calculations as current against today's code and parameter values."""
+        for calc in calcs:
+            marks[calc] = {
+                "code_hash": self.calcs[calc]["code_hash"],
+                "inputs": {name: self.values[name] for name in self.inputs[calc]},
+            }
+
+
+def load_graph(use_cache: bool = True) -> tuple:
+    """
+    Build the graph for the current project.
+
+    Returns:
+        tuple: (CalcGraph, state) - pass state to save_state() after mark()
+    """
+    state = load_state() if use_cache else {"format": STATE_FORMAT, "scans": {}, "marks": {}}
+    scans, changed = scan_calculations(state)
+    if changed:
+        try:
+            save_state(state)
+        except OSError:
+            pass  # Read-only project - caching is best effort
+    return CalcGraph(load_registry(), scans), state
+
+
+def resolve_calcs(graph: CalcGraph, names) -> list:
+    """Map command-line paths (absolute, relative to cwd or project) to calculation keys."""
+    calcs = []
+    for name in names:
+        candidates = [name, Path(name).as_posix()]
+        try:
+            candidates.append(Path(name).resolve().relative_to(PROJECT_ROOT).as_posix())
+        except ValueError:
+            pass
+        match = next((c for c in candidates if c in graph.calcs), None)
+        if match is None:
+            print(f"ERROR: Not a calculation in calculations/: {name}")
+            sys.exit(1)
+        calcs.append(match)
+    return calcs
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Track which calculations are stale after parameter changes")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    sub.add_parser("stale", help="List calculations that need re-running, with reasons")
+
+    impact_parser = sub.add_parser("impact", help="Show everything downstream of parameters")
+    impact_parser.add_argument("names", nargs="+", help="Parameter names")
+    impact_parser.add_argument("--run", action="store_true",
+                               help="Re-run the affected calculations that are stale (via run_calcs.py)")
+    impact_parser.add_argument("--workers", type=int, default=os.cpu_count() or 4,
+                               help="Parallel processes with --run")
+
+    mark_parser = sub.add_parser("mark", help="Record calculations as current (default: all stale)")
+    mark_parser.add_argument("calcs", nargs="*", help="Calculation paths")
+
+    args = parser.parse_args()
+
+    graph, state = load_graph()
+    marks = state["marks"]
+
+    if args.command == "stale":
+        stale = graph.stale(marks)
+        for calc, reasons in stale.items():
+            print(calc)
+            for reason in reasons:
+                print(f"    {reason}")
+        print(f"\n{len(stale)} of {len(graph.calcs)} calculations stale")
+        if stale:
+            print("After re-running, record them with: python scripts/calc_graph.py mark")
+
+    elif args.command == "impact":
+        unknown = [n for n in args.names if n not in graph.registry]
+        if unknown:
+            print(f"ERROR: Not defined in project_params.py: {', '.join(unknown)}")
+            sys.exit(1)
+        affected = []
+        for node in graph.impact(args.names):
+            if graph.is_calc(node):
+                affected.append(node)
+                print(f"  calculation  {node}")
+            else:
+                print(f"  parameter    {node}")
+        if args.run and affected:
+            from run_calcs import run_calcs
+            print()
+            failures = run_calcs([str(PROJECT_ROOT / calc) for calc in affected], workers=args.workers)
+            sys.exit(1 if failures else 0)
+        elif affected:
+            print(f"\nRe-run the stale ones with: python scripts/calc_graph.py impact {' '.join(args.names)} --run")
+
+    elif args.command == "mark":
+        calcs = resolve_calcs(graph, args.calcs) if args.calcs else list(graph.stale(marks))
+        graph.mark(marks, calcs)
+        for calc in set(marks) - set(graph.calcs):
+            del marks[calc]
+        save_state(state)
+        print(f"Marked {len(calcs)} calculation(s) current")
+
+
+if __name__ == "__main__":
+    main()
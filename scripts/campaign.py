@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Campaign Statistics
+
+Per-run aggregates across a test campaign - every ingested run (testdata.py)
+matching a catalog query - computed in a process pool and returned as one
+tidy table: a row per (run, channel, statistic) with the run's date, test
+name and metadata alongside, ready for the comparison studies in
+testing/analysis/.
+
+Per-run results are cached (calc_cache) under the raw file's SHA-256 and the
+query settings, so re-running a campaign summary after adding a few runs
+only computes the new ones.
+
+In a notebook (testing/analysis/):
+    sys.path.append('../../scripts')
+    from campaign import campaign_stats, wide
+
+    rows = campaign_stats(test="hot-fire", since="2025-03-01", channels=["EGT", "RPM"],
+                          stats=["mean", "max", "p95"], when="RPM > 70000", metadata={"rig": "B"})
+    table = wide(rows)          # {"run": [...], "EGT_mean": [...], "RPM_mean": [...], ...}
+    plt.scatter(table["RPM_mean"], table["EGT_max"])
+
+Run:
+    python scripts/campaign.py --test hot-fire --channels EGT RPM --stats mean max p95
+    python scripts/campaign.py --since 2025-03-01 --meta rig=B --when "RPM > 70000" --out testing/results/campaign.csv
+"""
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy is required (pip install -r requirements-engineering.txt)")
+    sys.exit(1)
+
+from testdata import STORE_DIR, Catalog
+
+STATS = ("count", "mean", "std", "min", "max", "p05", "p50", "p95", "first", "last")
+DEFAULT_STATS = ("count", "mean", "std", "min", "max")
+CONDITION_PATTERN = re.compile(r'^\s*(.+?)\s*(>=|<=|==|!=|>|<)\s*(-?[\d.]+(?:e-?\d+)?)\s*$', re.IGNORECASE)
+OPERATORS = {">": np.greater, ">=": np.greater_equal, "<": np.less, "<=": np.less_equal,
+             "==": np.equal, "!=": np.not_equal}
+RESULT_FORMAT = 1
+
+
+def parse_condition(condition: str) -> tuple:
+    """'RPM > 70000' -> ('RPM', '>', 70000.0)"""
+    match = CONDITION_PATTERN.match(condition)
+    if not match:
+        raise ValueError(f"Condition must look like 'CHANNEL > VALUE', got '{condition}'")
+    return match.group(1), match.group(2), float(match.group(3))
+
+
+def select_runs(catalog: Catalog, test=None, since=None, until=None, channels=None, metadata=None) -> list:
+    """Run ids matching the catalog filters, having every channel, and with metadata[key] == value."""
+    runs = catalog.find(test=test, since=since, until=until)
+    selected = []
+    for run_id in runs:
+        entry = catalog.runs[run_id]
+        if channels and not all(name in entry["channels"] for name in channels):
+            continue
+        if metadata and any(str(entry["metadata"].get(key)) != str(value) for key, value in metadata.items()):
+            continue
+        selected.append(run_id)
+    return selected
+
+
+def aggregate(values: np.ndarray, stats) -> dict:
+    """Statistics of the finite samples of one channel (NaN where there are none)."""
+    x = values[np.isfinite(values)]
+    result = {}
+    for stat in stats:
+        if stat == "count":
+            result[stat] = float(len(x))
+        elif not len(x):
+            result[stat] = float("nan")
+        elif stat == "mean":
+            result[stat] = float(x.mean())
+        elif stat == "std":
+            result[stat] = float(x.std(ddof=1)) if len(x) > 1 else float("nan")
+        elif stat == "min":
+            result[stat] = float(x.min())
+        elif stat == "max":
+            result[stat] = float(x.max())
+        elif stat == "first":
+            result[stat] = float(x[0])
+        elif stat == "last":
+            result[stat] = float(x[-1])
+        else:  # pNN
+            result[stat] = float(np.percentile(x, int(stat[1:])))
+    return result
+
+
+def run_stats(run_id: str, channels, stats, t=None, when=None, store_dir=STORE_DIR) -> dict:
+    """
+    Aggregates of one run. Runs in a pool worker.
+
+    Returns:
+        dict: {channel: {stat: value}} for the requested channels the run has
+    """
+    catalog = Catalog(store_dir)
+    entry = catalog.entry(run_id)
+    names = [name for name in (channels or entry["channels"]) if name in entry["channels"]
+             and name != entry.get("time_channel")]
+    rows = catalog.time_slice(run_id, t)
+    mask = None
+    if when:
+        channel, op, value = parse_condition(when)
+        if channel not in entry["channels"]:
+            return {}
+        with np.errstate(invalid="ignore"):
+            mask = OPERATORS[op](catalog.channel(run_id, channel)[rows], value)
+    results = {}
+    for name in names:
+        values = np.asarray(catalog.channel(run_id, name)[rows], dtype=float)
+        results[name] = aggregate(values[mask] if mask is not None else values, stats)
+    return results
+
+
+def cache_key(entry: dict, channels, stats, t, when) -> str:
+    settings = {"format": RESULT_FORMAT, "source": entry["source_sha256"], "channels": sorted(channels or []),
+                "stats": list(stats), "t": list(t) if t else None, "when": when}
+    return hashlib.sha256(("campaign\x00" + json.dumps(settings, sort_keys=True)).encode("utf-8")).hexdigest()
+
+
+def cached_run_stats(run_id: str, key: str, channels, stats, t, when, store_dir, use_cache: bool) -> dict:
+    """run_stats, stored in the calculation result cache under the raw file's hash."""
+    start = time.perf_counter()
+    results = run_stats(run_id, channels, stats, t=t, when=when, store_dir=store_dir)
+    if use_cache:
+        from calc_cache import default_cache
+        cache = default_cache()
+        elapsed = time.perf_counter() - start
+        cache.record("campaign:run_stats", False, elapsed)
+        cache.put(key, results, {"function": "campaign:run_stats", "seconds": elapsed, "run": run_id})
+        cache.flush_stats()  # Pool workers exit without running atexit handlers
+    return results
+
+
+def campaign_stats(test=None, since=None, until=None, channels=None, stats=DEFAULT_STATS, t=None, when=None,
+                   metadata=None, workers: int = None, use_cache: bool = True, catalog=None,
+                   verbose: bool = False) -> list:
+    """
+    Aggregate every matching run.
+
+    Args:
+        channels: Channels to aggregate (runs lacking any are skipped); None = all channels of each run
+        stats: From STATS - count, mean, std, min, max, p05/p50/p95 (any pNN), first, last
+        t: (t_start, t_end) window applied to every run
+        when: Only samples where a condition holds, e.g. "RPM > 70000"
+        metadata: {key: value} the run's metadata must match
+
+    Returns:
+        list: Tidy rows {"run", "date", "test", <metadata...>, "channel", "unit", "stat", "value"}
+    """
+    stats = list(stats)
+    unknown = [s for s in stats if s not in STATS and not re.fullmatch(r'p\d{1,2}', s)]
+    if unknown:
+        raise ValueError(f"Unknown statistics: {', '.join(unknown)} (have {', '.join(STATS)}, pNN)")
+    if when:
+        parse_condition(when)
+    catalog = catalog or Catalog()
+    run_ids = select_runs(catalog, test=test, since=since, until=until, channels=channels, metadata=metadata)
+
+    results, pending = {}, {}
+    cache = None
+    if use_cache:
+        from calc_cache import default_cache
+        cache = default_cache()
+    for run_id in run_ids:
+        key = cache_key(catalog.runs[run_id], channels, stats, t, when)
+        if cache is not None:
+            found, value, meta = cache.get(key)
+            if found:
+                cache.record("campaign:run_stats", True, meta.get("seconds", 0.0))
+                results[run_id] = value
+                continue
+        pending[run_id] = key
+
+    start = time.perf_counter()
+    args = [(run_id, key, channels, stats, t, when, catalog.store_dir, use_cache) for run_id, key in pending.items()]
+    if len(args) > 1 and workers != 1:
+        with ProcessPoolExecutor(max_workers=min(workers or os.cpu_count() or 1, len(args))) as executor:
+            futures = {run_id: executor.submit(cached_run_stats, *a) for run_id, a in zip(pending, args)}
+            for run_id, future in futures.items():
+                results[run_id] = future.result()
+    else:
+        for run_id, a in zip(pending, args):
+            results[run_id] = cached_run_stats(*a)
+    if cache is not None:
+        cache.flush_stats()
+    if verbose:
+        print(f"{len(run_ids)} runs: {len(run_ids) - len(pending)} cached, {len(pending)} computed "
+              f"({time.perf_counter() - start:.2f} s)")
+
+    rows = []
+    for run_id in run_ids:
+        entry = catalog.runs[run_id]
+        for channel, values in results[run_id].items():
+            for stat in stats:
+                rows.append({"run": run_id, "date": entry["date"], "test": entry["test"], **entry["metadata"],
+                             "channel": channel, "unit": entry["channels"][channel]["unit"],
+                             "stat": stat, "value": values[stat]})
+    return rows
+
+
+def wide(rows: list) -> dict:
+    """Tidy rows -> one row per run: {"run": [...], "date": [...], "<channel>_<stat>": [...]}."""
+    runs = list(dict.fromkeys(row["run"] for row in rows))
+    index = {run_id: i for i, run_id in enumerate(runs)}
+    dates = {row["run"]: row["date"] for row in rows}
+    table = {"run": runs, "date": [dates[run_id] for run_id in runs]}
+    for row in rows:
+        column = table.setdefault(f"{row['channel']}_{row['stat']}", np.full(len(runs), np.nan))
+        column[index[row["run"]]] = row["value"]
+    return table
+
+
+def write_csv(rows: list, path: Path):
+    columns = list(dict.fromkeys(key for row in rows for key in row))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        writer.writerows(rows)
+
+
+def print_table(rows: list):
+    table = wide(rows)
+    columns = [c for c in table if c not in ("run", "date")]
+    run_width = max([len("Run")] + [len(r) for r in table["run"]]) + 2
+    print(f"{'Run':<{run_width}}" + "".join(f"{c[-13:]:>14}" for c in columns))
+    print("-" * (run_width + 14 * len(columns)))
+    for i, run_id in enumerate(table["run"]):
+        print(f"{run_id:<{run_width}}" + "".join(f"{table[c][i]:>14.5g}" for c in columns))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-run statistics across a test campaign")
+    parser.add_argument("--test", help="Test name contains this text")
+    parser.add_argument("--since", help="On or after YYYY-MM-DD")
+    parser.add_argument("--until", help="On or before YYYY-MM-DD")
+    parser.add_argument("--meta", nargs="+", default=[], metavar="KEY=VALUE", help="Run metadata must match")
+    parser.add_argument("--channels", nargs="+", help="Channels to aggregate (default: all)")
+    parser.add_argument("--stats", nargs="+", default=list(DEFAULT_STATS),
+                        help=f"Statistics: {', '.join(STATS)} or any pNN (default: {' '.join(DEFAULT_STATS)})")
+    parser.add_argument("--t", nargs=2, type=float, metavar=("START", "END"), help="Time window [s] in every run")
+    parser.add_argument("--when", help="Only samples where a condition holds, e.g. \"RPM > 70000\"")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute every run")
+    parser.add_argument("--out", help="Write the tidy table to this CSV")
+
+    args = parser.parse_args()
+    metadata = {}
+    for item in args.meta:
+        key, sep, value = item.partition("=")
+        if not sep:
+            print(f"ERROR: --meta expects KEY=VALUE, got '{item}'")
+            sys.exit(1)
+        metadata[key] = value
+
+    try:
+        rows = campaign_stats(test=args.test, since=args.since, until=args.until, channels=args.channels,
+                              stats=args.stats, t=args.t, when=args.when, metadata=metadata,
+                              workers=args.workers, use_cache=not args.no_cache, verbose=True)
+    except ValueError as e:
+        print(f"ERROR: {e}")
+        sys.exit(1)
+    if not rows:
+        print("No matching runs - check the filters or run: python scripts/testdata.py ingest")
+        sys.exit(1)
+
+    print()
+    print_table(rows)
+    if args.out:
+        write_csv(rows, Path(args.out))
+        print(f"\nWrote {len(rows)} rows to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,638 @@
+#!/usr/bin/env python3
+"""
+Research Citation Index
+
+Ties together the three places a research source shows up: the ledger in
+docs/research/_sources.md, the files in docs/reference (PDFs that *are* a
+source, research notes that *cite* one) and the RAG chunks built from those
+files. Sources are normalized and deduplicated by identity key - DOI, URL
+(scheme, www., tracking parameters and trailing slashes ignored), file
+content hash - so the same paper cited as a doi.org link, a publisher URL
+and a downloaded PDF is one source.
+
+Only files whose mtime or size changed since the last run are re-read, and
+the RAG chunk map is refreshed only when the vector store changes, so
+lookups in either direction answer instantly:
+
+Run:
+    python scripts/citations.py source 10.2514/1.B34567         # ledger rows, files, chunks of a source
+    python scripts/citations.py source https://www.nasa.gov/report?utm_source=x
+    python scripts/citations.py source "combustor design"      # title words
+    python scripts/citations.py file docs/reference/liner-cooling.pdf
+    python scripts/citations.py chunk 3f2a9c1e-...             # which source a RAG hit came from
+    python scripts/citations.py check                          # duplicates, missing files, untracked citations
+    python scripts/citations.py dedupe [--dry-run]             # drop duplicate ledger rows
+Store: .toolkit-cache/citations.json (safe to delete, rebuilt on demand)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import parse_qsl, unquote, urlencode, urlsplit
+
+from param_registry import PROJECT_ROOT
+
+SOURCES_PATH = PROJECT_ROOT / "docs" / "research" / "_sources.md"
+SCAN_DIRS = ("docs/reference", "docs/research")
+INDEX_PATH = PROJECT_ROOT / ".toolkit-cache" / "citations.json"
+INDEX_FORMAT = 3
+
+# Vector store written by setup_rag.py
+CHROMA_PATH = PROJECT_ROOT / "chroma_db"
+CHROMA_COLLECTION = "gas_turbine_knowledge"
+CHUNK_BATCH = 5000
+
+HASH_BLOCK = 1 << 20
+DOI_SNIFF_BYTES = 256 * 1024     # XMP metadata sits near the start or end of a PDF
+TRACKING_PARAMS = re.compile(r'^(utm_\w+|fbclid|gclid|mc_cid|mc_eid|ref|source)$', re.IGNORECASE)
+KEY_PRIORITY = ("doi", "url", "sha256", "file", "title")
+
+DOI_PATTERN = re.compile(r'\b(10\.\d{4,9}/[^\s"<>|\]]+)', re.IGNORECASE)
+DOI_BYTES = re.compile(rb'\b(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)')
+XMP_DOI = re.compile(rb'(?:prism:doi|pdfx:doi|dc:identifier)\s*(?:=\s*["\']|>)\s*'
+                     rb'(?:<rdf:(?:Bag|Seq|Alt)>\s*<rdf:li[^>]*>\s*)?'
+                     rb'(?:doi:\s*|https?://(?:dx\.)?doi\.org/)?(10\.\d{4,9}/[-._;()/:A-Za-z0-9]+)', re.IGNORECASE)
+URL_PATTERN = re.compile(r'https?://[^\s<>|\]"]+', re.IGNORECASE)
+MD_LINK = re.compile(r'\[([^\]]*)\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+HEADING_PATTERN = re.compile(r'^#{1,6}\s+(.+?)\s*$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+SEPARATOR_PATTERN = re.compile(r'^\s*\|?\s*:?-{3,}')
+FILE_NAME = re.compile(r'^[\w.\- ]+\.(pdf|md|txt|docx?|xlsx?|csv|step|stp|dwg|dxf)$', re.IGNORECASE)
+
+
+def normalize_doi(doi: str) -> str:
+    doi = unquote(doi).rstrip(".,;:'")
+    while doi.endswith(")") and doi.count(")") > doi.count("("):
+        doi = doi[:-1]
+    return "doi:" + doi.lower()
+
+
+def normalize_url(url: str) -> list:
+    """Identity keys of a URL: ['url:host/path?query'] plus the DOI it contains, if any."""
+    url = url.strip().rstrip(".,;:'")
+    while url.endswith(")") and url.count(")") > url.count("("):
+        url = url[:-1]
+    keys = [normalize_doi(m.group(1)) for m in DOI_PATTERN.finditer(unquote(url))][:1]
+    try:
+        parts = urlsplit(url)
+        port = parts.port
+    except ValueError:
+        return keys
+    host = (parts.hostname or "").lower()
+    if host.startswith("www."):
+        host = host[4:]
+    if port and port not in (80, 443):
+        host += f":{port}"
+    if host in ("doi.org", "dx.doi.org") and keys:
+        return keys
+    path = parts.path.rstrip("/")
+    query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+                   if not TRACKING_PARAMS.match(k))
+    return [f"url:{host}{path}" + (f"?{urlencode(query)}" if query else "")] + keys
+
+
+def normalize_title(title: str) -> str:
+    return "title:" + " ".join(re.findall(r'[a-z0-9]+', title.lower()))
+
+
+def split_row(line: str) -> list:
+    return [cell.strip() for cell in line.strip().strip("|").split("|")]
+
+
+def hash_file(path: Path) -> tuple:
+    """
+    (sha256 hex, the file's own DOI key or None).
+
+    The DOI is the one declared in XMP metadata (prism:doi, dc:identifier),
+    else the first DOI in the first DOI_SNIFF_BYTES. Other DOIs - a paper's
+    reference list near the end - are citations, not the file's identity,
+    and would merge unrelated sources.
+    """
+    digest = hashlib.sha256()
+    head = tail = b""
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK), b""):
+            digest.update(block)
+            if len(head) < DOI_SNIFF_BYTES:
+                head += block[:DOI_SNIFF_BYTES - len(head)]
+            tail = (tail + block)[-DOI_SNIFF_BYTES:]
+    match = XMP_DOI.search(head) or XMP_DOI.search(tail) or DOI_BYTES.search(head)
+    return digest.hexdigest(), normalize_doi(match.group(1).decode("ascii", "replace")) if match else None
+
+
+def cell_keys(text: str, files_by_name: dict, source: str) -> list:
+    """Identity keys in one piece of text: URLs, DOIs and links/names of local reference files."""
+    keys = []
+    for match in URL_PATTERN.finditer(text):
+        keys.extend(normalize_url(match.group(0)))
+    stripped = URL_PATTERN.sub(" ", text)
+    keys.extend(normalize_doi(m.group(1)) for m in DOI_PATTERN.finditer(stripped))
+    for _, target in MD_LINK.findall(text):
+        local = local_file(source, target, files_by_name)
+        if local:
+            keys.append("file:" + local)
+    name = text.strip().strip("`")
+    if name in files_by_name:
+        keys.append("file:" + files_by_name[name])
+    elif FILE_NAME.match(name):
+        keys.append(f"file:{SCAN_DIRS[0]}/{name}")      # named but not (or no longer) there
+    return list(dict.fromkeys(keys))
+
+
+def local_file(source: str, target: str, files_by_name: dict):
+    """A relative link target -> project-relative path of an indexed file, or None."""
+    if URL_PATTERN.match(target) or ":" in target.split("/", 1)[0]:
+        return None
+    target = unquote(target.split("#", 1)[0])
+    parts = []
+    for part in (Path(source).parent / target).parts:
+        if part == "..":
+            if parts:
+                parts.pop()
+        elif part != ".":
+            parts.append(part)
+    path = "/".join(parts)
+    return path if path in files_by_name.values() else None
+
+
+def parse_ledger(text: str, source: str, files_by_name: dict) -> list:
+    """One mention per filled-in table row of _sources.md: {"keys", "title", "line", "section"}."""
+    mentions = []
+    section = ""
+    header = None
+    for number, line in enumerate(text.split("\n"), 1):
+        heading = HEADING_PATTERN.match(line)
+        if heading:
+            section, header = heading.group(1), None
+            continue
+        if not line.lstrip().startswith("|"):
+            header = None
+            continue
+        if SEPARATOR_PATTERN.match(line):
+            continue
+        cells = split_row(line)
+        if header is None:
+            header = cells
+            continue
+        if not any(cells):
+            continue
+        keys = []
+        for cell in cells:
+            keys.extend(cell_keys(cell, files_by_name, source))
+        texts = [MD_LINK.sub(r'\1', c) for c in cells if c and not URL_PATTERN.fullmatch(c)]
+        title = texts[0] if texts else ""
+        if not keys and title:
+            # Whole row, not just the first cell: "| Siemens | SGT-400 manual |" and
+            # "| Siemens | SGT-800 guide |" are different sources
+            keys = [normalize_title(" ".join(texts))]
+        if keys:
+            mentions.append({"keys": list(dict.fromkeys(keys)), "title": title, "line": number,
+                             "section": section})
+    return mentions
+
+
+def parse_citations(text: str, source: str, files_by_name: dict) -> list:
+    """One mention per link, bare URL or DOI in a markdown note: {"keys", "title", "line"}."""
+    mentions = []
+    in_fence = False
+    for number, line in enumerate(text.split("\n"), 1):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        if in_fence:
+            continue
+        for title, target in MD_LINK.findall(line):
+            keys = cell_keys(f"[{title}]({target})", files_by_name, source)
+            if keys:
+                mentions.append({"keys": keys, "title": title, "line": number})
+        rest = MD_LINK.sub(" ", line)
+        for keys in [normalize_url(m.group(0)) for m in URL_PATTERN.finditer(rest)] + \
+                [[normalize_doi(m.group(1))] for m in DOI_PATTERN.finditer(URL_PATTERN.sub(" ", rest))]:
+            if keys:
+                mentions.append({"keys": keys, "title": "", "line": number})
+    return mentions
+
+
+def find_files(root: Path = PROJECT_ROOT) -> dict:
+    """{relative posix path: os.stat_result} of every file under the scanned docs directories."""
+    found = {}
+    for directory in SCAN_DIRS:
+        for dirpath, dirs, filenames in os.walk(root / directory):
+            dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+            for filename in filenames:
+                if not filename.startswith("."):
+                    path = Path(dirpath) / filename
+                    found[path.relative_to(root).as_posix()] = path.stat()
+    return found
+
+
+def chunk_file(metadata: dict, root: Path = PROJECT_ROOT) -> str:
+    """Project-relative path of the file a RAG chunk came from (llama_index file_path/file_name metadata)."""
+    file_path = metadata.get("file_path")
+    if file_path:
+        path = Path(file_path)
+        if path.is_absolute():
+            try:
+                return path.resolve().relative_to(root.resolve()).as_posix()
+            except ValueError:
+                pass
+        else:
+            return path.as_posix()
+    return f"{SCAN_DIRS[0]}/{metadata.get('file_name', 'unknown')}"
+
+
+def rag_chunks(db_path=CHROMA_PATH, root: Path = PROJECT_ROOT) -> dict:
+    """{file: [chunk ids]} read from the RAG vector store (needs chromadb)."""
+    import chromadb     # optional: only the RAG setup installs it
+
+    collection = chromadb.PersistentClient(path=str(db_path)).get_collection(CHROMA_COLLECTION)
+    by_file = {}
+    offset = 0
+    while True:
+        batch = collection.get(include=["metadatas"], limit=CHUNK_BATCH, offset=offset)
+        for chunk_id, metadata in zip(batch["ids"], batch["metadatas"]):
+            by_file.setdefault(chunk_file(metadata or {}, root), []).append(chunk_id)
+        if len(batch["ids"]) < CHUNK_BATCH:
+            return by_file
+        offset += len(batch["ids"])
+
+
+def chroma_stamp(db_path=CHROMA_PATH):
+    try:
+        stat = (Path(db_path) / "chroma.sqlite3").stat()
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def key_rank(key: str) -> tuple:
+    kind = key.split(":", 1)[0]
+    return KEY_PRIORITY.index(kind) if kind in KEY_PRIORITY else len(KEY_PRIORITY), key
+
+
+def build_sources(files: dict, ledger: str = None) -> tuple:
+    """
+    Merge every mention and file identity into deduplicated sources.
+
+    Keys that appear together (a URL with a DOI in it, a PDF's hash and the
+    DOI in its metadata, a ledger row naming a file) join one source; its id
+    is its best key (DOI > URL > content hash > file > title).
+
+    Returns:
+        tuple: ({id: {"title", "urls", "keys", "ledger", "copies", "cited_in"}}, {key: id})
+    """
+    parent = {}
+
+    def find(key):
+        parent.setdefault(key, key)
+        while parent[key] != key:
+            parent[key] = parent[parent[key]]
+            key = parent[key]
+        return key
+
+    def union(keys):
+        roots = sorted({find(k) for k in keys}, key=key_rank)
+        for other in roots[1:]:
+            parent[other] = roots[0]
+
+    for name, record in files.items():
+        if record.get("keys"):
+            union(record["keys"])
+        for mention in record.get("mentions", []):
+            union(mention["keys"])
+
+    groups = {}
+    for key in parent:
+        groups.setdefault(find(key), []).append(key)
+    lookup, sources = {}, {}
+    for members in groups.values():
+        source_id = min(members, key=key_rank)
+        sources[source_id] = {"title": "", "urls": [], "keys": sorted(members, key=key_rank),
+                              "ledger": [], "copies": [], "cited_in": []}
+        for key in members:
+            lookup[key] = source_id
+
+    for name, record in sorted(files.items()):
+        if record.get("keys"):
+            source = sources[lookup[record["keys"][0]]]
+            source["copies"].append(name)
+            source["title"] = source["title"] or Path(name).stem
+        for mention in record.get("mentions", []):
+            source = sources[lookup[mention["keys"][0]]]
+            if name == ledger:
+                if not source["ledger"]:
+                    source["title"] = mention["title"] or source["title"]
+                source["ledger"].append([mention["line"], mention.get("section", "")])
+            else:
+                source["cited_in"].append([name, mention["line"]])
+                source["title"] = source["title"] or mention["title"]
+    for source in sources.values():
+        source["urls"] = [k[4:] for k in source["keys"] if k.startswith("url:")]
+    return sources, lookup
+
+
+def empty_index() -> dict:
+    return {"format": INDEX_FORMAT, "files": {}, "chunks": {"stamp": None, "files": {}}}
+
+
+def load_index(path=INDEX_PATH) -> dict:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        data = None
+    if not data or data.get("format") != INDEX_FORMAT:
+        return empty_index()
+    return data
+
+
+def update_index(path=INDEX_PATH, root: Path = PROJECT_ROOT, ledger_path: Path = SOURCES_PATH,
+                 chroma_path=CHROMA_PATH, rebuild: bool = False) -> dict:
+    """
+    Bring the citation index up to date.
+
+    Files are re-read (and binaries re-hashed) only when their mtime or size
+    changed; the chunk map only when the vector store changed. Sources and
+    the key lookup are rebuilt and the store rewritten only when something
+    changed.
+
+    Returns:
+        dict: {"files", "chunks": {"stamp", "files": {file: [ids]}}, "sources", "lookup"}
+    """
+    index = empty_index() if rebuild else load_index(path)
+    files = index["files"]
+    changed = rebuild or "sources" not in index
+    ledger = Path(ledger_path).relative_to(root).as_posix()
+
+    current = find_files(root)
+    stale = [name for name, stat in current.items()
+             if (files.get(name) or {}).get("stamp") != [stat.st_mtime_ns, stat.st_size]]
+    files_by_name = {name.rsplit("/", 1)[-1]: name for name in current if not name.endswith(".md")}
+    if any(not name.endswith(".md") for name in stale) or set(files) - set(current):
+        # A new or removed reference file can change what markdown links resolve to
+        stale = [name for name in current if name.endswith(".md")] + \
+                [name for name in stale if not name.endswith(".md")]
+
+    for name in stale:
+        stat = current[name]
+        record = {"stamp": [stat.st_mtime_ns, stat.st_size]}
+        try:
+            if name.endswith(".md"):
+                text = (root / name).read_text(encoding="utf-8", errors="replace")
+                parse = parse_ledger if name == ledger else parse_citations
+                record["mentions"] = parse(text, name, files_by_name)
+            else:
+                digest, doi = hash_file(root / name)
+                record["keys"] = ["sha256:" + digest, "file:" + name] + ([doi] if doi else [])
+        except OSError:
+            continue
+        files[name] = record
+        changed = True
+    for name in set(files) - set(current):
+        del files[name]
+        changed = True
+
+    stamp = chroma_stamp(chroma_path)
+    if stamp != index["chunks"]["stamp"]:
+        try:
+            index["chunks"] = {"stamp": stamp, "files": rag_chunks(chroma_path, root) if stamp else {}}
+            changed = True
+        except ImportError:
+            pass    # chromadb not installed: keep the last chunk map
+        except Exception as e:
+            print(f"WARNING: Could not read RAG chunks from {chroma_path}: {e}")
+
+    if changed:
+        index["sources"], index["lookup"] = build_sources(files, ledger)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+    return index
+
+
+def find_sources(index: dict, query: str) -> list:
+    """Source ids for a DOI, URL, sha256 or - failing those - all words of a title."""
+    query = query.strip()
+    if URL_PATTERN.match(query):
+        keys = normalize_url(query)
+    elif DOI_PATTERN.search(query):
+        keys = [normalize_doi(DOI_PATTERN.search(query).group(1))]
+    elif re.fullmatch(r'(sha256:)?[0-9a-f]{64}', query, re.IGNORECASE):
+        keys = ["sha256:" + query.lower().split(":")[-1]]
+    elif "/" in query and "." in query.split("/", 1)[0]:
+        keys = normalize_url("https://" + query)
+    else:
+        keys = []
+    found = [index["lookup"][k] for k in keys if k in index["lookup"]]
+    if found or keys:
+        return list(dict.fromkeys(found))
+    words = normalize_title(query)[6:].split()
+    return sorted(sid for sid, s in index["sources"].items()
+                  if words and all(w in normalize_title(s["title"] + " " + " ".join(s["urls"])) for w in words))
+
+
+def file_sources(index: dict, name: str) -> tuple:
+    """(source the file is a copy of or None, [source ids cited in the file])."""
+    record = index["files"].get(name, {})
+    copy_of = index["lookup"][record["keys"][0]] if record.get("keys") else None
+    cited = [index["lookup"][m["keys"][0]] for m in record.get("mentions", [])]
+    return copy_of, list(dict.fromkeys(cited))
+
+
+def chunk_owner(index: dict, chunk_id: str):
+    for name, ids in index["chunks"]["files"].items():
+        if chunk_id in ids:
+            return name
+    return None
+
+
+def normalize_path(index: dict, query: str, root: Path = PROJECT_ROOT) -> str:
+    """A path (absolute, relative to cwd or to the project) or a unique file name -> indexed key."""
+    path = Path(query).resolve()
+    if path.exists():
+        try:
+            return path.relative_to(root.resolve()).as_posix()
+        except ValueError:
+            pass
+    query = query.strip("/")
+    if query in index["files"]:
+        return query
+    candidates = [name for name in index["files"] if name.rsplit("/", 1)[-1] == query]
+    if len(candidates) > 1:
+        raise KeyError(f"'{query}' is ambiguous: {', '.join(sorted(candidates))}")
+    return candidates[0] if candidates else query
+
+
+def check(index: dict, ledger: str) -> dict:
+    """
+    Ledger hygiene.
+
+    Returns:
+        dict: {"duplicates": [(source id, [lines])], "missing": [(line, file)],
+               "untracked": [(source id, [files citing it])]} - untracked sources are cited
+               or stored under docs/ but have no ledger row
+    """
+    duplicates, untracked = [], []
+    for source_id, source in sorted(index["sources"].items()):
+        if len(source["ledger"]) > 1:
+            duplicates.append((source_id, [line for line, _ in source["ledger"]]))
+        if not source["ledger"] and source_id.split(":", 1)[0] in ("doi", "url", "sha256"):
+            untracked.append((source_id, sorted({name for name, _ in source["cited_in"]} | set(source["copies"]))))
+    missing = []
+    for mention in index["files"].get(ledger, {}).get("mentions", []):
+        for key in mention["keys"]:
+            if key.startswith("file:") and key[5:] not in index["files"]:
+                missing.append((mention["line"], key[5:]))
+    return {"duplicates": duplicates, "missing": missing, "untracked": untracked}
+
+
+def dedupe_ledger(index: dict, ledger_path: Path = SOURCES_PATH, dry_run: bool = False) -> tuple:
+    """
+    Remove ledger rows that repeat an earlier row's source.
+
+    A row is only removed when it has a DOI or URL of its own and all of them
+    are on an earlier row it repeats. Rows without one (matched by title or
+    file only) and rows that name different DOIs/URLs are left for a person
+    to merge.
+
+    Returns:
+        tuple: ([(line, text) removed], [(source id, [lines kept])] left to merge by hand)
+    """
+    ledger = ledger_path.relative_to(PROJECT_ROOT).as_posix()
+    duplicates = check(index, ledger)["duplicates"]
+    row_keys = {m["line"]: m["keys"] for m in index["files"].get(ledger, {}).get("mentions", [])}
+    drop, conflicts = set(), []
+    for source_id, lines in duplicates:
+        kept = []
+        for line in sorted(lines):
+            own = {key for key in row_keys.get(line, []) if key.startswith(("doi:", "url:"))}
+            if own and any(own <= earlier for _, earlier in kept):
+                drop.add(line)
+            else:
+                kept.append((line, own))
+        if len(kept) > 1:
+            conflicts.append((source_id, [line for line, _ in kept]))
+    if not drop:
+        return [], conflicts
+    lines = ledger_path.read_text(encoding="utf-8").split("\n")
+    removed = [(n, lines[n - 1]) for n in sorted(drop)]
+    if not dry_run:
+        kept = [line for n, line in enumerate(lines, 1) if n not in drop]
+        tmp_path = ledger_path.with_name(ledger_path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_text("\n".join(kept), encoding="utf-8")
+        os.replace(tmp_path, ledger_path)
+    return removed, conflicts
+
+
+def print_source(index: dict, source_id: str):
+    source = index["sources"][source_id]
+    chunks = index["chunks"]["files"]
+    print(f"{source_id}" + (f"  \"{source['title']}\"" if source["title"] else ""))
+    for url in source["urls"]:
+        print(f"  url:      {url}")
+    for line, section in source["ledger"]:
+        print(f"  ledger:   {SOURCES_PATH.relative_to(PROJECT_ROOT).as_posix()}:{line}  ({section})")
+    for name in source["copies"]:
+        print(f"  file:     {name}  ({len(chunks.get(name, []))} chunks)")
+    for name, line in source["cited_in"]:
+        print(f"  cited in: {name}:{line}  ({len(chunks.get(name, []))} chunks)")
+
+
+def source_json(index: dict, source_id: str) -> dict:
+    source = dict(index["sources"][source_id], id=source_id)
+    names = source["copies"] + sorted({name for name, _ in source["cited_in"]})
+    source["chunks"] = {name: index["chunks"]["files"].get(name, []) for name in names}
+    return source
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Deduplicated index of research sources, reference files and RAG chunks")
+    parser.add_argument("--json", action="store_true", help="Print lookups as JSON (includes chunk ids)")
+    sub = parser.add_subparsers(dest="command", required=True)
+    source_parser = sub.add_parser("source", help="Ledger rows, files and chunks of a source")
+    source_parser.add_argument("query", help="DOI, URL, sha256 or title words")
+    file_parser = sub.add_parser("file", help="Sources a reference file is or cites")
+    file_parser.add_argument("path", help="A path or a unique file name")
+    chunk_parser = sub.add_parser("chunk", help="Sources behind a RAG chunk id")
+    chunk_parser.add_argument("chunk_id")
+    sub.add_parser("check", help="Duplicate ledger rows, missing files, citations not in the ledger")
+    dedupe_parser = sub.add_parser("dedupe", help="Remove duplicate rows from _sources.md")
+    dedupe_parser.add_argument("--dry-run", action="store_true", help="Only list the rows that would go")
+    sub.add_parser("rebuild", help="Re-read every file")
+
+    args = parser.parse_args()
+    start = time.perf_counter()
+    index = update_index(rebuild=args.command == "rebuild")
+    ledger = SOURCES_PATH.relative_to(PROJECT_ROOT).as_posix()
+
+    try:
+        if args.command in ("file", "chunk"):
+            if args.command == "chunk":
+                name = chunk_owner(index, args.chunk_id)
+                if name is None:
+                    print(f"ERROR: Chunk {args.chunk_id} not found (rebuild RAG with setup_rag.py --setup?)")
+                    sys.exit(1)
+            else:
+                name = normalize_path(index, args.path)
+            if name not in index["files"]:
+                print(f"ERROR: {name} is not under {' or '.join(SCAN_DIRS)}")
+                sys.exit(1)
+            copy_of, cited = file_sources(index, name)
+            ids = [copy_of] * bool(copy_of) + cited
+            if args.json:
+                print(json.dumps({"file": name, "chunks": index["chunks"]["files"].get(name, []),
+                                  "copy_of": copy_of, "sources": [source_json(index, s) for s in ids]}, indent=1))
+                return
+            print(f"{name}  ({len(index['chunks']['files'].get(name, []))} chunks)\n")
+            for source_id in ids:
+                print_source(index, source_id)
+                print()
+            print(f"{len(cited)} sources cited" + (f", copy of {copy_of}" if copy_of else ""))
+        elif args.command == "source":
+            found = find_sources(index, args.query)
+            if args.json:
+                print(json.dumps([source_json(index, s) for s in found], indent=1))
+                return
+            for source_id in found:
+                print_source(index, source_id)
+                print()
+            print(f"{len(found)} sources match")
+        elif args.command == "check":
+            report = check(index, ledger)
+            for source_id, lines in report["duplicates"]:
+                print(f"  duplicate: {source_id} on lines {', '.join(map(str, lines))}")
+            for line, name in report["missing"]:
+                print(f"  missing:   line {line}: {name} does not exist")
+            for source_id, names in report["untracked"]:
+                print(f"  untracked: {source_id} ({', '.join(names)})")
+            print(f"\n{len(report['duplicates'])} duplicated, {len(report['missing'])} missing, "
+                  f"{len(report['untracked'])} not in {ledger}")
+        elif args.command == "dedupe":
+            if not SOURCES_PATH.exists():
+                print(f"ERROR: {ledger} not found")
+                sys.exit(1)
+            removed, conflicts = dedupe_ledger(index, dry_run=args.dry_run)
+            for line, text in removed:
+                print(f"  {line}: {text.strip()}")
+            for source_id, lines in conflicts:
+                print(f"  kept:  {source_id} on lines {', '.join(map(str, lines))} (no or different DOIs/URLs - merge by hand)")
+            print(f"\n{'Would remove' if args.dry_run else 'Removed'} {len(removed)} duplicate rows"
+                  + (f", {len(conflicts)} sources left to merge by hand" if conflicts else ""))
+            if removed and not args.dry_run:
+                update_index()
+        elif args.command == "rebuild":
+            print(f"Indexed {len(index['files'])} files, {len(index['sources'])} sources, "
+                  f"{sum(map(len, index['chunks']['files'].values()))} RAG chunks ({INDEX_PATH})")
+    except KeyError as e:
+        print(f"ERROR: {e.args[0]}")
+        sys.exit(1)
+    print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+CONTEXT.md Timeline Indexer
+
+Walks the project's git history and records how CONTEXT.md's phase, blocking
+issues, critical parameters and system statuses evolved. The first run walks
+the full history; later runs only parse commits added since the last run.
+
+Run: python scripts/context_timeline.py [--rebuild] [--limit N]
+Store: .toolkit-cache/context-timeline.json (safe to delete, rebuilt on demand)
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+from generate_dashboard import parse_context_md, parse_critical_parameters, parse_system_status
+
+CONTEXT_FILE = "CONTEXT.md"
+TIMELINE_PATH = Path(".toolkit-cache") / "context-timeline.json"
+TIMELINE_FORMAT = 1
+
+
+def git(*args, input_data=None, cwd="."):
+    """Run a git command and return stdout as bytes (raises on failure)"""
+    result = subprocess.run(
+        ["git", *args],
+        cwd=str(cwd),
+        input=input_data,
+        capture_output=True,
+        check=True
+    )
+    return result.stdout
+
+
+def snapshot_from_content(content):
+    """Reduce CONTEXT.md content to the fields tracked in the timeline"""
+    info = parse_context_md(content)
+    return {
+        'phase': info['phase'],
+        'blocking': info['blocking'],
+        'parameters': {p['name']: p['value'] for p in parse_critical_parameters(content) if p['name']},
+        'systems': {s['name']: s['status'] for s in parse_system_status(content) if s['name']},
+    }
+
+
+def list_context_commits(since=None, cwd="."):
+    """List (sha, unix_time, subject) of commits touching CONTEXT.md, oldest first"""
+    rev_range = f"{since}..HEAD" if since else "HEAD"
+    out = git("log", "--reverse", "--format=%H%x00%ct%x00%s", rev_range, "--", CONTEXT_FILE, cwd=cwd)
+    commits = []
+    for line in out.decode('utf-8', errors='replace').splitlines():
+        sha, timestamp, subject = line.split('\0', 2)
+        commits.append((sha, int(timestamp), subject))
+    return commits
+
+
+def read_blobs(commits, cwd="."):
+    """Read CONTEXT.md at each commit through a single `git cat-file --batch` process"""
+    if not commits:
+        return []
+    request = "".join(f"{sha}:./{CONTEXT_FILE}\n" for sha, _, _ in commits).encode('utf-8')
+    out = git("cat-file", "--batch", input_data=request, cwd=cwd)
+
+    contents = []
+    pos = 0
+    for _ in commits:
+        header_end = out.index(b'\n', pos)
+        header = out[pos:header_end].split()
+        pos = header_end + 1
+        if len(header) < 3 or header[1] != b'blob':
+            # File deleted at this commit
+            contents.append(None)
+            continue
+        size = int(header[2])
+        contents.append(out[pos:pos + size].decode('utf-8', errors='replace'))
+        pos += size + 1  # Trailing newline after each object
+    return contents
+
+
+def load_timeline(path=TIMELINE_PATH):
+    """Load the stored timeline, or an empty one if missing or stale"""
+    try:
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        data = None
+    if not data or data.get('format') != TIMELINE_FORMAT:
+        return {'format': TIMELINE_FORMAT, 'head': None, 'entries': []}
+    return data
+
+
+def is_ancestor(sha, cwd="."):
+    """Check whether sha is still reachable from HEAD (history not rewritten)"""
+    try:
+        git("merge-base", "--is-ancestor", sha, "HEAD", cwd=cwd)
+        return True
+    except subprocess.CalledProcessError:
+        return False
+
+
+def update_timeline(path=TIMELINE_PATH, rebuild=False, cwd="."):
+    """
+    Bring the timeline up to date with HEAD
+
+    Only commits after the last indexed HEAD are read. Consecutive commits
+    whose parsed snapshot did not change are not stored.
+
+    Returns:
+        list: Timeline entries, oldest first
+    """
+    path = Path(cwd) / path
+    timeline = load_timeline(path)
+    head = git("rev-parse", "HEAD", cwd=cwd).decode().strip()
+
+    if rebuild or (timeline['head'] and not is_ancestor(timeline['head'], cwd=cwd)):
+        timeline = {'format': TIMELINE_FORMAT, 'head': None, 'entries': []}
+
+    if timeline['head'] == head:
+        return timeline['entries']
+
+    commits = list_context_commits(since=timeline['head'], cwd=cwd)
+    entries = timeline['entries']
+    previous = entries[-1]['snapshot'] if entries else None
+
+    for (sha, timestamp, subject), content in zip(commits, read_blobs(commits, cwd=cwd)):
+        if content is None:
+            continue
+        snapshot = snapshot_from_content(content)
+        if snapshot == previous:
+            continue
+        entries.append({
+            'commit': sha,
+            'time': timestamp,
+            'subject': subject,
+            'snapshot': snapshot,
+        })
+        previous = snapshot
+
+    timeline['head'] = head
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.write_text(json.dumps(timeline, separators=(',', ':')), encoding='utf-8')
+    tmp_path.replace(path)
+
+    return entries
+
+
+def describe_changes(previous, current):
+    """List human-readable changes between two snapshots"""
+    if previous is None:
+        return ["Initial snapshot"]
+
+    changes = []
+    if previous['phase'] != current['phase']:
+        changes.append(f"Phase: {previous['phase']} -> {current['phase']}")
+    if previous['blocking'] != current['blocking']:
+        changes.append("Blocking issues updated")
+
+    for label, key in (("Parameter", 'parameters'), ("System", 'systems')):
+        old, new = previous[key], current[key]
+        for name in new:
+            if name not in old:
+                changes.append(f"{label} added: {name} = {new[name]}")
+            elif old[name] != new[name]:
+                changes.append(f"{label} {name}: {old[name]} -> {new[name]}")
+        for name in old:
+            if name not in new:
+                changes.append(f"{label} removed: {name}")
+
+    return changes
+
+
+def timeline_events(entries):
+    """Pair each timeline entry with the list of changes it introduced"""
+    events = []
+    previous = None
+    for entry in entries:
+        events.append({
+            'commit': entry['commit'],
+            'time': entry['time'],
+            'subject': entry['subject'],
+            'phase': entry['snapshot']['phase'],
+            'changes': describe_changes(previous, entry['snapshot']),
+        })
+        previous = entry['snapshot']
+    return events
+
+
+def main():
+    from datetime import datetime
+
+    parser = argparse.ArgumentParser(description="Index CONTEXT.md history from git")
+    parser.add_argument("--rebuild", action="store_true", help="Discard the stored timeline and re-walk history")
+    parser.add_argument("--limit", type=int, default=20, help="Number of most recent events to print")
+
+    args = parser.parse_args()
+
+    try:
+        entries = update_timeline(rebuild=args.rebuild)
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        print("ERROR: Not a git repository with commits (or git not available)")
+        sys.exit(1)
+
+    events = timeline_events(entries)
+    print(f"Timeline: {len(events)} CONTEXT.md changes indexed ({TIMELINE_PATH})")
+    for event in events[-args.limit:]:
+        date = datetime.fromtimestamp(event['time']).strftime('%Y-%m-%d')
+        print(f"\n{date}  {event['commit'][:8]}  {event['subject']}")
+        for change in event['changes']:
+            print(f"    - {change}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,373 @@
+#!/usr/bin/env python3
+"""
+Automated Cross-Checks
+
+Pairs a calculation with an independent check of it - a hand-calc formula,
+an alternative method - and compares the two over thousands of randomized
+input points instead of one. Points are a Latin-hypercube sample of the
+inputs (by default each parameter's declared tolerance band in
+project_params.py), derived parameters are recomputed for every point, and
+both functions are evaluated in parallel (via sweep.py's workers). Every
+output must agree within its tolerance; the result is written as a
+verification report in the layout of templates/verification-report-template.md.
+
+A check file in verification/cross-checks/, e.g. nozzle_thrust.py:
+    from crosscheck import cross_check      # scripts/ is on the path when run by crosscheck.py
+
+    @cross_check(calculation="calculations/propulsion/nozzle.py:thrust",
+                 inputs={"CHAMBER_PRESSURE": None,                    # its tolerance band
+                         "EXIT_PRESSURE": {"min": 0.5e5, "max": 1.2e5}},
+                 tolerance={"thrust": {"rel": 1e-3}, "isp": {"abs": 0.5}},
+                 points=5000)
+    def ideal_rocket_thrust(CHAMBER_PRESSURE, EXIT_PRESSURE, THROAT_AREA, GAMMA):
+        ...
+        return {"thrust": F, "isp": isp}
+
+Both functions are called with the parameters their signatures name and
+return a number or a dict of numbers; outputs present in both are compared.
+Tolerance is {"rel": r, "abs": a} for every output or per output name; a
+point passes when |calculation - check| <= a + r * |check|. A point where
+either function raises counts as a failure of every output and is listed,
+with its error, under Issues Found; the remaining points are still compared.
+
+Run:
+    python scripts/crosscheck.py                               # every check in verification/cross-checks/
+    python scripts/crosscheck.py verification/cross-checks/nozzle_thrust.py --points 20000 --workers 8
+Reports: verification/cross-checks/<check>-report.md (exit code 1 if any check fails)
+"""
+
+import argparse
+import importlib.util
+import inspect
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy is required (pip install -r requirements-engineering.txt)")
+    sys.exit(1)
+
+from param_registry import PROJECT_ROOT, load_registry
+from sweep import CHUNKS_PER_WORKER, MAX_CHUNK_SIZE, Sampler, run_chunk, worker_setup
+
+CHECKS_DIR = PROJECT_ROOT / "verification" / "cross-checks"
+DEFAULT_POINTS = 2000
+DEFAULT_TOLERANCE = {"rel": 1e-6, "abs": 0.0}
+WORST_CASES = 5
+
+
+def cross_check(calculation, inputs, tolerance=None, points: int = DEFAULT_POINTS, seed: int = 0,
+                vectorized: bool = False, name: str = None):
+    """
+    Register the decorated function as an independent check of `calculation`.
+
+    Args:
+        calculation: 'path/to/file.py:function' (relative to the project root) or the function itself
+        inputs: Parameter names to randomize - a list (each over its tolerance band in
+            project_params.py) or {name: None | {"min": lo, "max": hi}}
+        tolerance: {"rel", "abs"} for all outputs, or {output: {"rel", "abs"}}
+        points: Number of randomized input points
+        seed: Random seed - the same seed checks the same points
+        vectorized: Both functions take and return whole arrays of points
+        name: Title for the report (default: the check function's name)
+    """
+    def register(func):
+        func.cross_check = {"calculation": calculation, "inputs": inputs, "tolerance": tolerance or {},
+                            "points": int(points), "seed": seed, "vectorized": vectorized,
+                            "name": name or func.__name__}
+        return func
+    return register
+
+
+def function_reference(func) -> str:
+    """A function defined in a project file -> 'path/to/file.py:name' that worker processes can load."""
+    path = Path(inspect.getsourcefile(func)).resolve()
+    return f"{path.relative_to(PROJECT_ROOT).as_posix()}:{func.__name__}"
+
+
+def load_checks(path: Path) -> list:
+    """Functions registered with @cross_check in one file."""
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))
+    module_spec = importlib.util.spec_from_file_location(f"cross_check_{path.stem}", path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return [value for value in vars(module).values()
+            if callable(value) and hasattr(value, "cross_check")
+            and getattr(value, "__module__", "") == module.__name__]
+
+
+def input_ranges(spec: dict, registry) -> dict:
+    """{name: {"min", "max"}} for the sampler - explicit ranges or the declared tolerance bands."""
+    inputs = spec["inputs"]
+    if not isinstance(inputs, dict):
+        inputs = {name: None for name in inputs}
+    ranges = {}
+    for name, band in inputs.items():
+        if band is not None:
+            ranges[name] = {"min": float(band["min"]), "max": float(band["max"])}
+            continue
+        param = registry.get(name)
+        if param is None:
+            raise ValueError(f"{name} is not in project_params.py - give it a range")
+        if param.tolerance is not None:
+            spread = param.tolerance
+        elif param.rel_tolerance is not None:
+            spread = abs(param.value) * param.rel_tolerance
+        else:
+            raise ValueError(f"{name} has no tolerance in project_params.py - give it a range")
+        ranges[name] = {"min": param.value - spread, "max": param.value + spread}
+    return ranges
+
+
+def tolerance_for(spec: dict, output: str) -> dict:
+    tolerance = spec["tolerance"]
+    if output in tolerance and isinstance(tolerance[output], dict):
+        tolerance = tolerance[output]
+    elif any(isinstance(v, dict) for v in tolerance.values()):
+        tolerance = {}  # Per-output tolerances given, none for this output
+    return {"rel": float(tolerance.get("rel", DEFAULT_TOLERANCE["rel"])),
+            "abs": float(tolerance.get("abs", DEFAULT_TOLERANCE["abs"]))}
+
+
+def evaluate_side(reference: str, swept: dict, vectorized: bool) -> tuple:
+    """
+    One function over a chunk of points. If the chunk raises, its points are
+    re-run one at a time so a single bad point only costs itself.
+
+    Returns:
+        tuple: ({output: array}, {point index in chunk: error message}) - NaN where a point raised
+    """
+    worker_setup(reference, False)  # A check that cannot even load fails as a whole
+    try:
+        return run_chunk(reference, swept, vectorized, False), {}
+    except Exception:   # Arbitrary project code - find the points responsible below
+        pass
+    count = len(next(iter(swept.values())))
+    rows, errors = [], {}
+    for i in range(count):
+        try:
+            rows.append(run_chunk(reference, {name: values[i:i + 1] for name, values in swept.items()},
+                                  vectorized, False))
+        except Exception as e:
+            rows.append({})
+            errors[i] = f"{type(e).__name__}: {e}"
+    outputs = dict.fromkeys(name for row in rows for name in row)
+    columns = {name: np.array([row[name][0] if name in row else np.nan for row in rows], dtype=float)
+               for name in outputs}
+    return columns, errors
+
+
+def evaluate_pair(calculation: str, check: str, swept: dict, vectorized: bool) -> tuple:
+    """Both functions over one chunk of points (in a worker process)."""
+    return evaluate_side(calculation, swept, vectorized), evaluate_side(check, swept, vectorized)
+
+
+def compare(original: np.ndarray, verified: np.ndarray, tolerance: dict) -> dict:
+    """Per-point agreement of one output. Points where both are NaN agree."""
+    diff = np.abs(original - verified)
+    both_nan = np.isnan(original) & np.isnan(verified)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        passed = (diff <= tolerance["abs"] + tolerance["rel"] * np.abs(verified)) | both_nan
+        rel = np.where(verified != 0, diff / np.abs(verified), np.where(diff == 0, 0.0, np.inf))
+    finite = np.isfinite(diff)
+    return {"passed": passed, "diff": diff, "rel": rel,
+            "max_abs": float(diff[finite].max()) if finite.any() else float("nan"),
+            "max_rel": float(rel[finite].max()) if finite.any() else float("nan")}
+
+
+def run_check(func, registry, points: int = None, workers: int = None) -> dict:
+    """
+    Evaluate a registered check against its calculation.
+
+    Returns:
+        dict: spec, inputs (columns), outputs {name: {"original", "verified", "tolerance", comparison...}},
+        errors (per point, '' where both functions returned), unmatched outputs, seconds
+    """
+    spec = dict(func.cross_check)
+    if points:
+        spec["points"] = int(points)
+    calculation = spec["calculation"]
+    if callable(calculation):
+        calculation = function_reference(calculation)
+    check = function_reference(func)
+
+    ranges = input_ranges(spec, registry)
+    sampler = Sampler({"method": "lhs", "samples": spec["points"], "seed": spec["seed"], "parameters": ranges})
+    workers = workers or os.cpu_count() or 1
+    chunk_size = max(1, min(MAX_CHUNK_SIZE, math.ceil(sampler.count / (workers * CHUNKS_PER_WORKER))))
+    bounds = [(lo, min(lo + chunk_size, sampler.count)) for lo in range(0, sampler.count, chunk_size)]
+
+    start = time.perf_counter()
+    original, verified = {}, {}
+    errors = np.full(sampler.count, "", dtype=object)
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds))) as executor:
+        jobs = [(calculation, check, sampler.values(lo, hi), spec["vectorized"]) for lo, hi in bounds]
+        for (lo, hi), sides in zip(bounds, executor.map(evaluate_pair, *zip(*jobs))):
+            for side, (columns, side_errors), store in zip(("calculation", "check"), sides, (original, verified)):
+                for output, values in columns.items():
+                    store.setdefault(output, {})[lo] = values
+                for i, message in side_errors.items():
+                    errors[lo + i] += ("; " if errors[lo + i] else "") + f"{side}: {message}"
+    # An output missing from a chunk (every point in it raised) is NaN there
+    original = {k: np.concatenate([v.get(lo, np.full(hi - lo, np.nan)) for lo, hi in bounds])
+                for k, v in original.items()}
+    verified = {k: np.concatenate([v.get(lo, np.full(hi - lo, np.nan)) for lo, hi in bounds])
+                for k, v in verified.items()}
+    errored = errors != ""
+
+    outputs = {}
+    for output in original:
+        if output in verified:
+            tolerance = tolerance_for(spec, output)
+            outputs[output] = {"original": original[output], "verified": verified[output], "tolerance": tolerance,
+                               **compare(original[output], verified[output], tolerance)}
+            outputs[output]["passed"] &= ~errored
+    return {"spec": spec, "calculation": calculation, "check": check, "ranges": ranges,
+            "inputs": sampler.values(0, sampler.count), "outputs": outputs, "errors": errors,
+            "unmatched": sorted(set(original) ^ set(verified)), "seconds": time.perf_counter() - start}
+
+
+def check_status(result: dict) -> str:
+    if not result["outputs"] or (result["errors"] != "").any():
+        return "Fail"
+    return "Pass" if all(o["passed"].all() for o in result["outputs"].values()) else "Fail"
+
+
+def format_tolerance(tolerance: dict) -> str:
+    parts = []
+    if tolerance["rel"]:
+        parts.append(f"{tolerance['rel']:.3g} rel")
+    if tolerance["abs"]:
+        parts.append(f"{tolerance['abs']:.3g} abs")
+    return " + ".join(parts) or "exact"
+
+
+def write_report(result: dict, registry, path: Path):
+    """Verification report in the layout of templates/verification-report-template.md."""
+    spec = result["spec"]
+    status = check_status(result)
+    points = spec["points"]
+    lines = [f"# Verification Report - {spec['name']}", "",
+             f"**Date:** {time.strftime('%Y-%m-%d')}",
+             "**Verifier:** crosscheck.py (automated)",
+             f"**Original Work:** `{result['calculation']}`",
+             f"**Status:** {status}", "", "---", "",
+             "## Scope", "",
+             f"`{result['calculation']}` against the independent check `{result['check']}` over "
+             f"{points:,} Latin-hypercube input points (seed {spec['seed']}).", "",
+             "---", "",
+             "## Verification Method", "",
+             "- [x] Alternative method/formula",
+             f"- [x] Other: randomized cross-check of {points:,} points, "
+             "derived parameters recomputed per point", "",
+             "---", "",
+             "## Original Work Summary", "",
+             "### Inputs",
+             "| Parameter | Value | Units | Source |",
+             "|-----------|-------|-------|--------|"]
+    for name, band in result["ranges"].items():
+        param = registry.get(name)
+        unit = param.unit if param else ""
+        explicit = isinstance(spec["inputs"], dict) and spec["inputs"].get(name) is not None
+        source = "cross-check range" if explicit else "project_params.py tolerance band"
+        lines.append(f"| {name} | {band['min']:.6g} - {band['max']:.6g} | {unit} | {source} |")
+    lines += ["", "---", "", "## Verification Calculations", "",
+              "### Method 1: Randomized cross-check", "",
+              "**Results:**",
+              "| Result | Points | Max difference | Max relative | Tolerance | Failures | Status |",
+              "|--------|--------|----------------|--------------|-----------|----------|--------|"]
+    for output, o in result["outputs"].items():
+        failures = int((~o["passed"]).sum())
+        lines.append(f"| {output} | {len(o['passed']):,} | {o['max_abs']:.3g} | {o['max_rel']:.3g} | "
+                     f"{format_tolerance(o['tolerance'])} | {failures:,} | {'Pass' if not failures else 'Fail'} |")
+    if result["unmatched"]:
+        lines += ["", f"Outputs returned by only one side (not compared): {', '.join(result['unmatched'])}"]
+
+    issues = []
+    raised = np.flatnonzero(result["errors"] != "")
+    if len(raised):
+        issues += [f"### {len(raised):,} of {points:,} points raised an exception (failures for every output)", "",
+                   "| " + " | ".join(result["ranges"]) + " | Error |",
+                   "|" + "---|" * (len(result["ranges"]) + 1)]
+        for i in raised[:WORST_CASES]:
+            values = " | ".join(f"{result['inputs'][name][i]:.6g}" for name in result["ranges"])
+            issues.append(f"| {values} | {result['errors'][i].replace('|', '/')} |")
+        issues.append("")
+    for output, o in result["outputs"].items():
+        failed = np.flatnonzero(~o["passed"] & (result["errors"] == ""))
+        if not len(failed):
+            continue
+        worst = failed[np.argsort(-np.nan_to_num(o["diff"][failed], nan=np.inf))][:WORST_CASES]
+        issues += [f"### {output}: {len(failed):,} of {len(o['passed']):,} points out of tolerance", "",
+                   "| " + " | ".join(result["ranges"]) + " | Original | Verified | Difference |",
+                   "|" + "---|" * (len(result["ranges"]) + 3)]
+        for i in worst:
+            values = " | ".join(f"{result['inputs'][name][i]:.6g}" for name in result["ranges"])
+            issues.append(f"| {values} | {o['original'][i]:.6g} | {o['verified'][i]:.6g} | {o['diff'][i]:.3g} |")
+        issues.append("")
+    lines += ["", "---", "", "## Issues Found", ""]
+    lines += issues or ["None - every point agreed within tolerance.", ""]
+    lines += ["---", "", "## Conclusions", "",
+              "### Overall Assessment", status, "",
+              f"Evaluated in {result['seconds']:.1f} s. Re-run with "
+              f"`python scripts/crosscheck.py {result['check'].rpartition(':')[0]}`.",
+              "", "---", "", "## Sign-off", "",
+              "**Verified by:** [Name] - [Date]",
+              "**Reviewed by:** [Name] - [Date]", ""]
+    path.write_text("\n".join(lines), encoding="utf-8")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run randomized cross-checks of calculations")
+    parser.add_argument("paths", nargs="*", help="Check files (default: verification/cross-checks/*.py)")
+    parser.add_argument("--points", type=int, help="Override each check's number of points")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+
+    args = parser.parse_args()
+    paths = [Path(p).resolve() for p in args.paths] or sorted(CHECKS_DIR.glob("*.py"))
+    if not paths:
+        print(f"No cross-checks found in {CHECKS_DIR.relative_to(PROJECT_ROOT)}/")
+        return
+
+    registry = load_registry()
+    failed = 0
+    for path in paths:
+        if not path.is_file():
+            print(f"ERROR: Check file not found: {path}")
+            sys.exit(1)
+        try:
+            checks = load_checks(path)
+        except Exception as e:  # A broken check file must not stop the others
+            print(f"  [FAIL] {path.name}: {type(e).__name__}: {e}")
+            failed += 1
+            continue
+        for func in checks:
+            spec = func.cross_check
+            try:
+                result = run_check(func, registry, points=args.points, workers=args.workers)
+            except Exception as e:
+                print(f"  [FAIL] {spec['name']}: {type(e).__name__}: {e}")
+                failed += 1
+                continue
+            stem = path.stem if len(checks) == 1 else f"{path.stem}-{func.__name__}"
+            report = path.with_name(f"{stem}-report.md")
+            write_report(result, registry, report)
+            status = check_status(result)
+            failed += status != "Pass"
+            outputs = ", ".join(f"{name} max rel {o['max_rel']:.2g}" for name, o in result["outputs"].items())
+            raised = int((result["errors"] != "").sum())
+            if raised:
+                outputs = (outputs + ", " if outputs else "") + f"{raised:,} points raised"
+            print(f"  [{status.upper()}] {spec['name']}: {result['spec']['points']:,} points, "
+                  f"{outputs or 'no common outputs'} ({result['seconds']:.1f} s) -> {report.relative_to(PROJECT_ROOT)}")
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
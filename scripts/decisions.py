@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""
+Decision Record Index
+
+Maintains a persistent index of docs/decisions/DEC-*.md (number, title, date,
+status, superseded-by links, search tokens). Only files whose mtime or size
+changed since the last run are re-parsed.
+
+Run:
+    python scripts/decisions.py search <terms...> [--status accepted]
+    python scripts/decisions.py list [--status superseded]
+    python scripts/decisions.py show DEC-012
+    python scripts/decisions.py rebuild
+Store: .toolkit-cache/decisions-index.json (safe to delete, rebuilt on demand)
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+
+DECISIONS_DIR = Path("docs") / "decisions"
+INDEX_PATH = Path(".toolkit-cache") / "decisions-index.json"
+INDEX_FORMAT = 2
+
+DEC_FILE_PATTERN = re.compile(r'^DEC-(\d+)[^/]*\.md$')
+DEC_REF_PATTERN = re.compile(r'\bDEC-(\d+)\b')
+# Both header styles: "**Status:** Accepted" (template) and "**Status**: PROPOSED" (/decision)
+DATE_FIELD_PATTERN = re.compile(r'\*\*Date(?::\*\*|\*\*:)[ \t]*(.*)')
+STATUS_FIELD_PATTERN = re.compile(r'\*\*Status(?::\*\*|\*\*:)[ \t]*(.*)')
+SUPERSEDED_PATTERN = re.compile(r'superseded\s+by\s*:?\s*\[?DEC-(\d+)', re.IGNORECASE)
+TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+# Title matches rank above body matches
+TITLE_WEIGHT = 3
+
+
+def decision_id(number):
+    """Format a decision number as DEC-NNN"""
+    return f"DEC-{int(number):03d}"
+
+
+def normalize_status(status):
+    """'PROPOSED' / 'accepted' -> 'Proposed' / 'Accepted' (the rest, e.g. 'by DEC-014', is kept)"""
+    return re.sub(r'^[A-Za-z]+', lambda m: m.group(0).capitalize(), status.strip())
+
+
+def tokenize(text):
+    """Lowercase alphanumeric tokens (single characters dropped)"""
+    return [t for t in TOKEN_PATTERN.findall(text.lower()) if len(t) > 1]
+
+
+def parse_decision(path):
+    """Parse one decision record into an index entry"""
+    content = path.read_text(encoding='utf-8')
+    number = int(DEC_FILE_PATTERN.match(path.name).group(1))
+
+    title_match = re.search(r'^# (.+)', content, re.MULTILINE)
+    title = title_match.group(1).strip() if title_match else path.stem
+    # "DEC-012: Material Selection" -> "Material Selection"
+    title = re.sub(r'^DEC-\d+\s*[:\-–]\s*', '', title)
+
+    date_match = DATE_FIELD_PATTERN.search(content)
+    status_match = STATUS_FIELD_PATTERN.search(content)
+    superseded_match = SUPERSEDED_PATTERN.search(content)
+
+    references = sorted({int(n) for n in DEC_REF_PATTERN.findall(content)} - {number})
+
+    return {
+        'number': number,
+        'id': decision_id(number),
+        'title': title,
+        'date': date_match.group(1).strip() if date_match else "",
+        'status': normalize_status(status_match.group(1)) if status_match and status_match.group(1).strip() else "Unknown",
+        'superseded_by': int(superseded_match.group(1)) if superseded_match else None,
+        'references': references,
+        'title_tokens': sorted(set(tokenize(title))),
+        'tokens': sorted(set(tokenize(content))),
+    }
+
+
+def load_index(path=INDEX_PATH):
+    """Load the stored index, or an empty one if missing or stale"""
+    try:
+        data = json.loads(Path(path).read_text(encoding='utf-8'))
+    except (OSError, json.JSONDecodeError):
+        data = None
+    if not data or data.get('format') != INDEX_FORMAT:
+        return {'format': INDEX_FORMAT, 'files': {}}
+    return data
+
+
+def update_index(decisions_dir=DECISIONS_DIR, path=INDEX_PATH, rebuild=False):
+    """
+    Bring the decision index up to date with docs/decisions
+
+    Files are re-parsed only when their mtime or size changed.
+    The index is only rewritten when something changed.
+
+    Returns:
+        list: Decision entries sorted by number
+    """
+    index = {'format': INDEX_FORMAT, 'files': {}} if rebuild else load_index(path)
+    files = index['files']
+    changed = rebuild
+
+    seen = set()
+    if Path(decisions_dir).is_dir():
+        with os.scandir(decisions_dir) as it:
+            for entry in it:
+                if not entry.is_file() or not DEC_FILE_PATTERN.match(entry.name):
+                    continue
+                seen.add(entry.name)
+                stat = entry.stat()
+                cached = files.get(entry.name)
+                if cached and cached['mtime_ns'] == stat.st_mtime_ns and cached['size'] == stat.st_size:
+                    continue
+                record = parse_decision(Path(entry.path))
+                record['file'] = str(Path(decisions_dir) / entry.name)
+                record['mtime_ns'] = stat.st_mtime_ns
+                record['size'] = stat.st_size
+                files[entry.name] = record
+                changed = True
+
+    for name in set(files) - seen:
+        del files[name]
+        changed = True
+
+    if changed:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(index, separators=(',', ':')), encoding='utf-8')
+        tmp_path.replace(path)
+
+    decisions = sorted(files.values(), key=lambda d: d['number'])
+    link_supersedes(decisions)
+    return decisions
+
+
+def link_supersedes(decisions):
+    """Fill in the reverse 'supersedes' links from 'superseded_by'"""
+    by_number = {d['number']: d for d in decisions}
+    for d in decisions:
+        d['supersedes'] = []
+    for d in decisions:
+        target = by_number.get(d['superseded_by'])
+        if target is not None:
+            target['supersedes'].append(d['number'])
+
+
+def build_postings(decisions):
+    """Build an inverted index token -> {position: weight}"""
+    postings = {}
+    for pos, d in enumerate(decisions):
+        for token in d['tokens']:
+            postings.setdefault(token, {})[pos] = 1
+        for token in d['title_tokens']:
+            postings.setdefault(token, {})[pos] = TITLE_WEIGHT
+    return postings
+
+
+def search(decisions, query, status=None, postings=None):
+    """
+    Find decisions containing every query term
+
+    Terms match whole tokens, or token prefixes when written with a trailing '*'.
+
+    Returns:
+        list: (score, decision) pairs, best first
+    """
+    if postings is None:
+        postings = build_postings(decisions)
+
+    scores = None
+    for term in query.lower().split():
+        if term.endswith('*'):
+            prefix = term[:-1]
+            matches = {}
+            for token, docs in postings.items():
+                if token.startswith(prefix):
+                    for pos, weight in docs.items():
+                        matches[pos] = max(matches.get(pos, 0), weight)
+        else:
+            tokens = tokenize(term)
+            if not tokens:
+                continue
+            matches = postings.get(tokens[0], {})
+            for token in tokens[1:]:
+                other = postings.get(token, {})
+                matches = {pos: w + other[pos] for pos, w in matches.items() if pos in other}
+
+        if scores is None:
+            scores = dict(matches)
+        else:
+            scores = {pos: s + matches[pos] for pos, s in scores.items() if pos in matches}
+        if not scores:
+            return []
+
+    if scores is None:
+        scores = {pos: 0 for pos in range(len(decisions))}
+
+    results = [(score, decisions[pos]) for pos, score in scores.items()]
+    if status:
+        results = [(s, d) for s, d in results if status.lower() in d['status'].lower()]
+    results.sort(key=lambda r: (-r[0], -r[1]['number']))
+    return results
+
+
+def format_decision(d):
+    """One-line summary of a decision"""
+    line = f"{d['id']}  [{d['status']}]  {d['title']}"
+    if d['date']:
+        line += f"  ({d['date']})"
+    if d['superseded_by'] is not None:
+        line += f"  -> superseded by {decision_id(d['superseded_by'])}"
+    return line
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Index and search decision records")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    search_parser = sub.add_parser("search", help="Full-text search (all terms must match, 'term*' for prefix)")
+    search_parser.add_argument("terms", nargs="+", help="Search terms")
+    search_parser.add_argument("--status", help="Only decisions whose status contains this text")
+    search_parser.add_argument("--limit", type=int, default=20, help="Maximum results to show")
+
+    list_parser = sub.add_parser("list", help="List all decisions")
+    list_parser.add_argument("--status", help="Only decisions whose status contains this text")
+
+    show_parser = sub.add_parser("show", help="Show one decision and its links")
+    show_parser.add_argument("id", help="Decision id (DEC-012 or 12)")
+
+    sub.add_parser("rebuild", help="Re-parse every decision record")
+
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    decisions = update_index(rebuild=args.command == "rebuild")
+
+    if args.command == "rebuild":
+        print(f"Indexed {len(decisions)} decisions ({INDEX_PATH})")
+
+    elif args.command == "search":
+        results = search(decisions, " ".join(args.terms), status=args.status)
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        for _, d in results[:args.limit]:
+            print(format_decision(d))
+            print(f"    {d['file']}")
+        print(f"\n{len(results)} of {len(decisions)} decisions matched ({elapsed_ms:.1f} ms)")
+
+    elif args.command == "list":
+        for d in decisions:
+            if not args.status or args.status.lower() in d['status'].lower():
+                print(format_decision(d))
+
+    elif args.command == "show":
+        id_match = re.fullmatch(r'(?:DEC-)?(\d+)', args.id.strip(), flags=re.IGNORECASE)
+        if not id_match:
+            print(f"ERROR: '{args.id}' is not a decision id (expected DEC-NNN or NNN)")
+            sys.exit(1)
+        number = int(id_match.group(1))
+        match = next((d for d in decisions if d['number'] == number), None)
+        if match is None:
+            print(f"ERROR: {decision_id(number)} not found in {DECISIONS_DIR}")
+            sys.exit(1)
+        print(format_decision(match))
+        print(f"  File: {match['file']}")
+        if match['supersedes']:
+            print(f"  Supersedes: {', '.join(decision_id(n) for n in match['supersedes'])}")
+        if match['references']:
+            print(f"  References: {', '.join(decision_id(n) for n in match['references'])}")
+        referenced_by = [d['id'] for d in decisions if number in d['references']]
+        if referenced_by:
+            print(f"  Referenced by: {', '.join(referenced_by)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -9,6 +9,7 @@ Output: dashboard.html (open in browser)
 
 import sys
 import os
+import html as html_lib
 from pathlib import Path
 from datetime import datetime
 import re
@@ -17,14 +18,8 @@ import re
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
-def read_context_md():
-    """Extract key info from CONTEXT.md"""
-    context_path = Path("CONTEXT.md")
-    if not context_path.exists():
-        return {}
-
-    content = context_path.read_text(encoding='utf-8')
-
+def parse_context_md(content):
+    """Extract key info from CONTEXT.md content"""
     # Extract current phase
     phase_match = re.search(r'\*\*Current Phase:\*\* (.+)', content)
     phase = phase_match.group(1) if phase_match else "Unknown"
@@ -47,90 +42,182 @@ def read_context_md():
     }
 
 
-def read_critical_parameters():
-    """Extract critical parameters from CONTEXT.md"""
-    context_path = Path("CONTEXT.md")
-    if not context_path.exists():
+def parse_table_section(content, heading, keys):
+    """Extract rows of the markdown table under a `## heading` as dicts"""
+    section = re.search(rf'## {re.escape(heading)}\n\n(.+?)(?=\n\n##)', content, re.DOTALL)
+    if not section:
         return []
 
-    content = context_path.read_text(encoding='utf-8')
-
-    # Find parameters table
-    params_section = re.search(r'## Critical Parameters\n\n(.+?)(?=\n\n##)', content, re.DOTALL)
-    if not params_section:
-        return []
-
-    table_text = params_section.group(1)
+    table_text = section.group(1)
     lines = table_text.strip().split('\n')[2:]  # Skip header and separator
 
-    parameters = []
+    rows = []
     for line in lines:
         if '|' in line:
             parts = [p.strip() for p in line.split('|')[1:-1]]
-            if len(parts) >= 3:
-                parameters.append({
-                    'name': parts[0],
-                    'value': parts[1],
-                    'source': parts[2]
-                })
+            if len(parts) >= len(keys):
+                rows.append(dict(zip(keys, parts)))
 
-    return parameters
+    return rows
 
 
-def read_system_status():
-    """Extract system status from CONTEXT.md"""
-    context_path = Path("CONTEXT.md")
-    if not context_path.exists():
-        return []
-
-    content = context_path.read_text(encoding='utf-8')
+def parse_critical_parameters(content):
+    """Extract critical parameters from CONTEXT.md content"""
+    return parse_table_section(content, 'Critical Parameters', ('name', 'value', 'source'))
 
-    # Find system status table
-    status_section = re.search(r'## System Status\n\n(.+?)(?=\n\n##)', content, re.DOTALL)
-    if not status_section:
-        return []
 
-    table_text = status_section.group(1)
-    lines = table_text.strip().split('\n')[2:]  # Skip header and separator
+def parse_system_status(content):
+    """Extract system status from CONTEXT.md content"""
+    return parse_table_section(content, 'System Status', ('name', 'status', 'documentation'))
 
-    systems = []
-    for line in lines:
-        if '|' in line:
-            parts = [p.strip() for p in line.split('|')[1:-1]]
-            if len(parts) >= 3:
-                systems.append({
-                    'name': parts[0],
-                    'status': parts[1],
-                    'documentation': parts[2]
-                })
 
-    return systems
+def read_context_text():
+    """Read CONTEXT.md from the current directory ('' if missing)"""
+    context_path = Path("CONTEXT.md")
+    if not context_path.exists():
+        return ""
+    return context_path.read_text(encoding='utf-8')
 
 
-def read_recent_decisions():
-    """Read recent decision files"""
-    decisions_dir = Path("docs/decisions")
-    if not decisions_dir.exists():
-        return []
+def read_context_md():
+    """Extract key info from CONTEXT.md"""
+    content = read_context_text()
+    return parse_context_md(content) if content else {}
 
-    decision_files = sorted(decisions_dir.glob("DEC-*.md"), reverse=True)[:5]
 
-    decisions = []
-    for df in decision_files:
-        content = df.read_text(encoding='utf-8')
-        title_match = re.search(r'^# (.+)', content, re.MULTILINE)
-        title = title_match.group(1) if title_match else df.stem
+def read_critical_parameters():
+    """Extract critical parameters from CONTEXT.md"""
+    return parse_critical_parameters(read_context_text())
 
-        decisions.append({
-            'number': df.stem,
-            'title': title,
-            'file': str(df)
-        })
 
-    return decisions
+def read_system_status():
+    """Extract system status from CONTEXT.md"""
+    return parse_system_status(read_context_text())
+
+
+def read_registry_parameters():
+    """
+    Parameters from the project_params.py registry (single source of truth)
+
+    Returns the critical parameters (all parameters if none are marked
+    critical) in the same shape as read_critical_parameters, or [] if the
+    project has no parameters yet or project_params.py does not parse.
+    """
+    from param_registry import load_registry
+    try:
+        registry = load_registry(Path("project_params.py"))
+    except (SyntaxError, ValueError) as e:
+        # Half-edited file - fall back to the CONTEXT.md table rather than failing
+        print(f"WARNING: project_params.py does not parse ({e}) - using CONTEXT.md parameters")
+        return []
+    params = [p for p in registry.critical() or tuple(registry)
+              if p.name not in ('PROJECT_NAME', 'PROJECT_DESCRIPTION')]
+    return [{
+        'name': p.name,
+        'value': p.format_value(),
+        'source': p.source or p.category,
+        'raw_value': p.value,
+    } for p in params]
+
+
+def find_parameter_drift(context_params, registry_params):
+    """List CONTEXT.md table rows whose value disagrees with project_params.py"""
+    registry_values = {p['name']: p['raw_value'] for p in registry_params}
+    drift = []
+    for row in context_params:
+        if row['name'] not in registry_values:
+            continue
+        expected = registry_values[row['name']]
+        number = re.match(r'\s*([-+]?[0-9]*\.?[0-9]+(?:[eE][-+]?[0-9]+)?)', row['value'].replace(',', ''))
+        if isinstance(expected, (int, float)) and number:
+            matches = abs(float(number.group(1)) - expected) <= 1e-9 * max(1.0, abs(expected))
+        else:
+            matches = str(expected) in row['value']
+        if not matches:
+            drift.append(f"{row['name']}: CONTEXT.md says {row['value']}, project_params.py has {expected}")
+    return drift
+
+
+def read_decisions():
+    """Read all decision records through the incremental decision index"""
+    from decisions import update_index
+    return sorted(update_index(), key=lambda d: d['number'], reverse=True)
+
+
+def render_timeline(events, limit=12):
+    """Render CONTEXT.md timeline events (newest first) as HTML rows"""
+    rows = []
+    for event in reversed(events[-limit:]):
+        date = datetime.fromtimestamp(event['time']).strftime('%Y-%m-%d')
+        changes = ''.join(f'<li>{html_lib.escape(c)}</li>' for c in event['changes'])
+        rows.append(f'''<tr>
+                        <td style="color: var(--text-dim);">{date}<br><code>{event['commit'][:8]}</code></td>
+                        <td><strong>{html_lib.escape(event['phase'])}</strong></td>
+                        <td><ul class="timeline-changes">{changes}</ul><span style="color: var(--text-dim);">{html_lib.escape(event['subject'])}</span></td>
+                    </tr>''')
+    return ' '.join(rows) or '<tr><td colspan="3" style="color: var(--text-dim);">No CONTEXT.md history indexed</td></tr>'
+
+
+def render_decisions(decisions):
+    """Render decision records as searchable HTML rows"""
+    rows = []
+    for d in decisions:
+        status_lower = d['status'].lower()
+        if 'accepted' in status_lower:
+            css_class = 'status-complete'
+        elif 'proposed' in status_lower:
+            css_class = 'status-progress'
+        elif 'superseded' in status_lower or 'deprecated' in status_lower:
+            css_class = 'status-pending'
+        else:
+            css_class = 'status-blocked'
+        superseded = f' &rarr; DEC-{d["superseded_by"]:03d}' if d['superseded_by'] is not None else ''
+        search_text = html_lib.escape(' '.join([d['id'], d['title'], d['status'], ' '.join(d['tokens'])]).lower(), quote=True)
+        rows.append(f'''<tr data-search="{search_text}">
+                        <td><a href="{html_lib.escape(d['file'].replace(os.sep, '/'))}" style="color: var(--secondary);">{d['id']}</a></td>
+                        <td><strong>{html_lib.escape(d['title'])}</strong></td>
+                        <td style="color: var(--text-dim);">{html_lib.escape(d['date'])}</td>
+                        <td><span class="status-badge {css_class}">{html_lib.escape(d['status'])}</span>{superseded}</td>
+                    </tr>''')
+    return ' '.join(rows) or '<tr><td colspan="4" style="color: var(--text-dim);">No decision records</td></tr>'
+
+
+def read_bom():
+    """Roll-up totals of manufacturing/bom.md (None if the project has no BOM yet)"""
+    from bom import bom_totals
+    return bom_totals(Path("manufacturing") / "bom.md")
+
+
+def render_bom(bom):
+    """Render BOM roll-ups as a telemetry panel"""
+    if not bom or not bom['lines']:
+        return ''
+    cost = f"{bom['currency']}{bom['cost']:,.0f}" if bom['cost'] is not None else '&mdash;'
+    in_hand_pct = int(bom['status']['In hand'] / bom['lines'] * 100)
+    metrics = [('Line Items', bom['lines']), ('Est. Cost', cost), ('On Order', bom['status']['On order']),
+               ('In Hand', f"{bom['status']['In hand']} ({in_hand_pct}%)")]
+    rows = ''.join(f'''
+                <div class="metric">
+                    <span class="metric-label">{label}</span>
+                    <span class="metric-value">{value}</span>
+                </div>''' for label, value in metrics)
+    return f'''<div class="panel">
+                <h2>// Bill of Materials</h2>{rows}
+            </div>'''
+
+
+def read_timeline():
+    """Update the git-backed CONTEXT.md timeline and return its events"""
+    import subprocess
+    from context_timeline import update_timeline, timeline_events
+    try:
+        return timeline_events(update_timeline())
+    except (subprocess.CalledProcessError, OSError):
+        # Not a git repository, no commits yet, or git unavailable
+        return []
 
 
-def generate_html(context_info, parameters, systems, decisions):
+def generate_html(context_info, parameters, systems, decisions, timeline=None, parameter_drift=None, bom=None):
     """Generate the HTML dashboard with aerospace engineering aesthetic"""
 
     # Calculate completion metrics
@@ -598,6 +685,31 @@ def generate_html(context_info, parameters, systems, decisions):
         .glow {{
             animation: flicker 3s ease-in-out infinite;
         }}
+
+        .search-input {{
+            width: 100%;
+            background: var(--bg-dark);
+            border: 1px solid var(--border);
+            color: var(--text);
+            font-family: 'JetBrains Mono', monospace;
+            padding: 0.75rem 1rem;
+            margin-bottom: 1rem;
+        }}
+
+        .search-input:focus {{
+            outline: none;
+            border-color: var(--primary);
+        }}
+
+        .timeline-changes {{
+            list-style: none;
+            font-size: 0.8rem;
+        }}
+
+        .timeline-changes li::before {{
+            content: '\\0394  ';
+            color: var(--secondary);
+        }}
     </style>
 </head>
 <body>
@@ -658,6 +770,8 @@ def generate_html(context_info, parameters, systems, decisions):
                     <a href="calculations/" class="quick-link">CALCS</a>
                 </div>
             </div>
+
+            {render_bom(bom)}
         </div>
 
         <div class="panel wide">
@@ -680,6 +794,8 @@ def generate_html(context_info, parameters, systems, decisions):
             </table>
         </div>
 
+        {'<div class="alert"><strong>⚠ PARAMETER DRIFT:</strong> ' + '; '.join(html_lib.escape(d) for d in parameter_drift) + '</div>' if parameter_drift else ''}
+
         <div class="panel wide">
             <h2>// Critical Parameters</h2>
             <table>
@@ -700,10 +816,53 @@ def generate_html(context_info, parameters, systems, decisions):
             </table>
         </div>
 
+        <div class="panel wide">
+            <h2>// Decision Records ({len(decisions)})</h2>
+            <input id="decision-search" class="search-input" type="search" placeholder="Filter decisions (all terms must match)...">
+            <table id="decision-table">
+                <thead>
+                    <tr>
+                        <th>ID</th>
+                        <th>Title</th>
+                        <th>Date</th>
+                        <th>Status</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {render_decisions(decisions)}
+                </tbody>
+            </table>
+        </div>
+
+        <div class="panel wide">
+            <h2>// Context Timeline</h2>
+            <table>
+                <thead>
+                    <tr>
+                        <th>Date</th>
+                        <th>Phase</th>
+                        <th>Changes</th>
+                    </tr>
+                </thead>
+                <tbody>
+                    {render_timeline(timeline or [])}
+                </tbody>
+            </table>
+        </div>
+
         <div class="timestamp">
             TELEMETRY TIMESTAMP // {datetime.now().strftime('%Y-%m-%d %H:%M:%S UTC')}
         </div>
     </div>
+    <script>
+        document.getElementById('decision-search').addEventListener('input', function () {{
+            const terms = this.value.toLowerCase().split(/\\s+/).filter(Boolean);
+            document.querySelectorAll('#decision-table tbody tr[data-search]').forEach(function (row) {{
+                const text = row.dataset.search;
+                row.style.display = terms.every(function (t) {{ return text.includes(t); }}) ? '' : 'none';
+            }});
+        }});
+    </script>
 </body>
 </html>"""
 
@@ -732,12 +891,16 @@ def main():
 
     # Read all data
     context_info = read_context_md()
-    parameters = read_critical_parameters()
+    context_parameters = read_critical_parameters()
+    parameters = read_registry_parameters() or context_parameters
+    parameter_drift = find_parameter_drift(context_parameters, parameters) if parameters is not context_parameters else []
     systems = read_system_status()
-    decisions = read_recent_decisions()
+    decisions = read_decisions()
+    timeline = read_timeline()
+    bom = read_bom()
 
     # Generate HTML
-    html = generate_html(context_info, parameters, systems, decisions)
+    html = generate_html(context_info, parameters, systems, decisions, timeline, parameter_drift, bom)
 
     # Write to file
     output_path = Path("dashboard.html")
@@ -746,6 +909,12 @@ def main():
     print(f"Dashboard generated: {output_path.absolute()}")
     print(f"   Systems: {len(systems)}")
     print(f"   Parameters: {len(parameters)}")
+    if parameter_drift:
+        print(f"   WARNING: {len(parameter_drift)} CONTEXT.md parameters disagree with project_params.py")
+    print(f"   Decisions: {len(decisions)}")
+    print(f"   Timeline events: {len(timeline)}")
+    if bom:
+        print(f"   BOM lines: {bom['lines']}")
     print(f"   Completion: {int((sum(1 for s in systems if 'concept' in s['status'].lower() or 'complete' in s['status'].lower()) / len(systems) * 100)) if systems else 0}%")
 
 
@@ -0,0 +1,271 @@
+#!/usr/bin/env python3
+"""
+Markdown Link Graph
+
+Indexes the links between the project's markdown files - inline links,
+reference-style links, [[wiki links]] and bare DEC-NNN mentions - and keeps
+forward links and backlinks in one compact store. Only files whose mtime or
+size changed since the last run are re-parsed, so queries answer instantly.
+
+Run:
+    python scripts/link_graph.py refs DEC-012             # what links to / mentions a doc
+    python scripts/link_graph.py refs docs/systems/compressor.md
+    python scripts/link_graph.py links docs/index.md      # what a doc links to
+    python scripts/link_graph.py orphans                  # docs/ files nothing links to
+    python scripts/link_graph.py broken                   # links to files that do not exist
+    python scripts/link_graph.py rebuild
+Store: .toolkit-cache/link-graph.json (safe to delete, rebuilt on demand)
+"""
+
+import argparse
+import json
+import os
+import re
+import sys
+import time
+from pathlib import Path
+from urllib.parse import unquote
+
+from decisions import DEC_FILE_PATTERN, DEC_REF_PATTERN
+from param_registry import PROJECT_ROOT
+
+INDEX_PATH = PROJECT_ROOT / ".toolkit-cache" / "link-graph.json"
+INDEX_FORMAT = 1
+DECISIONS_DIR = "docs/decisions"
+SKIP_DIRS = {"node_modules", "venv", "env", "__pycache__"}
+
+# Entry points that are read directly, not reached through links
+ROOT_DOCS = {"README.md", "CONTEXT.md", "CLAUDE.md", "WORKFLOW.md", "TODO.md", "index.md"}
+
+INLINE_LINK = re.compile(r'!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+REFERENCE_DEF = re.compile(r'^\s{0,3}\[[^\]]+\]:\s*<?(\S+?)>?(?:\s+["(].*)?$', re.MULTILINE)
+WIKI_LINK = re.compile(r'\[\[([^\]|#]+)(?:#[^\]|]*)?(?:\|[^\]]*)?\]\]')
+FENCE = re.compile(r'^(```|~~~).*?^\1', re.MULTILINE | re.DOTALL)
+EXTERNAL = re.compile(r'^[a-z][a-z0-9+.-]*:', re.IGNORECASE)   # http:, mailto:, ...
+
+LINK, MENTION = "l", "m"
+
+
+def find_markdown(root: Path = PROJECT_ROOT) -> dict:
+    """{relative posix path: os.stat_result} of every .md file outside hidden and tool directories."""
+    found = {}
+    for dirpath, dirs, filenames in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS)
+        for filename in filenames:
+            if filename.endswith(".md"):
+                path = Path(dirpath) / filename
+                found[path.relative_to(root).as_posix()] = path.stat()
+    return found
+
+
+def resolve(source: str, target: str):
+    """A link target as written in `source` -> project-relative posix path, or None if external/anchor-only."""
+    target = unquote(target.split("#", 1)[0].split("?", 1)[0])
+    if not target or EXTERNAL.match(target):
+        return None
+    if target.startswith("/"):
+        path = Path(target.lstrip("/"))
+    else:
+        path = Path(source).parent / target
+    parts = []
+    for part in path.parts:
+        if part == "..":
+            if parts:
+                parts.pop()
+        elif part != ".":
+            parts.append(part)
+    return "/".join(parts) or "."
+
+
+def parse_links(source: str, text: str) -> list:
+    """[[target, kind], ...] of one file, deduplicated; kind is LINK or MENTION (a bare DEC-NNN)."""
+    text = FENCE.sub("", text)
+    links = {}
+    for pattern in (INLINE_LINK, REFERENCE_DEF):
+        for match in pattern.finditer(text):
+            target = resolve(source, match.group(1))
+            if target is not None:
+                links[target] = LINK
+    for match in WIKI_LINK.finditer(text):
+        name = match.group(1).strip()
+        target = resolve(source, name if name.endswith(".md") else name + ".md")
+        if target is not None:
+            links.setdefault(target, LINK)
+    for number in {int(n) for n in DEC_REF_PATTERN.findall(text)}:
+        links.setdefault(f"DEC-{number:03d}", MENTION)
+    return [[target, kind] for target, kind in sorted(links.items())]
+
+
+def load_index(path=INDEX_PATH) -> dict:
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+    except (OSError, json.JSONDecodeError):
+        data = None
+    if not data or data.get("format") != INDEX_FORMAT:
+        return {"format": INDEX_FORMAT, "files": {}, "backlinks": {}}
+    return data
+
+
+def decision_files(files) -> dict:
+    """DEC-012 -> docs/decisions/DEC-012-material-selection.md for every indexed decision record."""
+    found = {}
+    for name in files:
+        if name.startswith(DECISIONS_DIR + "/"):
+            match = DEC_FILE_PATTERN.match(name.rsplit("/", 1)[1])
+            if match:
+                found[f"DEC-{int(match.group(1)):03d}"] = name
+    return found
+
+
+def build_backlinks(files: dict) -> dict:
+    """{target: [[source, kind], ...]} with DEC-NNN mentions resolved to the decision file."""
+    decisions = decision_files(files)
+    backlinks = {}
+    for source, record in files.items():
+        for target, kind in record["links"]:
+            target = decisions.get(target, target)
+            if target != source:
+                backlinks.setdefault(target, []).append([source, kind])
+    for sources in backlinks.values():
+        sources.sort()
+    return backlinks
+
+
+def update_index(path=INDEX_PATH, root: Path = PROJECT_ROOT, rebuild: bool = False) -> dict:
+    """
+    Bring the link graph up to date with the project's markdown.
+
+    Files are re-parsed only when their mtime or size changed; backlinks are
+    rebuilt and the store rewritten only when something changed.
+
+    Returns:
+        dict: {"files": {path: {"links", ...}}, "backlinks": {target: [[source, kind], ...]}}
+    """
+    index = {"format": INDEX_FORMAT, "files": {}, "backlinks": {}} if rebuild else load_index(path)
+    files = index["files"]
+    changed = rebuild
+
+    current = find_markdown(root)
+    for name, stat in current.items():
+        cached = files.get(name)
+        if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+            continue
+        try:
+            text = (root / name).read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        files[name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "links": parse_links(name, text)}
+        changed = True
+    for name in set(files) - set(current):
+        del files[name]
+        changed = True
+
+    if changed:
+        index["backlinks"] = build_backlinks(files)
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(index, separators=(",", ":")), encoding="utf-8")
+        os.replace(tmp_path, path)
+    return index
+
+
+def normalize_target(index: dict, query: str, root: Path = PROJECT_ROOT) -> str:
+    """DEC-12 / a path (absolute, relative to cwd or to the project) / a unique file name -> indexed key."""
+    match = re.fullmatch(r'(?:DEC-)?(\d+)', query.strip(), re.IGNORECASE)
+    if match:
+        number = f"DEC-{int(match.group(1)):03d}"
+        return decision_files(index["files"]).get(number, number)
+    path = Path(query).resolve()
+    if path.exists():
+        try:
+            return path.relative_to(root).as_posix()
+        except ValueError:
+            pass
+    query = query.strip("/")
+    if query in index["files"] or query in index["backlinks"]:
+        return query
+    candidates = [name for name in index["files"] if name.rsplit("/", 1)[-1] in (query, query + ".md")]
+    if len(candidates) == 1:
+        return candidates[0]
+    if len(candidates) > 1:
+        raise KeyError(f"'{query}' is ambiguous: {', '.join(sorted(candidates))}")
+    return query
+
+
+def orphans(index: dict, under: str = "docs/") -> list:
+    """Markdown files under a directory that nothing links to or mentions."""
+    linked = set(index["backlinks"])
+    # A link to a directory reaches its README.md / index.md
+    for target in list(linked):
+        linked.update({f"{target}/README.md", f"{target}/index.md"})
+    return sorted(name for name in index["files"]
+                  if name.startswith(under) and name not in linked and name.rsplit("/", 1)[-1] not in ROOT_DOCS)
+
+
+def broken_links(index: dict, root: Path = PROJECT_ROOT) -> list:
+    """(source, target) for links whose target is not an indexed file or an existing path."""
+    broken = []
+    for source, record in sorted(index["files"].items()):
+        for target, kind in record["links"]:
+            if kind == LINK and target not in index["files"] and not (root / target).exists():
+                broken.append((source, target))
+    return broken
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Query links and backlinks between project markdown files")
+    sub = parser.add_subparsers(dest="command", required=True)
+    refs_parser = sub.add_parser("refs", help="Files that link to or mention a doc")
+    refs_parser.add_argument("target", help="DEC-012, a path, or a unique file name")
+    links_parser = sub.add_parser("links", help="Files a doc links to")
+    links_parser.add_argument("source", help="A path or a unique file name")
+    orphans_parser = sub.add_parser("orphans", help="Docs nothing links to")
+    orphans_parser.add_argument("--under", default="docs/", help="Directory to check (default: docs/)")
+    sub.add_parser("broken", help="Links to files that do not exist")
+    sub.add_parser("rebuild", help="Re-parse every markdown file")
+
+    args = parser.parse_args()
+    start = time.perf_counter()
+    index = update_index(rebuild=args.command == "rebuild")
+
+    try:
+        if args.command == "refs":
+            target = normalize_target(index, args.target)
+            # A file that both links to and mentions the target is one referencing file
+            sources = {}
+            for source, kind in index["backlinks"].get(target, []):
+                sources.setdefault(source, set()).add(kind)
+            for source, kinds in sources.items():
+                print(f"  {source}" + ("  (mention)" if kinds == {MENTION} else ""))
+            print(f"\n{len(sources)} files reference {target}")
+        elif args.command == "links":
+            source = normalize_target(index, args.source)
+            if source not in index["files"]:
+                print(f"ERROR: {source} is not an indexed markdown file")
+                sys.exit(1)
+            decisions = decision_files(index["files"])
+            for target, kind in index["files"][source]["links"]:
+                target = decisions.get(target, target)
+                if target != source:
+                    print(f"  {target}" + ("  (mention)" if kind == MENTION else ""))
+        elif args.command == "orphans":
+            found = orphans(index, args.under.rstrip("/") + "/")
+            for name in found:
+                print(f"  {name}")
+            print(f"\n{len(found)} orphaned files under {args.under}")
+        elif args.command == "broken":
+            found = broken_links(index)
+            for source, target in found:
+                print(f"  {source} -> {target}")
+            print(f"\n{len(found)} broken links")
+        elif args.command == "rebuild":
+            print(f"Indexed {len(index['files'])} markdown files ({INDEX_PATH})")
+    except KeyError as e:
+        print(f"ERROR: {e.args[0]}")
+        sys.exit(1)
+    print(f"({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
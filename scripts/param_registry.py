@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Parameter Registry
+
+Loads project_params.py - the single source of truth for design parameters -
+into an immutable registry with units, tolerances, sources and categories,
+for the dashboard, notebooks and other scripts.
+
+Metadata comes from the trailing comment of each assignment:
+
+    SHAFT_DIAMETER_MM = 10.0  # mm | tol: ±0.01 | source: DEC-003 | critical
+
+    - first field: unit (may be empty, "-" for dimensionless)
+    - tol: / tolerance:  absolute (±0.01) or relative (±2%)
+    - source: / src:     where the value comes from
+    - critical           show on the dashboard's Critical Parameters panel
+
+Categories come from the "# ===== / # SECTION NAME / # =====" banners.
+
+The file is parsed, not imported, and the parsed registry is cached in
+.toolkit-cache/param-registry.bin keyed by the file's sha256, so repeat
+loads skip parsing entirely.
+
+Run:
+    python scripts/param_registry.py            # list parameters
+    python scripts/param_registry.py --critical # only critical ones
+
+In a notebook (calculations/<system>/):
+    sys.path.append('../../scripts')
+    from param_registry import load_registry
+    P = load_registry()
+    P['SHAFT_DIAMETER_MM'].value, P['SHAFT_DIAMETER_MM'].unit
+"""
+
+import ast
+import hashlib
+import io
+import marshal
+import math
+import os
+import re
+import sys
+import tokenize
+from pathlib import Path
+from types import MappingProxyType
+from typing import NamedTuple, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+PARAMS_PATH = PROJECT_ROOT / "project_params.py"
+CACHE_PATH = PROJECT_ROOT / ".toolkit-cache" / "param-registry.bin"
+CACHE_FORMAT = 2
+
+SECTION_RULE = re.compile(r'^#\s*={5,}\s*$')
+SECTION_TITLE = re.compile(r'^#\s*([A-Z0-9][A-Z0-9 &/()\-]+?)\s*$')
+TOLERANCE_PATTERN = re.compile(r'^(?:±|\+/-|\+-)?\s*((?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?)\s*(%?)$')
+
+EVAL_GLOBALS = {"__builtins__": {"abs": abs, "min": min, "max": max, "round": round}}
+# Modules a derived expression may use - only once project_params.py imports them itself
+# (e.g. `import math` then AREA = math.pi * R**2), so the registry fails where the import would
+EXPRESSION_MODULES = {"math": math}
+
+
+class Parameter(NamedTuple):
+    """One entry of project_params.py."""
+    name: str
+    value: object
+    unit: str = ""
+    tolerance: Optional[float] = None   # Absolute, in the parameter's unit
+    rel_tolerance: Optional[float] = None  # Fraction (0.02 for ±2%)
+    source: str = ""
+    category: str = ""
+    critical: bool = False
+    expression: str = ""                # Source text when the value is derived
+    depends: tuple = ()                 # Parameters referenced by the expression
+    line: int = 0
+
+    def format_value(self) -> str:
+        """Value with unit and tolerance, e.g. '10.0 mm ±0.01'."""
+        text = f"{self.value:g}" if isinstance(self.value, float) else str(self.value)
+        if self.unit and self.unit != "-":
+            text += f" {self.unit}"
+        if self.tolerance is not None:
+            text += f" ±{self.tolerance:g}"
+        elif self.rel_tolerance is not None:
+            text += f" ±{self.rel_tolerance * 100:g}%"
+        return text
+
+
+class ParameterRegistry:
+    """Immutable, ordered collection of parameters with lookup by name."""
+
+    __slots__ = ("_params", "_index", "digest")
+
+    def __init__(self, params, digest=""):
+        object.__setattr__(self, "_params", tuple(params))
+        object.__setattr__(self, "_index", MappingProxyType({p.name: i for i, p in enumerate(self._params)}))
+        object.__setattr__(self, "digest", digest)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("ParameterRegistry is immutable")
+
+    def __getitem__(self, name) -> Parameter:
+        return self._params[self._index[name]]
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def __iter__(self):
+        return iter(self._params)
+
+    def __len__(self) -> int:
+        return len(self._params)
+
+    def get(self, name, default=None):
+        index = self._index.get(name)
+        return default if index is None else self._params[index]
+
+    def value(self, name):
+        """Shortcut for registry[name].value."""
+        return self[name].value
+
+    def names(self) -> tuple:
+        return tuple(self._index)
+
+    def critical(self) -> tuple:
+        return tuple(p for p in self._params if p.critical)
+
+    def by_category(self) -> dict:
+        categories = {}
+        for p in self._params:
+            categories.setdefault(p.category, []).append(p)
+        return categories
+
+    def as_dict(self) -> dict:
+        """{name: value}, e.g. for string formatting or DataFrame construction."""
+        return {p.name: p.value for p in self._params}
+
+
+def parse_metadata(comment: str) -> dict:
+    """Parse '# unit | tol: ±x | source: y | critical' into fields."""
+    fields = [f.strip() for f in comment.lstrip("#").split("|")]
+    meta = {"unit": fields[0] if fields else ""}
+    for field in fields[1:]:
+        key, sep, value = field.partition(":")
+        key, value = key.strip().lower(), value.strip()
+        if not sep and key == "critical":
+            meta["critical"] = True
+        elif key in ("tol", "tolerance"):
+            match = TOLERANCE_PATTERN.match(value.replace(" ", ""))
+            if match:
+                number = float(match.group(1))
+                if match.group(2):
+                    meta["rel_tolerance"] = number / 100
+                else:
+                    meta["tolerance"] = number
+        elif key in ("source", "src"):
+            meta["source"] = value
+    return meta
+
+
+def read_comments(source: str) -> tuple:
+    """Return ({line: trailing comment}, {line: full-line comment})."""
+    trailing, full_line = {}, {}
+    code_lines = set()
+    for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+        if tok.type == tokenize.COMMENT:
+            line = tok.start[0]
+            (trailing if line in code_lines else full_line)[line] = tok.string
+        elif tok.type not in (tokenize.NL, tokenize.NEWLINE, tokenize.INDENT, tokenize.DEDENT,
+                              tokenize.ENCODING, tokenize.ENDMARKER):
+            code_lines.update(range(tok.start[0], tok.end[0] + 1))
+    return trailing, full_line
+
+
+def section_titles(full_line: dict) -> dict:
+    """Map the line of each '# =====' banner title to its category name."""
+    titles = {}
+    for line, comment in full_line.items():
+        title = SECTION_TITLE.match(comment)
+        if title and SECTION_RULE.match(full_line.get(line - 1, "")):
+            titles[line] = title.group(1).strip().title()
+    return titles
+
+
+def imported_names(node) -> dict:
+    """Names an import statement binds to EXPRESSION_MODULES or their attributes ({} for other modules)."""
+    names = {}
+    if isinstance(node, ast.Import):
+        for alias in node.names:
+            if alias.name in EXPRESSION_MODULES:
+                names[alias.asname or alias.name] = EXPRESSION_MODULES[alias.name]
+    elif isinstance(node, ast.ImportFrom) and node.module in EXPRESSION_MODULES and not node.level:
+        module = EXPRESSION_MODULES[node.module]
+        for alias in node.names:
+            if alias.name == "*":
+                names.update({k: v for k, v in vars(module).items() if not k.startswith("_")})
+            elif hasattr(module, alias.name):
+                names[alias.asname or alias.name] = getattr(module, alias.name)
+    return names
+
+
+def parse_params(source: str, filename: str = "project_params.py") -> list:
+    """Parse module-level assignments of project_params.py source into Parameters."""
+    tree = ast.parse(source, filename)
+    trailing, full_line = read_comments(source)
+    titles = sorted(section_titles(full_line).items())
+
+    namespace = {}
+    eval_globals = dict(EVAL_GLOBALS)
+    params = []
+    for node in tree.body:
+        if isinstance(node, (ast.Import, ast.ImportFrom)):
+            eval_globals.update(imported_names(node))
+            continue
+        if isinstance(node, ast.Assign) and len(node.targets) == 1 and isinstance(node.targets[0], ast.Name):
+            target, value_node = node.targets[0].id, node.value
+        elif isinstance(node, ast.AnnAssign) and isinstance(node.target, ast.Name) and node.value is not None:
+            target, value_node = node.target.id, node.value
+        else:
+            continue
+        if target.startswith("_"):
+            continue
+
+        try:
+            value = ast.literal_eval(value_node)
+            expression = ""
+        except (ValueError, SyntaxError):
+            expression = ast.get_source_segment(source, value_node) or ""
+            try:
+                value = eval(compile(ast.Expression(value_node), filename, "eval"), eval_globals, dict(namespace))
+            except Exception:
+                value = None
+        namespace[target] = value
+
+        depends = tuple(sorted({n.id for n in ast.walk(value_node)
+                                if isinstance(n, ast.Name) and n.id in namespace and n.id != target}))
+        category = ""
+        for line, title in titles:
+            if line < node.lineno:
+                category = title
+
+        comment = trailing.get(node.end_lineno) or trailing.get(node.lineno, "")
+        meta = parse_metadata(comment) if comment else {}
+        params.append(Parameter(
+            name=target,
+            value=value,
+            unit=meta.get("unit", ""),
+            tolerance=meta.get("tolerance"),
+            rel_tolerance=meta.get("rel_tolerance"),
+            source=meta.get("source", ""),
+            category=category,
+            critical=meta.get("critical", False),
+            expression=expression,
+            depends=depends,
+            line=node.lineno,
+        ))
+    return params
+
+
+def load_registry(params_path=None, cache_path=None, use_cache: bool = True) -> ParameterRegistry:
+    """
+    Load the parameter registry for project_params.py.
+
+    Args:
+        params_path: Path to project_params.py (default: project root)
+        cache_path: Serialized registry cache (default: .toolkit-cache/param-registry.bin)
+        use_cache: Reuse/write the cache keyed by the file's sha256
+
+    Returns:
+        ParameterRegistry: Empty if project_params.py does not exist
+    """
+    params_path = Path(params_path) if params_path else PARAMS_PATH
+    if cache_path:
+        cache_path = Path(cache_path)
+    else:
+        cache_path = CACHE_PATH if params_path.resolve() == PARAMS_PATH else \
+            params_path.resolve().parent / ".toolkit-cache" / "param-registry.bin"
+
+    try:
+        raw = params_path.read_bytes()
+    except FileNotFoundError:
+        return ParameterRegistry(())
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if use_cache:
+        try:
+            fmt, cached_digest, rows = marshal.loads(cache_path.read_bytes())
+            if fmt == CACHE_FORMAT and cached_digest == digest:
+                return ParameterRegistry((Parameter(*row) for row in rows), digest)
+        except (OSError, ValueError, EOFError, TypeError):
+            pass
+
+    params = parse_params(raw.decode("utf-8"), str(params_path))
+
+    if use_cache:
+        try:
+            payload = marshal.dumps((CACHE_FORMAT, digest, [tuple(p) for p in params]))
+        except ValueError:
+            payload = None  # A value marshal can't store - skip caching
+        if payload is not None:
+            try:
+                cache_path.parent.mkdir(parents=True, exist_ok=True)
+                tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+                tmp_path.write_bytes(payload)
+                os.replace(tmp_path, cache_path)
+            except OSError:
+                pass  # Read-only project - caching is best effort
+
+    return ParameterRegistry(params, digest)
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Show the parameter registry built from project_params.py")
+    parser.add_argument("--params", default=str(PARAMS_PATH), help="Path to project_params.py")
+    parser.add_argument("--critical", action="store_true", help="Only parameters marked critical")
+    parser.add_argument("--no-cache", action="store_true", help="Parse without using the cache")
+
+    args = parser.parse_args()
+
+    if not Path(args.params).is_file():
+        print(f"ERROR: Parameter file not found: {args.params}")
+        sys.exit(1)
+
+    registry = load_registry(args.params, use_cache=not args.no_cache)
+    for category, params in registry.by_category().items():
+        params = [p for p in params if p.critical or not args.critical]
+        if not params:
+            continue
+        print(f"\n[{category or 'Uncategorized'}]")
+        for p in params:
+            flag = "*" if p.critical else " "
+            source = f"  ({p.source})" if p.source else ""
+            print(f" {flag} {p.name:<32} {p.format_value()}{source}")
+    print(f"\n{len(registry)} parameters, {len(registry.critical())} critical (* = critical)")
+
+
+if __name__ == "__main__":
+    main()
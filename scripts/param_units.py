@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""
+Unit-Aware Parameter Evaluation
+
+Turns the parameter registry (units declared in project_params.py comments)
+into pint Quantities and re-evaluates derived parameters over NumPy arrays.
+A Quantity wraps a whole array, so unit conversion and dimensional checks
+happen once per array, never per element - sweeping thousands of design
+points costs a handful of array operations.
+
+In a notebook (calculations/<system>/):
+    sys.path.append('../../scripts')
+    from param_units import evaluate, vectorized, ureg
+    import numpy as np
+
+    # Re-evaluate every derived parameter for 10,000 shaft diameters
+    out = evaluate(overrides={'SHAFT_DIAMETER_MM': np.linspace(8, 14, 10_000)})
+    out['SHAFT_AREA_MM2'].to('in**2')
+
+    # Plain-NumPy kernel with units checked at the boundary only
+    @vectorized('m/s', diameter='mm', speed='rpm')
+    def tip_speed(diameter, speed):
+        return np.pi * diameter * 1e-3 * speed / 60
+
+    tip_speed(out['SHAFT_DIAMETER_MM'], 90_000 * ureg.rpm)
+
+Run: python scripts/param_units.py   # check every declared unit parses and derived units agree
+"""
+
+import functools
+import inspect
+import sys
+from types import SimpleNamespace
+
+try:
+    import numpy as np
+    import pint
+except ImportError:
+    print("ERROR: Required packages not installed.")
+    print("Run: pip install numpy pint  (both are in requirements-engineering.txt)")
+    sys.exit(1)
+
+from param_registry import load_registry
+
+ureg = pint.UnitRegistry()
+Q_ = ureg.Quantity
+
+# Stand-in for `math` in derived expressions: same names, but array-aware
+ARRAY_MATH = SimpleNamespace(
+    pi=np.pi, e=np.e, tau=2 * np.pi, inf=np.inf,
+    sqrt=np.sqrt, exp=np.exp, log=np.log, log10=np.log10, log2=np.log2,
+    sin=np.sin, cos=np.cos, tan=np.tan, asin=np.arcsin, acos=np.arccos, atan=np.arctan,
+    atan2=np.arctan2, sinh=np.sinh, cosh=np.cosh, tanh=np.tanh, hypot=np.hypot,
+    radians=np.radians, degrees=np.degrees, fabs=np.abs, floor=np.floor, ceil=np.ceil,
+)
+EVAL_GLOBALS = {"__builtins__": {"abs": abs, "min": np.minimum, "max": np.maximum, "round": np.round},
+                "math": ARRAY_MATH, "np": np}
+
+
+class ParameterUnitError(ValueError):
+    """A parameter's declared unit is unknown or inconsistent with its value."""
+
+
+@functools.lru_cache(maxsize=None)
+def parse_unit(unit_text: str):
+    """Declared unit text ('mm', 'm/s^2', '-' or '') -> pint Unit."""
+    text = unit_text.strip()
+    if text in ("", "-"):
+        return ureg.dimensionless
+    return ureg.Unit(text.replace("^", "**"))
+
+
+@functools.lru_cache(maxsize=None)
+def declared_unit(unit_text: str):
+    """parse_unit, or None when the first comment field is free text rather than a unit."""
+    try:
+        return parse_unit(unit_text)
+    except (pint.UndefinedUnitError, pint.errors.DefinitionSyntaxError, AttributeError, ValueError, TypeError):
+        return None
+
+
+def unknown_units(registry) -> dict:
+    """{name: message} for numeric parameters whose declared unit pint does not understand."""
+    return {p.name: f"{p.name}: unknown unit '{p.unit}' (line {p.line})" for p in registry
+            if isinstance(p.value, (int, float)) and not isinstance(p.value, bool) and declared_unit(p.unit) is None}
+
+
+@functools.lru_cache(maxsize=None)
+def compile_expression(expression: str):
+    return compile(expression, "<project_params>", "eval")
+
+
+def as_quantity(value, unit, name="value"):
+    """Attach or convert to unit - one dimensional check for the whole array."""
+    if isinstance(value, pint.Quantity):
+        try:
+            return value.to(unit)
+        except pint.DimensionalityError as e:
+            raise ParameterUnitError(f"{name}: cannot convert {value.units} to {unit}") from e
+    return Q_(np.asarray(value, dtype=float) if np.ndim(value) else value, unit)
+
+
+def quantities(registry=None) -> dict:
+    """
+    All numeric parameters as Quantities in their declared units.
+
+    Non-numeric parameters (names, descriptions) and numbers whose unit comment
+    is not a unit pint knows (free text such as 'turbine inlet limit') are
+    returned unchanged; see unknown_units().
+    """
+    registry = registry if registry is not None else load_registry()
+    values = {}
+    for p in registry:
+        unit = None if isinstance(p.value, bool) or not isinstance(p.value, (int, float)) else declared_unit(p.unit)
+        values[p.name] = p.value if unit is None else Q_(p.value, unit)
+    return values
+
+
+def evaluate(overrides=None, registry=None, names=None) -> dict:
+    """
+    Evaluate parameters with some inputs replaced by scalars or arrays.
+
+    Derived parameters (those defined by an expression in project_params.py)
+    are recomputed, in file order, whenever something they depend on was
+    overridden or recomputed. Each result is converted to the parameter's
+    declared unit, so a dimensionally wrong expression fails once, loudly.
+
+    A parameter whose declared unit is not understood only raises
+    ParameterUnitError when it is actually needed: overridden, an input of a
+    recomputed expression, recomputed itself, or asked for in names.
+
+    Args:
+        overrides: {name: value} - plain numbers/arrays are taken to be in the
+                   parameter's declared unit; Quantities are converted to it
+        registry: ParameterRegistry (default: load_registry())
+        names: Only return these parameters (default: all)
+
+    Returns:
+        dict: {name: Quantity (array-valued where affected by an array override)}
+    """
+    registry = registry if registry is not None else load_registry()
+    overrides = overrides or {}
+    unknown = set(overrides) - set(registry.names())
+    if unknown:
+        raise KeyError(f"Not defined in project_params.py: {', '.join(sorted(unknown))}")
+
+    values = quantities(registry)
+    unknown_unit = unknown_units(registry)
+
+    def require(name):
+        if name in unknown_unit:
+            raise ParameterUnitError(unknown_unit[name])
+
+    # With names given, only recompute what those names depend on
+    needed = None
+    if names is not None:
+        needed = set(names)
+        for p in reversed(tuple(registry)):
+            if p.name in needed:
+                needed.update(p.depends)
+
+    changed = set()
+    for p in registry:
+        if p.name in overrides:
+            require(p.name)
+            values[p.name] = as_quantity(overrides[p.name], parse_unit(p.unit), p.name)
+            changed.add(p.name)
+        elif p.expression and changed.intersection(p.depends) and (needed is None or p.name in needed):
+            for name in (*p.depends, p.name):
+                require(name)
+            try:
+                result = eval(compile_expression(p.expression), EVAL_GLOBALS, values)
+            except pint.DimensionalityError as e:
+                raise ParameterUnitError(f"{p.name} = {p.expression}: {e}") from e
+            values[p.name] = as_quantity(result, parse_unit(p.unit), p.name)
+            changed.add(p.name)
+
+    if names is not None:
+        for name in names:
+            require(name)
+        return {name: values[name] for name in names}
+    return values
+
+
+def vectorized(output_unit, **input_units):
+    """
+    Decorate a plain-NumPy function with unit handling at its boundary.
+
+    Arguments named in input_units are converted once to those units and
+    passed as bare arrays; the return value is tagged with output_unit.
+    Arguments given as plain numbers/arrays are assumed to already be in
+    the declared unit.
+    """
+    units = {name: parse_unit(unit) for name, unit in input_units.items()}
+    out_unit = parse_unit(output_unit) if output_unit is not None else None
+
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            for name, unit in units.items():
+                if name in bound.arguments:
+                    bound.arguments[name] = as_quantity(bound.arguments[name], unit, name).magnitude
+            result = func(*bound.args, **bound.kwargs)
+            return Q_(result, out_unit) if out_unit is not None else result
+
+        signature = inspect.signature(func)
+        missing = set(units) - set(signature.parameters)
+        if missing:
+            raise TypeError(f"{func.__name__} has no parameters named {', '.join(sorted(missing))}")
+        return wrapper
+
+    return decorator
+
+
+def main():
+    registry = load_registry()
+    if not len(registry):
+        print("No parameters found in project_params.py")
+        return
+
+    values = quantities(registry)
+    unknown_unit = unknown_units(registry)
+    for message in unknown_unit.values():
+        print(f"[FAIL] {message}")
+    errors = len(unknown_unit)
+
+    for p in registry:
+        if not p.expression or not isinstance(values.get(p.name), pint.Quantity):
+            continue
+        if unknown_unit.keys() & set(p.depends):
+            print(f"[SKIP] {p.name} = {p.expression}: depends on a parameter with an unknown unit")
+            continue
+        try:
+            result = eval(compile_expression(p.expression), EVAL_GLOBALS, values)
+            as_quantity(result, parse_unit(p.unit), p.name)
+            print(f"[PASS] {p.name} = {p.expression}  [{p.unit or '-'}]")
+        except (ParameterUnitError, pint.DimensionalityError) as e:
+            errors += 1
+            print(f"[FAIL] {p.name} = {p.expression}: {e}")
+
+    numeric = sum(1 for v in values.values() if isinstance(v, pint.Quantity))
+    print(f"\n{numeric} parameters with units, {len(unknown_unit)} unknown units, "
+          f"{errors - len(unknown_unit)} derived-unit errors")
+    sys.exit(1 if errors else 0)
+
+
+if __name__ == "__main__":
+    main()
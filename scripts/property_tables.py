@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+Fluid Property Lookup Tables
+
+Pre-tabulates fluid properties over a temperature/pressure grid once per
+project, then serves vectorized interpolation - for cycle sweeps that would
+otherwise call CoolProp/Cantera (docs/calculation-stack.md) per point.
+
+Tables live in .toolkit-cache/property-tables/<key>/ as one .npy array per
+property, opened memory-mapped, so every notebook and sweep worker shares
+the same pages instead of loading its own copy. The key covers the fluid,
+grid, properties and CoolProp version (or the source of a custom property
+function), so changing any of them builds a new table.
+
+Error bounds are measured when the table is built: the exact function is
+evaluated at every cell centre (where interpolation error peaks), or at up to
+CHECK_POINTS of them, and the worst absolute/relative error is stored per
+property and interpolation method.
+
+In a notebook (calculations/<system>/):
+    sys.path.append('../../scripts')
+    from property_tables import property_table
+
+    air = property_table("Air", ["D", "H", "CPMASS"], T=(250, 1500, 251), P=(1e5, 3e6, 121))
+    rho = air("D", T_array, P_array)            # bilinear, vectorized
+    h = air("H", T_array, P_array, method="cubic")  # bicubic spline (scipy)
+    air.error("D")                              # {'linear': {'max_abs':..., 'max_rel':...}, ...}
+
+Run:
+    python scripts/property_tables.py build Air --props D,H,CPMASS --T 250:1500:251 --P 1e5:3e6:121
+    python scripts/property_tables.py list
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy is required (pip install -r requirements-engineering.txt)")
+    sys.exit(1)
+
+from param_registry import PROJECT_ROOT
+
+TABLES_DIR = PROJECT_ROOT / ".toolkit-cache" / "property-tables"
+TABLE_FORMAT = 1
+CHECK_POINTS = 20000
+METHODS = ("linear", "cubic")
+
+
+def coolprop_properties(fluid: str):
+    """Exact property function backed by CoolProp: f(prop, T [K], P [Pa]) -> array."""
+    try:
+        from CoolProp.CoolProp import PropsSI
+    except ImportError:
+        print("ERROR: CoolProp is required to build property tables (pip install CoolProp)")
+        sys.exit(1)
+
+    def exact(prop, T, P):
+        T, P = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(P, dtype=float))
+        try:
+            return np.asarray(PropsSI(prop, "T", T.ravel(), "P", P.ravel(), fluid), dtype=float).reshape(T.shape)
+        except ValueError:
+            # One bad state (two-phase, outside the EOS range) fails a whole vector call
+            out = np.empty(T.size)
+            for i, (t, p) in enumerate(zip(T.ravel(), P.ravel())):
+                try:
+                    out[i] = PropsSI(prop, "T", t, "P", p, fluid)
+                except ValueError:
+                    out[i] = np.nan
+            return out.reshape(T.shape)
+
+    return exact
+
+
+def backend_id(fluid: str, func) -> str:
+    if func is None:
+        try:
+            import CoolProp
+            return f"CoolProp {CoolProp.__version__}"
+        except ImportError:
+            return "CoolProp missing"
+    from calc_cache import function_source
+    return "custom " + hashlib.sha256(function_source(func).encode("utf-8")).hexdigest()[:16]
+
+
+def table_key(fluid: str, props, T, P, log_p: bool, backend: str) -> str:
+    spec = json.dumps([TABLE_FORMAT, fluid, sorted(props), list(T), list(P), log_p, backend])
+    return hashlib.sha256(spec.encode("utf-8")).hexdigest()[:16]
+
+
+class PropertyTable:
+    """Memory-mapped property grids over (T, P) with vectorized interpolation."""
+
+    def __init__(self, directory: Path):
+        self.directory = Path(directory)
+        self.meta = json.loads((self.directory / "meta.json").read_text(encoding="utf-8"))
+        self.fluid = self.meta["fluid"]
+        self.log_p = self.meta["log_p"]
+        self.t_min, self.t_max, self.t_num = self.meta["T"]
+        self.p_min, self.p_max, self.p_num = self.meta["P"]
+        self.t_axis = np.linspace(self.t_min, self.t_max, self.t_num)
+        self.x_axis = np.linspace(*self.p_coord(np.array([self.p_min, self.p_max])), self.p_num)
+        self.values = {prop: np.load(self.directory / f"{prop}.npy", mmap_mode="r") for prop in self.meta["props"]}
+        self.splines = {}
+
+    @property
+    def props(self) -> list:
+        return list(self.values)
+
+    def p_coord(self, P):
+        """Pressure axis coordinate (log10 P when the grid is logarithmic)."""
+        return np.log10(P) if self.log_p else np.asarray(P, dtype=float)
+
+    def __call__(self, prop: str, T, P, method: str = "linear"):
+        """
+        Interpolate a property at (T [K], P [Pa]) - scalars or broadcastable arrays.
+
+        Points outside the tabulated range return NaN.
+        """
+        if prop not in self.values:
+            raise KeyError(f"{prop} is not tabulated for {self.fluid} (have {', '.join(self.values)})")
+        T, P = np.broadcast_arrays(np.asarray(T, dtype=float), np.asarray(P, dtype=float))
+        X = self.p_coord(P)
+        if method == "linear":
+            result = self.bilinear(self.values[prop], T, X)
+        elif method == "cubic":
+            result = self.spline(prop)(T, X, grid=False)
+        else:
+            raise ValueError(f"method must be one of {', '.join(METHODS)}")
+        outside = (T < self.t_min) | (T > self.t_max) | (X < self.x_axis[0]) | (X > self.x_axis[-1])
+        result = np.where(outside, np.nan, result)
+        return result.item() if result.ndim == 0 else result
+
+    def bilinear(self, grid, T, X):
+        ft = (T - self.t_min) / (self.t_axis[1] - self.t_axis[0])
+        fx = (X - self.x_axis[0]) / (self.x_axis[1] - self.x_axis[0])
+        i = np.clip(np.floor(ft).astype(np.intp), 0, self.t_num - 2)
+        j = np.clip(np.floor(fx).astype(np.intp), 0, self.p_num - 2)
+        wt, wx = ft - i, fx - j
+        return ((1 - wt) * (1 - wx) * grid[i, j] + wt * (1 - wx) * grid[i + 1, j]
+                + (1 - wt) * wx * grid[i, j + 1] + wt * wx * grid[i + 1, j + 1])
+
+    def spline(self, prop):
+        if prop not in self.splines:
+            try:
+                from scipy.interpolate import RectBivariateSpline
+            except ImportError as e:
+                raise ImportError("scipy is required for method='cubic' (pip install scipy)") from e
+            grid = np.asarray(self.values[prop])
+            if np.isnan(grid).any():
+                raise ValueError(f"{prop}: table has undefined states (NaN) - use method='linear'")
+            self.splines[prop] = RectBivariateSpline(self.t_axis, self.x_axis, grid, kx=3, ky=3)
+        return self.splines[prop]
+
+    def error(self, prop: str) -> dict:
+        """Measured interpolation error vs the exact function, per method."""
+        return self.meta["errors"][prop]
+
+
+def grid_spec(spec) -> list:
+    """(min, max, num) tuple or 'min:max:num' text -> [min, max, num]."""
+    if isinstance(spec, str):
+        spec = spec.split(":")
+    lo, hi, num = float(spec[0]), float(spec[1]), int(spec[2])
+    if not lo < hi or num < 4:
+        raise ValueError(f"grid needs min < max and at least 4 points, got {spec}")
+    return [lo, hi, num]
+
+
+def measure_errors(table: PropertyTable, exact, rng) -> dict:
+    """Worst interpolation error at cell centres (sampled if there are many)."""
+    ti = (table.t_axis[:-1] + table.t_axis[1:]) / 2
+    xi = (table.x_axis[:-1] + table.x_axis[1:]) / 2
+    T, X = (a.ravel() for a in np.meshgrid(ti, xi, indexing="ij"))
+    if T.size > CHECK_POINTS:
+        pick = rng.choice(T.size, CHECK_POINTS, replace=False)
+        T, X = T[pick], X[pick]
+    P = 10 ** X if table.log_p else X
+
+    errors = {}
+    for prop in table.props:
+        reference = exact(prop, T, P)
+        errors[prop] = {}
+        for method in METHODS:
+            try:
+                approx = table(prop, T, P, method=method)
+            except (ValueError, ImportError):
+                continue  # No scipy, or NaNs in the table - cubic unavailable
+            diff = np.abs(approx - reference)
+            ok = np.isfinite(diff)
+            if not ok.any():
+                continue
+            rel = diff[ok] / np.maximum(np.abs(reference[ok]), np.finfo(float).tiny)
+            errors[prop][method] = {"max_abs": float(diff[ok].max()), "max_rel": float(rel.max()),
+                                    "p99_rel": float(np.percentile(rel, 99)), "points": int(ok.sum())}
+    return errors
+
+
+def build_table(fluid: str, props, T, P, log_p: bool = True, func=None, directory: Path = TABLES_DIR,
+                verbose: bool = True) -> PropertyTable:
+    """
+    Tabulate props of fluid over the T/P grid and measure interpolation error.
+
+    Args:
+        T, P: (min, max, num) - P is spaced logarithmically unless log_p=False
+        func: Exact property function f(prop, T, P) -> array (default: CoolProp PropsSI)
+    """
+    props = list(props)
+    T, P = grid_spec(T), grid_spec(P)
+    exact = func or coolprop_properties(fluid)
+    key = table_key(fluid, props, T, P, log_p, backend_id(fluid, func))
+    target = Path(directory) / key
+
+    start = time.perf_counter()
+    target.parent.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f".{key}-", dir=target.parent))
+    try:
+        t_axis = np.linspace(*T)
+        p_axis = np.logspace(np.log10(P[0]), np.log10(P[1]), P[2]) if log_p else np.linspace(*P)
+        TT, PP = np.meshgrid(t_axis, p_axis, indexing="ij")
+        for prop in props:
+            if verbose:
+                print(f"  Tabulating {fluid} {prop} on {T[2]} x {P[2]} grid...")
+            values = np.lib.format.open_memmap(tmp_dir / f"{prop}.npy", mode="w+", dtype=float, shape=TT.shape)
+            values[:] = exact(prop, TT, PP)
+            values.flush()
+            del values
+
+        meta = {"format": TABLE_FORMAT, "fluid": fluid, "props": props, "T": T, "P": P, "log_p": log_p,
+                "backend": backend_id(fluid, func), "built": time.strftime("%Y-%m-%d %H:%M:%S"), "errors": {}}
+        (tmp_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        if verbose:
+            print("  Measuring interpolation error at cell centres...")
+        meta["errors"] = measure_errors(PropertyTable(tmp_dir), exact, np.random.default_rng(0))
+        meta["build_seconds"] = round(time.perf_counter() - start, 2)
+        (tmp_dir / "meta.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+
+        if target.exists() and not (target / "meta.json").is_file():
+            shutil.rmtree(target, ignore_errors=True)    # Leftover of an interrupted build
+        try:
+            os.replace(tmp_dir, target)
+        except OSError:
+            if not (target / "meta.json").is_file():
+                raise
+            # Another process (e.g. a sweep worker) finished the same table first. The key is
+            # content-addressed, so its table is identical - keep it, it may already be in use.
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+    except BaseException:
+        shutil.rmtree(tmp_dir, ignore_errors=True)
+        raise
+    return PropertyTable(target)
+
+
+def property_table(fluid: str, props, T, P, log_p: bool = True, func=None,
+                   directory: Path = TABLES_DIR) -> PropertyTable:
+    """Open the matching table, building it first if this project does not have it yet."""
+    props = list(props)
+    key = table_key(fluid, props, grid_spec(T), grid_spec(P), log_p, backend_id(fluid, func))
+    target = Path(directory) / key
+    if (target / "meta.json").is_file():
+        return PropertyTable(target)
+    return build_table(fluid, props, T, P, log_p=log_p, func=func, directory=directory)
+
+
+def print_errors(table: PropertyTable):
+    print(f" {'Property':<12}{'Method':<9}{'Max abs':>14}{'Max rel':>11}{'p99 rel':>11}")
+    for prop in table.props:
+        for method, e in table.error(prop).items():
+            print(f" {prop:<12}{method:<9}{e['max_abs']:>14.4g}{e['max_rel']:>10.2e}{e['p99_rel']:>11.2e}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build and inspect fluid property lookup tables")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    build_parser = sub.add_parser("build", help="Tabulate properties with CoolProp")
+    build_parser.add_argument("fluid", help="CoolProp fluid name (Air, Water, Methane, ...)")
+    build_parser.add_argument("--props", default="D,H,S,CPMASS", help="Comma-separated CoolProp outputs")
+    build_parser.add_argument("--T", required=True, help="Temperature grid K, min:max:num")
+    build_parser.add_argument("--P", required=True, help="Pressure grid Pa, min:max:num")
+    build_parser.add_argument("--linear-p", action="store_true", help="Space pressure linearly (default: log)")
+
+    sub.add_parser("list", help="List tables built for this project, with error bounds")
+
+    args = parser.parse_args()
+
+    if args.command == "build":
+        try:
+            T, P = grid_spec(args.T), grid_spec(args.P)
+        except (ValueError, IndexError) as e:
+            print(f"ERROR: Invalid grid: {e}")
+            sys.exit(1)
+        table = build_table(args.fluid, args.props.split(","), T, P, log_p=not args.linear_p)
+        print(f"\nBuilt {table.directory.relative_to(PROJECT_ROOT)} in {table.meta['build_seconds']} s\n")
+        print_errors(table)
+
+    elif args.command == "list":
+        tables = sorted(TABLES_DIR.glob("*/meta.json")) if TABLES_DIR.is_dir() else []
+        if not tables:
+            print("No property tables built yet")
+        for meta_path in tables:
+            table = PropertyTable(meta_path.parent)
+            (t_lo, t_hi, t_n), (p_lo, p_hi, p_n) = table.meta["T"], table.meta["P"]
+            print(f"\n{table.fluid}  T {t_lo:g}-{t_hi:g} K x{t_n}, P {p_lo:g}-{p_hi:g} Pa x{p_n}"
+                  f"  [{table.meta['backend']}]  ({meta_path.parent.name})")
+            print_errors(table)
+
+
+if __name__ == "__main__":
+    main()
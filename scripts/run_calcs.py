@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+"""
+Calculation Runner
+
+Executes calculation notebooks (and scripts) in calculations/ headlessly and
+in parallel, each in its own process with a hard timeout. Executed copies go
+to calculations/.executed/ (the originals are not modified) together with a
+results summary.
+
+Calculations that are current - same code, and the parameters they read have
+the same values as at their last successful run (see calc_graph.py) - are
+skipped. Calculations that produce parameters another calculation reads run
+first, and consumers of a failed calculation are not run.
+
+Run:
+    python scripts/run_calcs.py                      # run everything stale
+    python scripts/run_calcs.py calculations/shaft   # only this system
+    python scripts/run_calcs.py --force --workers 8  # re-run all
+    python scripts/run_calcs.py --dry-run            # show what would run
+
+Requires jupyter (nbconvert) from requirements-engineering.txt for notebooks.
+"""
+
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from datetime import datetime
+from pathlib import Path
+
+from calc_graph import load_graph, save_state
+from param_registry import PROJECT_ROOT
+
+CALCULATIONS_DIR = PROJECT_ROOT / "calculations"
+OUTPUT_DIR = CALCULATIONS_DIR / ".executed"
+SUMMARY_NAME = "summary.json"
+DEFAULT_TIMEOUT = 600
+ERROR_TAIL_LINES = 15
+
+
+def select_calcs(graph, selectors) -> list:
+    """Calculations matching any selector (file or directory, relative to cwd or project)."""
+    if not selectors:
+        return list(graph.calcs)
+    prefixes = []
+    for selector in selectors:
+        path = Path(selector).resolve()
+        try:
+            prefixes.append(path.relative_to(PROJECT_ROOT).as_posix())
+        except ValueError:
+            print(f"ERROR: Not inside the project: {selector}")
+            sys.exit(1)
+    selected = [c for c in graph.calcs
+                if any(c == p or c.startswith(p.rstrip("/") + "/") or p == "." for p in prefixes)]
+    if not selected:
+        print(f"ERROR: No calculations match: {' '.join(selectors)}")
+        sys.exit(1)
+    return selected
+
+
+def output_path(calc: str, output_dir: Path, suffix: str = "") -> Path:
+    """Where a calculation's executed copy/log goes: calculations/a/b.ipynb -> .executed/a/b.ipynb"""
+    return output_dir / ((PROJECT_ROOT / calc).relative_to(CALCULATIONS_DIR).as_posix() + suffix)
+
+
+def command_for(calc: str, output_dir: Path, timeout: int) -> list:
+    source = PROJECT_ROOT / calc
+    if source.suffix == ".py":
+        return [sys.executable, source.name]
+    return [sys.executable, "-m", "jupyter", "nbconvert", "--to", "notebook", "--execute",
+            f"--ExecutePreprocessor.timeout={timeout}",
+            "--output-dir", str(output_path(calc, output_dir).parent),
+            "--output", source.stem, source.name]
+
+
+def process_group_options() -> dict:
+    """Popen options that put a calculation in its own process group/session."""
+    if sys.platform == "win32":
+        return {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    return {"start_new_session": True}
+
+
+def kill_tree(process: subprocess.Popen):
+    """Kill a calculation together with the processes it started (the notebook kernel)."""
+    if sys.platform == "win32":
+        # No process groups to signal; taskkill /T walks the child tree
+        subprocess.run(["taskkill", "/F", "/T", "/PID", str(process.pid)], capture_output=True)
+        if process.poll() is None:
+            process.kill()
+    else:
+        os.killpg(process.pid, signal.SIGKILL)
+
+
+def run_calc(calc: str, output_dir: Path, timeout: int) -> dict:
+    """Execute one calculation in a subprocess. Returns a result record."""
+    source = PROJECT_ROOT / calc
+    log_path = output_path(calc, output_dir, ".log")
+    log_path.parent.mkdir(parents=True, exist_ok=True)
+
+    # `from project_params import *` works without each calculation editing sys.path
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(PROJECT_ROOT), env.get("PYTHONPATH")]))
+
+    start = time.perf_counter()
+    status, returncode = "passed", 0
+    with open(log_path, "w", encoding="utf-8") as log:
+        try:
+            # Own session/process group, so a timeout can kill the kernel along with nbconvert
+            process = subprocess.Popen(command_for(calc, output_dir, timeout), cwd=source.parent, env=env,
+                                       stdout=log, stderr=subprocess.STDOUT, **process_group_options())
+        except OSError as e:
+            log.write(f"{e}\n")
+            status, returncode = "failed", None
+        else:
+            try:
+                returncode = process.wait(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                kill_tree(process)
+                process.wait()
+                status, returncode = "timeout", None
+            else:
+                if returncode != 0:
+                    status = "failed"
+    elapsed = time.perf_counter() - start
+
+    result = {"calc": calc, "status": status, "returncode": returncode,
+              "seconds": round(elapsed, 2), "log": log_path.relative_to(PROJECT_ROOT).as_posix()}
+    if status != "passed":
+        lines = log_path.read_text(encoding="utf-8", errors="replace").splitlines()
+        result["error"] = "\n".join(lines[-ERROR_TAIL_LINES:]) or f"timed out after {timeout} s"
+    if source.suffix == ".ipynb" and status == "passed":
+        result["executed"] = output_path(calc, output_dir).relative_to(PROJECT_ROOT).as_posix()
+    return result
+
+
+def run_calcs(selectors=None, workers: int = 4, timeout: int = DEFAULT_TIMEOUT, force: bool = False,
+              dry_run: bool = False, output_dir: Path = OUTPUT_DIR) -> int:
+    """
+    Run stale (or, with force, all) selected calculations.
+
+    Returns:
+        int: Number of calculations that failed, timed out or were blocked
+    """
+    graph, state = load_graph()
+    marks = state["marks"]
+    if not graph.calcs:
+        print("No calculations found in calculations/")
+        return 0
+
+    selected = set(select_calcs(graph, selectors))
+    stale = graph.stale(marks)
+    order = [c for c in graph.topological_calcs() if c in selected]
+    to_run = [c for c in order if force or c in stale]
+    skipped = [c for c in order if c not in to_run]
+
+    print(f"{len(to_run)} to run, {len(skipped)} current ({workers} workers, {timeout} s timeout)"
+          + (" - DRY RUN" if dry_run else ""))
+    if dry_run:
+        for calc in to_run:
+            reasons = stale.get(calc) or ["--force"]
+            print(f"  {calc}  ({'; '.join(reasons)})")
+        return 0
+    if not to_run:
+        return 0
+    print()
+
+    # A calculation waits for every calculation upstream of it in this run
+    position = {calc: i for i, calc in enumerate(to_run)}
+    upstream = {calc: set() for calc in to_run}
+    for calc in to_run:
+        for node in graph.impact([calc]):
+            if node in upstream and position[node] > position[calc]:
+                upstream[node].add(calc)
+
+    results = {calc: {"calc": calc, "status": "current", "seconds": 0} for calc in skipped}
+    pending = list(to_run)
+    running = {}
+    batch_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        while pending or running:
+            for calc in list(pending):
+                if any(results.get(u, {}).get("status") in ("failed", "timeout", "blocked")
+                       for u in upstream[calc]):
+                    pending.remove(calc)
+                    results[calc] = {"calc": calc, "status": "blocked", "seconds": 0,
+                                     "error": "an upstream calculation failed"}
+                    print(f"  [blocked] {calc}")
+                elif all(u in results for u in upstream[calc]):
+                    pending.remove(calc)
+                    running[executor.submit(run_calc, calc, output_dir, timeout)] = calc
+            if not running:
+                continue
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                calc = running.pop(future)
+                result = future.result()
+                results[calc] = result
+                finished = sum(1 for c in to_run if c in results)
+                print(f"  [{finished}/{len(to_run)}] {result['status']:<8} {calc} ({result['seconds']:.2f} s)")
+    batch_elapsed = time.perf_counter() - batch_start
+
+    passed = [c for c in to_run if results[c]["status"] == "passed"]
+    graph.mark(marks, passed)
+    save_state(state)
+
+    summary = {
+        "run_at": datetime.now().isoformat(timespec="seconds"),
+        "params_digest": graph.registry.digest,
+        "seconds": round(batch_elapsed, 2),
+        "results": [results[c] for c in order],
+    }
+    output_dir.mkdir(parents=True, exist_ok=True)
+    (output_dir / SUMMARY_NAME).write_text(json.dumps(summary, indent=2) + "\n", encoding="utf-8")
+
+    print()
+    print("=" * 80)
+    print(f" {'Calculation':<60}{'Status':<10}{'Time':>9}")
+    print("-" * 80)
+    for calc in order:
+        result = results[calc]
+        print(f" {calc[-59:]:<60}{result['status']:<10}{result['seconds']:>8.2f}s")
+    print("-" * 80)
+    counts = {}
+    for result in results.values():
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    print(" " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+          + f" in {batch_elapsed:.2f} s")
+    print(f" Executed notebooks and logs: {output_dir.relative_to(PROJECT_ROOT)}/")
+
+    failures = [results[c] for c in to_run if results[c]["status"] != "passed"]
+    for result in failures:
+        if result.get("error"):
+            print(f"\n--- {result['calc']} ({result['status']}) ---")
+            print(result["error"])
+    return len(failures)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Execute calculation notebooks headlessly in parallel")
+    parser.add_argument("paths", nargs="*", help="Calculations or directories to run (default: all)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 4, help="Parallel processes")
+    parser.add_argument("--timeout", type=int, default=DEFAULT_TIMEOUT,
+                        help=f"Seconds per calculation (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("--force", action="store_true", help="Run even if inputs are unchanged")
+    parser.add_argument("--dry-run", action="store_true", help="Show what would run")
+
+    args = parser.parse_args()
+
+    failures = run_calcs(args.paths, workers=args.workers, timeout=args.timeout,
+                         force=args.force, dry_run=args.dry_run)
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+#!/usr/bin/env python3
+"""
+Project Full-Text Search
+
+Ranked keyword search over the project's markdown and notebooks - docs/,
+calculations/*.ipynb, verification/, testing/, CONTEXT.md... - in one call
+instead of a series of greps. Markdown is indexed per heading section and
+notebooks per cell (source only, not outputs), so each hit points at the
+section or cell to read, with a highlighted snippet.
+
+The index is SQLite FTS5 (porter-stemmed; heading matches rank higher) and
+is updated incrementally: only files whose mtime or size changed since the
+last search are re-read.
+
+Query syntax: all terms must match; 'term*' matches a prefix; "exact phrase"
+in quotes; --any for any term.
+
+Run:
+    python scripts/search.py combustor liner cooling
+    python scripts/search.py "surge margin" --path calculations/ --limit 5
+    python scripts/search.py bearing* --kind code --json      # for scripting
+    python scripts/search.py --rebuild
+Store: .toolkit-cache/search.sqlite (safe to delete, rebuilt on demand)
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+from param_registry import PROJECT_ROOT
+
+INDEX_PATH = PROJECT_ROOT / ".toolkit-cache" / "search.sqlite"
+INDEX_FORMAT = 1
+EXTENSIONS = {".md", ".ipynb"}
+SKIP_DIRS = {"node_modules", "venv", "env", "__pycache__"}
+HEADING_WEIGHT = 5.0
+SNIPPET_TOKENS = 16
+
+HEADING_PATTERN = re.compile(r'^(#{1,6})\s+(.+?)\s*#*\s*$')
+FENCE_PATTERN = re.compile(r'^\s*(```|~~~)')
+QUERY_TERM = re.compile(r'"([^"]+)"|(\S+)')
+
+
+def find_files(root: Path = PROJECT_ROOT) -> dict:
+    """{relative posix path: os.stat_result} of markdown and notebooks outside hidden and tool directories."""
+    found = {}
+    for dirpath, dirs, filenames in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(".") and d not in SKIP_DIRS)
+        for filename in filenames:
+            if os.path.splitext(filename)[1] in EXTENSIONS:
+                path = Path(dirpath) / filename
+                found[path.relative_to(root).as_posix()] = path.stat()
+    return found
+
+
+def markdown_units(text: str, title: str) -> list:
+    """Split markdown into (kind, line, heading path, body) per heading section (headings in code fences ignored)."""
+    units = []
+    trail = []              # [(level, heading)]
+    start, body = 1, []
+    in_fence = False
+
+    def flush():
+        content = "\n".join(body).strip()
+        heading = " > ".join(h for _, h in trail) or title
+        if content or trail:
+            units.append(("markdown", start, heading, content))
+
+    for number, line in enumerate(text.split("\n"), 1):
+        if FENCE_PATTERN.match(line):
+            in_fence = not in_fence
+        match = None if in_fence else HEADING_PATTERN.match(line)
+        if match:
+            flush()
+            level = len(match.group(1))
+            trail = [(lvl, h) for lvl, h in trail if lvl < level] + [(level, match.group(2))]
+            start, body = number, []
+        else:
+            body.append(line)
+    flush()
+    return units
+
+
+def notebook_units(text: str, title: str) -> list:
+    """One (kind, cell number, heading, source) per notebook cell; heading is the latest markdown heading above."""
+    try:
+        cells = json.loads(text).get("cells", [])
+    except (json.JSONDecodeError, AttributeError):
+        return []
+    units = []
+    heading = title
+    for number, cell in enumerate(cells, 1):
+        source = cell.get("source", "")
+        source = "".join(source) if isinstance(source, list) else str(source)
+        if not source.strip():
+            continue
+        kind = cell.get("cell_type", "code")
+        if kind == "markdown":
+            headings = [m.group(2) for m in map(HEADING_PATTERN.match, source.split("\n")) if m]
+            if headings:
+                heading = headings[-1]
+        units.append((kind, number, heading, source))
+    return units
+
+
+def open_index(path=INDEX_PATH) -> sqlite3.Connection:
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    version = db.execute("PRAGMA user_version").fetchone()[0]
+    if version != INDEX_FORMAT:
+        db.executescript("""
+            DROP TABLE IF EXISTS files;
+            DROP TABLE IF EXISTS units;
+            CREATE TABLE files (path TEXT PRIMARY KEY, mtime_ns INTEGER, size INTEGER);
+            CREATE VIRTUAL TABLE units USING fts5(
+                path UNINDEXED, kind UNINDEXED, line UNINDEXED, heading, body,
+                tokenize = 'porter unicode61'
+            );
+        """)
+        db.execute(f"PRAGMA user_version = {INDEX_FORMAT}")
+        db.commit()
+    return db
+
+
+def update_index(db: sqlite3.Connection, root: Path = PROJECT_ROOT, rebuild: bool = False) -> dict:
+    """
+    Re-index files that are new or changed, drop deleted ones.
+
+    Returns:
+        dict: {"indexed": n, "removed": n, "files": n}
+    """
+    if rebuild:
+        db.execute("DELETE FROM files")
+        db.execute("DELETE FROM units")
+    known = {path: (mtime, size) for path, mtime, size in db.execute("SELECT path, mtime_ns, size FROM files")}
+    current = find_files(root)
+    stats = {"indexed": 0, "removed": 0, "files": len(current)}
+
+    with db:
+        for name, stat in current.items():
+            if known.get(name) == (stat.st_mtime_ns, stat.st_size):
+                continue
+            try:
+                text = (root / name).read_text(encoding="utf-8", errors="replace")
+            except OSError:
+                continue
+            title = Path(name).stem
+            units = notebook_units(text, title) if name.endswith(".ipynb") else markdown_units(text, title)
+            db.execute("DELETE FROM units WHERE path = ?", (name,))
+            db.executemany("INSERT INTO units (path, kind, line, heading, body) VALUES (?, ?, ?, ?, ?)",
+                           [(name, kind, line, heading, body) for kind, line, heading, body in units])
+            db.execute("INSERT OR REPLACE INTO files VALUES (?, ?, ?)", (name, stat.st_mtime_ns, stat.st_size))
+            stats["indexed"] += 1
+        for name in set(known) - set(current):
+            db.execute("DELETE FROM units WHERE path = ?", (name,))
+            db.execute("DELETE FROM files WHERE path = ?", (name,))
+            stats["removed"] += 1
+    return stats
+
+
+def fts_query(query, any_term: bool = False) -> str:
+    """
+    User query -> FTS5 MATCH expression; every term quoted so punctuation cannot break the syntax.
+
+    query is a string or a list of command-line words. The shell has already
+    removed the quotes around `"surge margin"`, so a word containing
+    whitespace is taken as a phrase.
+    """
+    if isinstance(query, str):
+        text = query
+    else:
+        text = " ".join(f'"{word}"' if re.search(r'\s', word) and '"' not in word else word for word in query)
+    terms = []
+    for phrase, word in QUERY_TERM.findall(text):
+        term = phrase or word
+        prefix = not phrase and term.endswith("*")
+        term = term.rstrip("*").replace('"', '""')
+        if term:
+            terms.append(f'"{term}"' + ("*" if prefix else ""))
+    return (" OR " if any_term else " ").join(terms)
+
+
+def search(db: sqlite3.Connection, query, limit: int = 10, path_prefix: str = None, kind: str = None,
+           any_term: bool = False) -> list:
+    """
+    Ranked hits, best first. query is a string or a list of words (see fts_query).
+
+    Returns:
+        list: {"path", "kind", "line", "heading", "snippet", "score"} - line is the heading's
+        line for markdown, the cell number for notebooks
+    """
+    match = fts_query(query, any_term)
+    if not match:
+        return []
+    sql = (f"SELECT path, kind, line, heading, "
+           f"snippet(units, -1, '[', ']', ' ... ', {SNIPPET_TOKENS}), "
+           f"bm25(units, 0, 0, 0, {HEADING_WEIGHT}, 1.0) AS score "
+           f"FROM units WHERE units MATCH ?")
+    params = [match]
+    if path_prefix:
+        sql += " AND path LIKE ? ESCAPE '\\'"
+        params.append(path_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%")
+    if kind:
+        sql += " AND kind = ?"
+        params.append(kind)
+    sql += " ORDER BY score LIMIT ?"
+    params.append(limit)
+    rows = db.execute(sql, params).fetchall()
+    return [{"path": path, "kind": kind, "line": line, "heading": heading,
+             "snippet": " ".join(snippet.split()), "score": round(-score, 3)}
+            for path, kind, line, heading, snippet, score in rows]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Full-text search over project markdown and notebooks")
+    parser.add_argument("terms", nargs="*", help="Search terms ('term*' for prefix, quotes for phrases)")
+    parser.add_argument("--limit", type=int, default=10, help="Maximum results (default: 10)")
+    parser.add_argument("--path", help="Only files under this path, e.g. docs/ or calculations/")
+    parser.add_argument("--kind", choices=("markdown", "code"), help="Only markdown sections/cells or code cells")
+    parser.add_argument("--any", action="store_true", help="Match any term instead of all")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    parser.add_argument("--rebuild", action="store_true", help="Re-index every file")
+
+    args = parser.parse_args()
+    if not args.terms and not args.rebuild:
+        parser.error("give search terms (or --rebuild)")
+
+    start = time.perf_counter()
+    try:
+        db = open_index()
+        stats = update_index(db, rebuild=args.rebuild)
+    except sqlite3.OperationalError as e:
+        print(f"ERROR: Cannot open search index {INDEX_PATH}: {e}")
+        if "fts5" in str(e):
+            print("This Python's SQLite was built without FTS5, which search.py needs.")
+        else:
+            print("If the index is damaged, delete it - it is rebuilt on the next search.")
+        sys.exit(1)
+    if not args.terms:
+        print(f"Indexed {stats['files']} files ({INDEX_PATH}, {(time.perf_counter() - start) * 1000:.0f} ms)")
+        return
+
+    try:
+        results = search(db, args.terms, limit=args.limit, path_prefix=args.path, kind=args.kind,
+                         any_term=args.any)
+    except sqlite3.OperationalError as e:
+        print(f"ERROR: Invalid query: {e}")
+        sys.exit(1)
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    if args.json:
+        print(json.dumps(results, indent=1))
+        return
+    for r in results:
+        location = f"cell {r['line']}" if r["path"].endswith(".ipynb") else f"line {r['line']}"
+        print(f"{r['path']} ({location})  {r['heading']}")
+        print(f"    {r['snippet']}")
+    print(f"\n{len(results)} results ({stats['indexed']} files re-indexed, {elapsed_ms:.1f} ms)")
+
+
+if __name__ == "__main__":
+    main()
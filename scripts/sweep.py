@@ -0,0 +1,389 @@
+#!/usr/bin/env python3
+"""
+Parametric Design Sweep
+
+Runs a calculation function over a grid or Latin-hypercube sample of
+project_params.py values, spread across all cores. Points are split into
+chunks; each worker process evaluates a chunk, with derived parameters
+recomputed for the swept values (param_units.evaluate, vectorized). Chunk
+results are cached (calc_cache) and streamed, in order, to a columnar file:
+.npz (NumPy) or .parquet (needs pyarrow).
+
+Spec (YAML or JSON), e.g. calculations/compressor/sweep.yaml:
+    function: calculations/compressor/model.py:stage_performance
+    method: lhs                     # grid (default) or lhs
+    samples: 100000                 # lhs only
+    seed: 1
+    vectorized: false               # true: function takes and returns whole arrays per chunk
+    parameters:                     # lhs: a {min, max} range per parameter
+      PRESSURE_RATIO: {min: 2.5, max: 4.5}
+      SHAFT_SPEED_RPM: {min: 60000, max: 120000}
+      TIP_CLEARANCE_MM: {min: 0.2, max: 0.4}
+    output: calculations/compressor/sweep.npz
+
+Grid axes are a linspace or explicit values instead:
+      SHAFT_SPEED_RPM: {min: 60000, max: 120000, num: 50}
+      TIP_CLEARANCE_MM: [0.2, 0.3, 0.4]
+
+The function is called with the parameters its signature names (swept,
+derived or fixed values from project_params.py; **kwargs gets all of them)
+and returns a number or a dict of numbers - one column each in the output.
+
+Run:
+    python scripts/sweep.py calculations/compressor/sweep.yaml
+    python scripts/sweep.py spec.yaml --workers 16 --chunk-size 500 --no-cache
+"""
+
+import argparse
+import importlib.util
+import inspect
+import json
+import math
+import os
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy is required (pip install -r requirements-engineering.txt)")
+    sys.exit(1)
+
+from param_registry import PROJECT_ROOT, load_registry
+
+CHUNKS_PER_WORKER = 8   # Enough chunks to even out uneven point costs
+MAX_CHUNK_SIZE = 5000
+
+
+# ---------------------------------------------------------------------------
+# Spec and sampling
+# ---------------------------------------------------------------------------
+
+def load_spec(spec_path: Path) -> dict:
+    """Load and validate a sweep spec (YAML or JSON)."""
+    text = spec_path.read_text(encoding="utf-8")
+    if spec_path.suffix.lower() == ".json":
+        spec = json.loads(text)
+    else:
+        try:
+            import yaml
+        except ImportError:
+            print("ERROR: PyYAML is required for YAML specs (pip install PyYAML) - or use a .json spec")
+            sys.exit(1)
+        spec = yaml.safe_load(text)
+
+    if not isinstance(spec, dict) or not spec.get("function") or not spec.get("parameters"):
+        print(f"ERROR: {spec_path}: a sweep spec needs 'function' and 'parameters'")
+        sys.exit(1)
+    spec.setdefault("method", "grid")
+    if spec["method"] not in ("grid", "lhs"):
+        print(f"ERROR: {spec_path}: method must be 'grid' or 'lhs', not '{spec['method']}'")
+        sys.exit(1)
+    if spec["method"] == "lhs" and not spec.get("samples"):
+        print(f"ERROR: {spec_path}: method 'lhs' needs 'samples'")
+        sys.exit(1)
+    spec.setdefault("output", str(spec_path.with_suffix(".npz")))
+    return spec
+
+
+def grid_axis(name: str, axis) -> np.ndarray:
+    if isinstance(axis, dict):
+        if "num" not in axis:
+            raise ValueError(f"{name}: grid axes need 'num' (or an explicit list of values)")
+        return np.linspace(float(axis["min"]), float(axis["max"]), int(axis["num"]))
+    return np.asarray(axis, dtype=float)
+
+
+class Sampler:
+    """Produces the swept values for any slice of point indices without materializing the whole design."""
+
+    def __init__(self, spec: dict):
+        self.names = list(spec["parameters"])
+        self.method = spec["method"]
+        if self.method == "grid":
+            self.axes = [grid_axis(n, spec["parameters"][n]) for n in self.names]
+            self.shape = tuple(len(a) for a in self.axes)
+            self.count = math.prod(self.shape)
+        else:
+            self.count = int(spec["samples"])
+            rng = np.random.default_rng(spec.get("seed"))
+            self.columns = {}
+            for name in self.names:
+                axis = spec["parameters"][name]
+                if not isinstance(axis, dict) or "min" not in axis or "max" not in axis:
+                    raise ValueError(f"{name}: lhs parameters need 'min' and 'max'")
+                # One point per stratum, strata shuffled independently per dimension
+                unit = (rng.permutation(self.count) + rng.random(self.count)) / self.count
+                self.columns[name] = float(axis["min"]) + unit * (float(axis["max"]) - float(axis["min"]))
+
+    def values(self, start: int, stop: int) -> dict:
+        if self.method == "grid":
+            index = np.unravel_index(np.arange(start, stop), self.shape)
+            return {name: axis[i] for name, axis, i in zip(self.names, self.axes, index)}
+        return {name: column[start:stop] for name, column in self.columns.items()}
+
+
+# ---------------------------------------------------------------------------
+# Worker side
+# ---------------------------------------------------------------------------
+
+_worker_states = {}     # reference -> per-process state
+
+
+def load_function(reference: str):
+    """'path/to/file.py:function' (relative to the project root) -> callable."""
+    path_text, sep, func_name = reference.rpartition(":")
+    if not sep or not path_text.endswith(".py"):
+        raise ValueError(f"function must look like 'calculations/x/model.py:func', got '{reference}'")
+    path = (PROJECT_ROOT / path_text).resolve()
+    if str(PROJECT_ROOT) not in sys.path:
+        sys.path.insert(0, str(PROJECT_ROOT))  # `from project_params import *` inside the model
+    module_spec = importlib.util.spec_from_file_location(f"sweep_model_{path.stem}", path)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return getattr(module, func_name)
+
+
+def worker_setup(reference: str, use_cache: bool):
+    """Per-process state: the function, its accepted arguments, the registry, the cache."""
+    if reference in _worker_states:
+        return _worker_states[reference]
+    func = load_function(reference)
+    signature = inspect.signature(func)
+    takes_all = any(p.kind == p.VAR_KEYWORD for p in signature.parameters.values())
+    cache = None
+    if use_cache:
+        from calc_cache import default_cache
+        cache = default_cache()
+    _worker_states[reference] = dict(func=func, accepted=None if takes_all else set(signature.parameters),
+                                     registry=load_registry(), cache=cache)
+    return _worker_states[reference]
+
+
+def chunk_inputs(registry, swept: dict) -> tuple:
+    """
+    Every parameter for a chunk: swept arrays, derived parameters recomputed, the rest fixed.
+
+    Returns:
+        tuple: (values, names that vary per point - the swept and recomputed ones)
+    """
+    values = registry.as_dict()
+    values.update(swept)
+    affected = set(swept)
+    derived = []
+    for p in registry:
+        if p.expression and affected.intersection(p.depends):
+            derived.append(p.name)
+            affected.add(p.name)
+    if derived:
+        from param_units import evaluate
+        evaluated = evaluate(overrides=swept, registry=registry, names=derived)
+        values.update({name: q.magnitude for name, q in evaluated.items()})
+    return values, affected
+
+
+def as_columns(result, count: int) -> dict:
+    if not isinstance(result, dict):
+        result = {"result": result}
+    return {name: np.broadcast_to(np.asarray(value, dtype=float), (count,)).copy() for name, value in result.items()}
+
+
+def run_chunk(reference: str, swept: dict, vectorized: bool, use_cache: bool) -> dict:
+    """Evaluate one chunk of points. Returns {column: array}."""
+    state = worker_setup(reference, use_cache)
+    func, accepted, cache = state["func"], state["accepted"], state["cache"]
+    count = len(next(iter(swept.values())))
+
+    key = None
+    if cache is not None:
+        key = cache.make_key(func, (reference, vectorized), swept, {"registry": state["registry"].digest})
+        found, columns, meta = cache.get(key)
+        if found:
+            cache.record("sweep:" + reference, True, meta.get("seconds", 0.0))
+            cache.flush_stats()
+            return columns
+
+    start = time.perf_counter()
+    values, varying = chunk_inputs(state["registry"], swept)
+    if accepted is not None:
+        values = {name: value for name, value in values.items() if name in accepted}
+
+    if vectorized:
+        columns = as_columns(func(**values), count)
+    else:
+        # Only swept/derived values are per point; list- or array-valued fixed parameters pass through whole
+        arrays = {name: np.broadcast_to(np.asarray(values[name]), (count,)) for name in varying if name in values}
+        rows = []
+        for i in range(count):
+            point = dict(values)
+            point.update({name: array[i].item() for name, array in arrays.items()})
+            rows.append(func(**point))
+        if isinstance(rows[0], dict):
+            columns = {name: np.array([row[name] for row in rows], dtype=float) for name in rows[0]}
+        else:
+            columns = {"result": np.array(rows, dtype=float)}
+
+    if cache is not None:
+        elapsed = time.perf_counter() - start
+        cache.record("sweep:" + reference, False, elapsed)
+        cache.put(key, columns, {"function": "sweep:" + reference, "seconds": elapsed})
+        cache.flush_stats()  # Pool workers exit without running atexit handlers
+    return columns
+
+
+# ---------------------------------------------------------------------------
+# Output
+# ---------------------------------------------------------------------------
+
+class NpzWriter:
+    """Streams chunks into memory-mapped .npy columns, packed into one .npz at the end."""
+
+    def __init__(self, path: Path, count: int):
+        self.path = path
+        self.count = count
+        self.tmp_dir = Path(tempfile.mkdtemp(prefix=".sweep-", dir=path.parent))
+        self.columns = {}
+
+    def write(self, start: int, columns: dict):
+        for name, values in columns.items():
+            if name not in self.columns:
+                self.columns[name] = np.lib.format.open_memmap(
+                    self.tmp_dir / f"{len(self.columns)}.npy", mode="w+", dtype=values.dtype, shape=(self.count,))
+            self.columns[name][start:start + len(values)] = values
+
+    def close(self):
+        tmp_path = self.path.with_name(self.path.name + ".tmp.npz")
+        np.savez(tmp_path, **self.columns)
+        os.replace(tmp_path, self.path)
+        self.abort()
+
+    def abort(self):
+        self.columns = {}
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+
+
+class ParquetWriter:
+    """Streams each chunk as a Parquet row group."""
+
+    def __init__(self, path: Path, count: int):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            print("ERROR: pyarrow is required for .parquet output (pip install pyarrow) - or use .npz")
+            sys.exit(1)
+        self.pa, self.pq = pyarrow, pyarrow.parquet
+        self.path = path
+        self.tmp_path = path.with_name(path.name + ".tmp")
+        self.writer = None
+
+    def write(self, start: int, columns: dict):
+        table = self.pa.table(columns)
+        if self.writer is None:
+            self.writer = self.pq.ParquetWriter(self.tmp_path, table.schema)
+        self.writer.write_table(table)
+
+    def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        if self.writer is not None:
+            self.writer.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+def open_writer(path: Path, count: int):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if path.suffix.lower() == ".parquet":
+        return ParquetWriter(path, count)
+    if path.suffix.lower() != ".npz":
+        print(f"ERROR: Output must be .npz or .parquet: {path}")
+        sys.exit(1)
+    return NpzWriter(path, count)
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+def run_sweep(spec: dict, workers: int = None, chunk_size: int = None, use_cache: bool = True) -> Path:
+    """
+    Run a sweep and write its results.
+
+    Returns:
+        Path: The output file (inputs and outputs as columns, one row per point)
+    """
+    registry = load_registry()
+    unknown = [name for name in spec["parameters"] if name not in registry]
+    if unknown:
+        print(f"ERROR: Not defined in project_params.py: {', '.join(unknown)}")
+        sys.exit(1)
+
+    try:
+        sampler = Sampler(spec)
+    except (ValueError, TypeError, KeyError) as e:
+        print(f"ERROR: Invalid sweep parameters: {e}")
+        sys.exit(1)
+
+    workers = workers or os.cpu_count() or 1
+    if not chunk_size:
+        chunk_size = max(1, min(MAX_CHUNK_SIZE, math.ceil(sampler.count / (workers * CHUNKS_PER_WORKER))))
+    bounds = [(start, min(start + chunk_size, sampler.count)) for start in range(0, sampler.count, chunk_size)]
+    output = (PROJECT_ROOT / spec["output"]).resolve()
+    vectorized = bool(spec.get("vectorized", False))
+
+    print(f"Sweep: {sampler.count} points ({spec['method']}) over {', '.join(sampler.names)}")
+    print(f"  {len(bounds)} chunks of up to {chunk_size} points, {workers} workers -> {os.path.relpath(output, PROJECT_ROOT)}")
+
+    writer = open_writer(output, sampler.count)
+    start_time = time.perf_counter()
+    done = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            # map() yields in submission order while all workers stay busy,
+            # so chunks stream to the writer in order
+            jobs = ((spec["function"], sampler.values(lo, hi), vectorized, use_cache) for lo, hi in bounds)
+            results = executor.map(run_chunk, *zip(*jobs))
+            for (lo, hi), columns in zip(bounds, results):
+                writer.write(lo, {**sampler.values(lo, hi), **columns})
+                done += hi - lo
+                elapsed = time.perf_counter() - start_time
+                print(f"\r  {done}/{sampler.count} points ({done / elapsed:,.0f} points/s)", end="", flush=True)
+    except BaseException:
+        writer.abort()
+        print()
+        raise
+    writer.close()
+    print(f"\n  Done in {time.perf_counter() - start_time:.2f} s")
+    return output
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a parametric sweep over project parameters")
+    parser.add_argument("spec", help="Sweep spec (YAML or JSON)")
+    parser.add_argument("--workers", type=int, help="Worker processes (default: all cores)")
+    parser.add_argument("--chunk-size", type=int, help="Points per work unit (default: automatic)")
+    parser.add_argument("--output", help="Override the spec's output file (.npz or .parquet)")
+    parser.add_argument("--no-cache", action="store_true", help="Recompute every chunk")
+
+    args = parser.parse_args()
+
+    spec_path = Path(args.spec)
+    if not spec_path.is_file():
+        print(f"ERROR: Sweep spec not found: {spec_path}")
+        sys.exit(1)
+    spec = load_spec(spec_path)
+    if args.output:
+        spec["output"] = str(Path(args.output).resolve())
+
+    run_sweep(spec, workers=args.workers, chunk_size=args.chunk_size, use_cache=not args.no_cache)
+
+
+if __name__ == "__main__":
+    main()
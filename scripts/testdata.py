@@ -0,0 +1,728 @@
+#!/usr/bin/env python3
+"""
+Test Data Store
+
+Converts raw test files in testing/data/ (YYYY-MM-DD_test-name_raw.csv/.json)
+once into a columnar store - one memory-mapped .npy array per channel - and
+keeps a catalog of runs indexed by date, test name and channel. Analysis then
+loads only the channels and time range it needs, without re-parsing CSV.
+
+The raw files are never modified. The store is read-only and derived from
+them: .toolkit-cache/test-data/ (safe to delete, rebuilt by `ingest`).
+Runs are re-ingested only when their raw file's size or mtime changes.
+
+Ingest also builds a min/max/mean pyramid per channel (blocks of 64 samples,
+then 256, 1024, ...) so a plot of any time window fetches about as many
+points as it has pixels - a full 30-minute 10 kHz run draws as fast as a
+zoomed-in second.
+
+CSV: one header row of channel names ("EGT [degC]" / "EGT (degC)" gives a
+unit); the first column named time/t/timestamp/time_s is the time axis,
+otherwise the sample index is. JSON: {"metadata": {...}, "data": {channel:
+[values]}} or a list of records.
+
+In a notebook (testing/analysis/):
+    sys.path.append('../../scripts')
+    from testdata import Catalog
+    cat = Catalog()
+    runs = cat.find(test="hot-fire", since="2025-03-01", channel="EGT")
+    data = cat.load(runs[0], channels=["EGT", "RPM"], t=(10.0, 70.0))
+    data["time"], data["EGT"]
+
+    fig, ax = plt.subplots()
+    ZoomPlot(ax, runs[0], "EGT")     # Re-fetches the right resolution on zoom/pan
+
+Run:
+    python scripts/testdata.py ingest                 # everything new or changed in testing/data
+    python scripts/testdata.py list --test hot-fire --channel EGT
+    python scripts/testdata.py show 2025-03-01_hot-fire-3
+    python scripts/testdata.py chart 2025-03-01_hot-fire-3 EGT --t 10 70
+    (writes testing/results/<run>_<channel>.svg to embed in the results report)
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import sys
+import tempfile
+import time
+from html import escape
+from itertools import islice
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy is required (pip install -r requirements-engineering.txt)")
+    sys.exit(1)
+
+from param_registry import PROJECT_ROOT
+
+DATA_DIR = PROJECT_ROOT / "testing" / "data"
+STORE_DIR = PROJECT_ROOT / ".toolkit-cache" / "test-data"
+CATALOG_NAME = "catalog.json"
+CATALOG_FORMAT = 2
+RESULTS_DIR = PROJECT_ROOT / "testing" / "results"
+
+RAW_NAME_PATTERN = re.compile(r'^(\d{4}-\d{2}-\d{2})_(.+?)_raw\.(csv|json)$', re.IGNORECASE)
+TIME_COLUMNS = ("time", "t", "timestamp", "time_s")
+UNIT_PATTERN = re.compile(r'^(.*?)\s*[\[(]([^\])]+)[\])]\s*$')
+CHUNK_ROWS = 200_000
+TIME_CHANNEL = "time"
+PYRAMID_BASE = 64       # Samples per block at level 0
+PYRAMID_FACTOR = 4      # Blocks merged per level above
+PYRAMID_TOP = 256       # Stop once a level has this few blocks
+MIN, MAX, MEAN, COUNT = range(4)    # Pyramid columns
+
+
+def run_id_for(path: Path) -> str:
+    """2025-03-01_hot-fire-3_raw.csv -> 2025-03-01_hot-fire-3"""
+    match = RAW_NAME_PATTERN.match(path.name)
+    return f"{match.group(1)}_{match.group(2)}"
+
+
+def clear_readonly(func, path, _):
+    """rmtree error handler: Windows refuses to delete read-only files, so make the file writable and retry."""
+    os.chmod(path, stat.S_IWRITE | stat.S_IREAD)
+    func(path)
+
+
+def remove_tree(path: Path, ignore_errors: bool = False):
+    """shutil.rmtree for run directories, whose files are read-only."""
+    try:
+        if sys.version_info >= (3, 12):
+            shutil.rmtree(path, onexc=clear_readonly)
+        else:
+            shutil.rmtree(path, onerror=clear_readonly)
+    except OSError:
+        if not ignore_errors:
+            raise
+
+
+def channel_file(name: str) -> str:
+    """Channel name -> safe file stem (the catalog keeps the real name)."""
+    return re.sub(r'[^A-Za-z0-9_.-]+', '_', name).strip("_") or "channel"
+
+
+def split_unit(header: str) -> tuple:
+    match = UNIT_PATTERN.match(header.strip())
+    if match and match.group(1):
+        return match.group(1).strip(), match.group(2).strip()
+    return header.strip(), ""
+
+
+def file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def count_lines(path: Path) -> int:
+    """Newline count of a file without decoding it."""
+    count = 0
+    last = b"\n"
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 24), b""):
+            count += block.count(b"\n")
+            last = block[-1:]
+    return count + (last != b"\n")
+
+
+# ---------------------------------------------------------------------------
+# Readers: raw file -> (channels [(name, unit)], time index or None, row chunks)
+# ---------------------------------------------------------------------------
+
+def parse_chunk(lines: list, width: int) -> np.ndarray:
+    """CSV lines -> (rows, width) float array; blank or non-numeric fields become NaN."""
+    try:
+        return np.loadtxt(lines, delimiter=",", dtype=float, ndmin=2)
+    except ValueError:
+        block = np.full((len(lines), width), np.nan)
+        for r, line in enumerate(lines):
+            for c, field in enumerate(line.rstrip("\r\n").split(",")[:width]):
+                try:
+                    block[r, c] = float(field)
+                except ValueError:
+                    pass
+        return block
+
+
+def read_csv(path: Path) -> dict:
+    """Stream a CSV as column chunks. Returns {'columns', 'rows', 'chunks', 'metadata'}."""
+    with open(path, encoding="utf-8-sig") as f:
+        header = f.readline().rstrip("\r\n").split(",")
+    rows = max(0, count_lines(path) - 1)
+
+    def chunks():
+        with open(path, encoding="utf-8-sig") as f:
+            f.readline()
+            while True:
+                lines = [line for line in islice(f, CHUNK_ROWS) if line.strip()]
+                if not lines:
+                    break
+                yield parse_chunk(lines, len(header))
+
+    return {"columns": header, "rows": rows, "chunks": chunks(), "metadata": {}}
+
+
+def read_json(path: Path) -> dict:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    metadata = {}
+    if isinstance(data, dict):
+        metadata = data.get("metadata") or {}
+        data = data.get("data", data.get("channels", data))
+    if isinstance(data, list):  # Records
+        columns = list(dict.fromkeys(key for record in data for key in record))
+        values = {c: [record.get(c, np.nan) for record in data] for c in columns}
+    elif isinstance(data, dict):
+        columns = [c for c, v in data.items() if isinstance(v, list)]
+        values = {c: data[c] for c in columns}
+    else:
+        raise ValueError("expected {'data': {channel: [...]}} or a list of records")
+    arrays = []
+    for c in columns:
+        try:
+            arrays.append(np.asarray(values[c], dtype=float))
+        except (TypeError, ValueError):
+            arrays.append(np.full(len(values[c]), np.nan))  # Non-numeric channel
+    rows = max((len(a) for a in arrays), default=0)
+    block = np.full((rows, len(columns)), np.nan)
+    for c, array in enumerate(arrays):
+        block[:len(array), c] = array
+    return {"columns": columns, "rows": rows, "chunks": iter([block]), "metadata": metadata}
+
+
+READERS = {".csv": read_csv, ".json": read_json}
+
+
+# ---------------------------------------------------------------------------
+# Pyramids: per-block (min, max, mean, count of finite samples)
+# ---------------------------------------------------------------------------
+
+def pyramid_file(channel_file_name: str, level: int) -> str:
+    """EGT.npy -> EGT.pyr0.npy"""
+    return f"{channel_file_name[:-len('.npy')]}.pyr{level}.npy"
+
+
+def reduce_blocks(mins, maxs, sums, counts) -> np.ndarray:
+    """(blocks, k) partial values -> (blocks, 4) min/max/mean/count rows; empty blocks are NaN."""
+    level = np.empty((len(counts), 4))
+    count = counts.sum(axis=1)
+    empty = count == 0
+    level[:, MIN] = np.where(empty, np.nan, mins.min(axis=1))
+    level[:, MAX] = np.where(empty, np.nan, maxs.max(axis=1))
+    level[:, MEAN] = np.where(empty, np.nan, sums.sum(axis=1) / np.maximum(count, 1))
+    level[:, COUNT] = count
+    return level
+
+
+def sample_blocks(x, size: int) -> np.ndarray:
+    """Raw samples -> one min/max/mean/count row per `size` consecutive samples (NaNs ignored)."""
+    x = np.asarray(x, dtype=float)
+    if len(x) % size:
+        x = np.concatenate((x, np.full(size - len(x) % size, np.nan)))
+    x = x.reshape(-1, size)
+    finite = np.isfinite(x)
+    return reduce_blocks(np.where(finite, x, np.inf), np.where(finite, x, -np.inf), np.where(finite, x, 0.0), finite)
+
+
+def base_level(values: np.ndarray) -> np.ndarray:
+    """Level 0 of a channel, read through in chunks so memory stays flat."""
+    blocks = []
+    step = PYRAMID_BASE * 4096
+    for start in range(0, len(values), step):
+        blocks.append(sample_blocks(values[start:start + step], PYRAMID_BASE))
+    return np.concatenate(blocks) if blocks else np.empty((0, 4))
+
+
+def coarser_level(level: np.ndarray) -> np.ndarray:
+    pad = -len(level) % PYRAMID_FACTOR
+    if pad:
+        level = np.concatenate((level, np.tile([np.nan, np.nan, np.nan, 0.0], (pad, 1))))
+    blocks = level.reshape(-1, PYRAMID_FACTOR, 4)
+    counts = blocks[:, :, COUNT]
+    filled = counts > 0
+    return reduce_blocks(np.where(filled, blocks[:, :, MIN], np.inf), np.where(filled, blocks[:, :, MAX], -np.inf),
+                         np.where(filled, blocks[:, :, MEAN] * counts, 0.0), counts)
+
+
+def build_pyramid(values: np.ndarray) -> list:
+    """Levels for one channel, finest first: level k has blocks of PYRAMID_BASE * PYRAMID_FACTOR**k samples."""
+    levels = [base_level(values)]
+    while len(levels[-1]) > PYRAMID_TOP:
+        levels.append(coarser_level(levels[-1]))
+    return levels
+
+
+# ---------------------------------------------------------------------------
+# Ingest
+# ---------------------------------------------------------------------------
+
+def ingest_file(path: Path, store_dir: Path = STORE_DIR) -> dict:
+    """
+    Convert one raw file into <store>/<run id>/<channel>.npy arrays.
+
+    Returns:
+        dict: Catalog entry for the run
+    """
+    run_id = run_id_for(path)
+    source = READERS[path.suffix.lower()](path)
+    names, units = zip(*(split_unit(c) for c in source["columns"])) if source["columns"] else ((), ())
+    time_col = next((i for i, name in enumerate(names) if name.lower() in TIME_COLUMNS), None)
+
+    store_dir.mkdir(parents=True, exist_ok=True)
+    tmp_dir = Path(tempfile.mkdtemp(prefix=f".{run_id}-", dir=store_dir))
+    try:
+        files, channels, used = {}, {}, set()
+        for i, (name, unit) in enumerate(zip(names, units)):
+            key = TIME_CHANNEL if i == time_col else name
+            stem = channel_file(key)
+            while stem in used:
+                stem += "_"
+            used.add(stem)
+            files[i] = np.lib.format.open_memmap(tmp_dir / f"{stem}.npy", mode="w+", dtype=float,
+                                                 shape=(source["rows"],))
+            channels[key] = {"file": f"{stem}.npy", "unit": unit, "column": source["columns"][i]}
+
+        written = 0
+        for block in source["chunks"]:
+            block = block[:source["rows"] - written]
+            for i, array in files.items():
+                array[written:written + len(block)] = block[:, i] if i < block.shape[1] else np.nan
+            written += len(block)
+
+        time_info = {}
+        if time_col is not None and written:
+            t = files[time_col][:written]
+            steps = np.diff(t)
+            step = float(np.median(steps)) if len(steps) else 0.0
+            time_info = {"t_start": float(t[0]), "t_end": float(t[-1]), "time_sorted": bool(np.all(steps >= 0)),
+                         "sample_rate_hz": 1 / step if step > 0 else None}
+        for array in files.values():
+            array.flush()
+        files.clear()
+
+        # Rows may be fewer than counted (blank lines) - trim the arrays
+        if written < source["rows"]:
+            for channel in channels.values():
+                trimmed = np.load(tmp_dir / channel["file"])[:written]
+                np.save(tmp_dir / channel["file"], trimmed)
+
+        levels = 0
+        for channel in channels.values():
+            pyramid = build_pyramid(np.load(tmp_dir / channel["file"], mmap_mode="r"))
+            for level, blocks in enumerate(pyramid):
+                np.save(tmp_dir / pyramid_file(channel["file"], level), blocks)
+            levels = len(pyramid)
+
+        stat_info = path.stat()
+        entry = {
+            "run": run_id,
+            "date": RAW_NAME_PATTERN.match(path.name).group(1),
+            "test": RAW_NAME_PATTERN.match(path.name).group(2),
+            "source": path.relative_to(PROJECT_ROOT).as_posix(),
+            "source_size": stat_info.st_size,
+            "source_mtime_ns": stat_info.st_mtime_ns,
+            "source_sha256": file_sha256(path),
+            "rows": written,
+            "time_channel": TIME_CHANNEL if time_col is not None else None,
+            "channels": channels,
+            "metadata": source["metadata"],
+            "pyramid": {"base": PYRAMID_BASE, "factor": PYRAMID_FACTOR, "levels": levels},
+            "ingested": time.strftime("%Y-%m-%d %H:%M:%S"),
+            **time_info,
+        }
+        (tmp_dir / "run.json").write_text(json.dumps(entry, indent=2), encoding="utf-8")
+        for child in tmp_dir.iterdir():
+            child.chmod(stat.S_IRUSR | stat.S_IRGRP | stat.S_IROTH)  # Read-only store
+        tmp_dir.chmod(0o755)  # mkdtemp creates 0700
+
+        target = store_dir / run_id
+        if target.exists():
+            remove_tree(target)
+        os.replace(tmp_dir, target)
+    except BaseException:
+        remove_tree(tmp_dir, ignore_errors=True)
+        raise
+    return entry
+
+
+def find_raw_files(data_dir: Path = DATA_DIR) -> list:
+    raw = []
+    for dirpath, dirs, filenames in os.walk(data_dir):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for filename in sorted(filenames):
+            if RAW_NAME_PATTERN.match(filename):
+                raw.append(Path(dirpath) / filename)
+    return raw
+
+
+class Catalog:
+    """Index of ingested runs, queried by date, test name and channel."""
+
+    def __init__(self, store_dir: Path = STORE_DIR):
+        self.store_dir = Path(store_dir)
+        self.path = self.store_dir / CATALOG_NAME
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, json.JSONDecodeError):
+            data = None
+        self.runs = data["runs"] if data and data.get("format") == CATALOG_FORMAT else {}
+
+    def save(self):
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + f".{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps({"format": CATALOG_FORMAT, "runs": self.runs}, indent=1), encoding="utf-8")
+        os.replace(tmp_path, self.path)
+
+    def ingest(self, paths=None, force: bool = False, verbose: bool = True) -> dict:
+        """
+        Ingest raw files that are new or changed (all of testing/data by default).
+
+        Returns:
+            dict: {"ingested": [...], "current": n, "removed": [...], "failed": [(path, error)]}
+        """
+        scan_all = paths is None
+        paths = find_raw_files() if scan_all else [Path(p).resolve() for p in paths]
+        summary = {"ingested": [], "current": 0, "removed": [], "failed": []}
+        seen = {}   # run id -> raw file
+        for path in paths:
+            if not RAW_NAME_PATTERN.match(path.name):
+                summary["failed"].append((str(path), "name is not YYYY-MM-DD_test-name_raw.csv/.json"))
+                continue
+            run_id = run_id_for(path)
+            entry = self.runs.get(run_id)
+            # X_raw.csv and X_raw.json map to the same run - never let one silently replace the other
+            other = seen.get(run_id)
+            if other is None and entry and (PROJECT_ROOT / entry["source"]).is_file():
+                other = (PROJECT_ROOT / entry["source"]).resolve()
+            if other is not None and other != path.resolve():
+                summary["failed"].append((str(path), f"run id {run_id} is already used by {other} - rename one"))
+                continue
+            seen[run_id] = path.resolve()
+            stat_info = path.stat()
+            if (not force and entry and entry["source_size"] == stat_info.st_size
+                    and entry["source_mtime_ns"] == stat_info.st_mtime_ns
+                    and (self.store_dir / run_id / "run.json").is_file()):
+                summary["current"] += 1
+                continue
+            start = time.perf_counter()
+            try:
+                self.runs[run_id] = ingest_file(path, self.store_dir)
+            except (OSError, ValueError, UnicodeDecodeError) as e:
+                summary["failed"].append((str(path), str(e)))
+                continue
+            summary["ingested"].append(run_id)
+            if verbose:
+                entry = self.runs[run_id]
+                print(f"  {run_id}: {entry['rows']:,} rows x {len(entry['channels'])} channels"
+                      f" ({time.perf_counter() - start:.2f} s)")
+
+        if scan_all:
+            for run_id in set(self.runs) - set(seen):
+                remove_tree(self.store_dir / run_id, ignore_errors=True)
+                del self.runs[run_id]
+                summary["removed"].append(run_id)
+        if summary["ingested"] or summary["removed"]:
+            self.save()
+        return summary
+
+    def find(self, test=None, since=None, until=None, channel=None, date=None) -> list:
+        """Run ids matching all given filters, oldest first. test matches a substring of the test name."""
+        runs = []
+        for run_id, entry in sorted(self.runs.items(), key=lambda item: (item[1]["date"], item[0])):
+            if test and test.lower() not in entry["test"].lower():
+                continue
+            if date and entry["date"] != date:
+                continue
+            if since and entry["date"] < since:
+                continue
+            if until and entry["date"] > until:
+                continue
+            if channel and channel not in entry["channels"]:
+                continue
+            runs.append(run_id)
+        return runs
+
+    def entry(self, run_id: str) -> dict:
+        if run_id not in self.runs:
+            raise KeyError(f"{run_id} is not in the test data catalog - run: python scripts/testdata.py ingest")
+        return self.runs[run_id]
+
+    def channel(self, run_id: str, name: str) -> np.ndarray:
+        """One channel, memory-mapped read-only."""
+        entry = self.entry(run_id)
+        if name not in entry["channels"]:
+            raise KeyError(f"{run_id} has no channel '{name}' (have {', '.join(entry['channels'])})")
+        return np.load(self.store_dir / run_id / entry["channels"][name]["file"], mmap_mode="r")
+
+    def time_slice(self, run_id: str, t=None) -> slice:
+        """Row range for a (t_start, t_end) window - binary search on the time channel."""
+        entry = self.entry(run_id)
+        if t is None:
+            return slice(0, entry["rows"])
+        if not entry.get("time_channel") or not entry.get("time_sorted"):
+            raise ValueError(f"{run_id}: time-range selection needs a sorted time column")
+        times = self.channel(run_id, entry["time_channel"])
+        lo = np.searchsorted(times, t[0], side="left") if t[0] is not None else 0
+        hi = np.searchsorted(times, t[1], side="right") if t[1] is not None else entry["rows"]
+        return slice(int(lo), int(hi))
+
+    def load(self, run_id: str, channels=None, t=None) -> dict:
+        """
+        Load channels of a run, optionally restricted to a time window.
+
+        Returns:
+            dict: {channel: array} - memory-mapped views, plus the time channel if present
+        """
+        entry = self.entry(run_id)
+        names = list(entry["channels"]) if channels is None else list(channels)
+        if entry.get("time_channel") and entry["time_channel"] not in names:
+            names.insert(0, entry["time_channel"])
+        rows = self.time_slice(run_id, t)
+        return {name: self.channel(run_id, name)[rows] for name in names}
+
+    def overview(self, run_id: str, channel: str, t=None, width: int = 1000) -> dict:
+        """
+        A channel reduced to roughly `width` points over a time window, for plotting.
+
+        Picks the coarsest pyramid level that still has at least `width` blocks
+        in the window. Windows too short for that are reduced from the raw
+        samples in blocks of ceil(n / width), or returned raw when they have
+        at most 2 * width samples.
+
+        Returns:
+            dict: {"time", "min", "max", "mean"} arrays (min == max == mean for raw
+            samples), "block" (samples per point, 1 for raw), "unit"
+        """
+        entry = self.entry(run_id)
+        if channel not in entry["channels"]:
+            raise KeyError(f"{run_id} has no channel '{channel}' (have {', '.join(entry['channels'])})")
+        rows = self.time_slice(run_id, t)
+        lo, hi = rows.start, rows.stop
+        time_channel = entry.get("time_channel")
+        unit = entry["channels"][channel]["unit"]
+
+        level = -1
+        while (level + 1 < entry["pyramid"]["levels"]
+               and (hi - lo) / (entry["pyramid"]["base"] * entry["pyramid"]["factor"] ** (level + 1)) >= width):
+            level += 1
+        if level < 0:
+            values = np.asarray(self.channel(run_id, channel)[lo:hi], dtype=float)
+            times = (np.asarray(self.channel(run_id, time_channel)[lo:hi], dtype=float) if time_channel
+                     else np.arange(lo, hi, dtype=float))
+            if hi - lo <= 2 * width:
+                return {"time": times, "min": values, "max": values, "mean": values, "block": 1, "unit": unit}
+            block = -(-(hi - lo) // width)
+            blocks = sample_blocks(values, block)
+            return {"time": sample_blocks(times, block)[:, MEAN], "min": blocks[:, MIN], "max": blocks[:, MAX],
+                    "mean": blocks[:, MEAN], "block": block, "unit": unit}
+
+        block = entry["pyramid"]["base"] * entry["pyramid"]["factor"] ** level
+        first, last = lo // block, -(-hi // block)
+        run_dir = self.store_dir / run_id
+        blocks = np.load(run_dir / pyramid_file(entry["channels"][channel]["file"], level), mmap_mode="r")
+        blocks = np.asarray(blocks[first:last])
+        if time_channel:
+            times = np.load(run_dir / pyramid_file(entry["channels"][time_channel]["file"], level), mmap_mode="r")
+            times = np.asarray(times[first:last, MEAN])
+        else:
+            times = (np.arange(first, last) + 0.5) * block
+        return {"time": times, "min": blocks[:, MIN], "max": blocks[:, MAX], "mean": blocks[:, MEAN],
+                "block": block, "unit": unit}
+
+
+# ---------------------------------------------------------------------------
+# Charts
+# ---------------------------------------------------------------------------
+
+class ZoomPlot:
+    """
+    Min/max band plus mean line on a matplotlib Axes that reloads the
+    appropriate pyramid level whenever the x-axis is zoomed or panned.
+    """
+
+    def __init__(self, ax, run_id: str, channel: str, catalog=None, t=None, **line_kwargs):
+        self.ax = ax
+        self.run_id = run_id
+        self.channel = channel
+        self.catalog = catalog or Catalog()
+        self.band = None
+        data = self.fetch(t)
+        (self.line,) = ax.plot(data["time"], data["mean"], lw=0.8, **line_kwargs)
+        self.draw_band(data)
+        ax.set_xlabel("Time [s]" if self.catalog.entry(run_id).get("time_channel") else "Sample")
+        ax.set_ylabel(f"{channel} [{data['unit']}]" if data["unit"] else channel)
+        ax.callbacks.connect("xlim_changed", self.on_xlim)
+
+    def fetch(self, t):
+        width = max(200, int(self.ax.get_window_extent().width))
+        return self.catalog.overview(self.run_id, self.channel, t=t, width=width)
+
+    def draw_band(self, data):
+        if self.band is not None:
+            self.band.remove()
+            self.band = None
+        if data["block"] > 1:
+            self.band = self.ax.fill_between(data["time"], data["min"], data["max"], lw=0, alpha=0.3,
+                                             color=self.line.get_color())
+
+    def on_xlim(self, ax):
+        lo, hi = ax.get_xlim()
+        entry = self.catalog.entry(self.run_id)
+        t = (lo, hi) if entry.get("time_sorted") else None
+        data = self.fetch(t)
+        self.line.set_data(data["time"], data["mean"])
+        self.draw_band(data)
+        ax.figure.canvas.draw_idle()
+
+
+def nice_ticks(lo: float, hi: float, count: int = 5) -> list:
+    """Round-numbered ticks spanning about [lo, hi]."""
+    if not np.isfinite(lo) or not np.isfinite(hi) or hi <= lo:
+        return [lo] if np.isfinite(lo) else []
+    raw = (hi - lo) / count
+    magnitude = 10 ** np.floor(np.log10(raw))
+    step = next(m * magnitude for m in (1, 2, 2.5, 5, 10) if m * magnitude >= raw)
+    start = np.ceil(lo / step) * step
+    return [float(v) for v in np.arange(start, hi + step * 1e-9, step)]
+
+
+def chart_svg(data: dict, title: str, width: int = 640, height: int = 180) -> str:
+    """A small standalone SVG chart of an overview() result - band of min/max, line of mean."""
+    left, right, top, bottom = 56, 12, 22, 28
+    plot_w, plot_h = width - left - right, height - top - bottom
+    t = data["time"]
+    finite = np.isfinite(data["mean"]) & np.isfinite(t)
+    if not finite.any():
+        raise ValueError(f"{title}: no finite samples in the requested window")
+    t0, t1 = float(t[finite].min()), float(t[finite].max())
+    y0, y1 = float(np.nanmin(data["min"][finite])), float(np.nanmax(data["max"][finite]))
+    if t1 <= t0:
+        t1 = t0 + 1
+    if y1 <= y0:
+        y0, y1 = y0 - 0.5, y1 + 0.5
+    pad = (y1 - y0) * 0.05
+    y0, y1 = y0 - pad, y1 + pad
+
+    def x_px(v):
+        return left + (np.asarray(v) - t0) / (t1 - t0) * plot_w
+
+    def y_px(v):
+        return top + (y1 - np.asarray(v)) / (y1 - y0) * plot_h
+
+    def points(xs, ys):
+        return " ".join(f"{x:.1f},{y:.1f}" for x, y in zip(xs, ys))
+
+    parts = [f'<svg xmlns="http://www.w3.org/2000/svg" width="{width}" height="{height}" '
+             f'viewBox="0 0 {width} {height}" font-family="sans-serif" font-size="10">',
+             f'<rect width="{width}" height="{height}" fill="white"/>',
+             f'<text x="{left}" y="14" font-size="11" font-weight="bold">{escape(title)}</text>']
+    for v in nice_ticks(y0, y1):
+        y = y_px(v)
+        parts.append(f'<line x1="{left}" x2="{left + plot_w}" y1="{y:.1f}" y2="{y:.1f}" stroke="#e5e5e5"/>')
+        parts.append(f'<text x="{left - 4}" y="{y + 3:.1f}" text-anchor="end">{v:g}</text>')
+    for v in nice_ticks(t0, t1, 6):
+        x = x_px(v)
+        parts.append(f'<text x="{x:.1f}" y="{top + plot_h + 14}" text-anchor="middle">{v:g}</text>')
+
+    # Gaps (blocks with no finite samples) split the band and line into segments
+    edges = np.flatnonzero(np.diff(np.concatenate(([0], finite.astype(np.int8), [0]))))
+    for start, stop in zip(edges[::2], edges[1::2]):
+        xs = x_px(t[start:stop])
+        if data["block"] > 1:
+            outline = points(np.concatenate((xs, xs[::-1])),
+                             np.concatenate((y_px(data["max"][start:stop]), y_px(data["min"][start:stop])[::-1])))
+            parts.append(f'<polygon points="{outline}" fill="#1f77b4" fill-opacity="0.25"/>')
+        parts.append(f'<polyline points="{points(xs, y_px(data["mean"][start:stop]))}" fill="none" '
+                     f'stroke="#1f77b4" stroke-width="1"/>')
+    parts.append(f'<rect x="{left}" y="{top}" width="{plot_w}" height="{plot_h}" fill="none" stroke="#888"/>')
+    parts.append("</svg>")
+    return "\n".join(parts) + "\n"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Ingest and query raw test data")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ingest_parser = sub.add_parser("ingest", help="Convert new or changed raw files into the columnar store")
+    ingest_parser.add_argument("paths", nargs="*", help="Raw files (default: all of testing/data)")
+    ingest_parser.add_argument("--force", action="store_true", help="Re-ingest even if unchanged")
+
+    list_parser = sub.add_parser("list", help="List ingested runs")
+    list_parser.add_argument("--test", help="Test name contains this text")
+    list_parser.add_argument("--since", help="On or after YYYY-MM-DD")
+    list_parser.add_argument("--until", help="On or before YYYY-MM-DD")
+    list_parser.add_argument("--channel", help="Has this channel")
+
+    show_parser = sub.add_parser("show", help="Show a run's channels and metadata")
+    show_parser.add_argument("run", help="Run id (YYYY-MM-DD_test-name)")
+
+    chart_parser = sub.add_parser("chart", help="Write a small SVG chart of a channel for a results report")
+    chart_parser.add_argument("run", help="Run id (YYYY-MM-DD_test-name)")
+    chart_parser.add_argument("channel", help="Channel name")
+    chart_parser.add_argument("--t", nargs=2, type=float, metavar=("START", "END"), help="Time window [s]")
+    chart_parser.add_argument("--width", type=int, default=640, help="Chart width in pixels")
+    chart_parser.add_argument("--height", type=int, default=180, help="Chart height in pixels")
+    chart_parser.add_argument("--out", help="Output path (default: testing/results/<run>_<channel>.svg)")
+
+    args = parser.parse_args()
+    catalog = Catalog()
+
+    if args.command == "ingest":
+        start = time.perf_counter()
+        summary = catalog.ingest(args.paths or None, force=args.force)
+        for path, error in summary["failed"]:
+            print(f"  [FAIL] {path}: {error}")
+        print(f"\n{len(summary['ingested'])} ingested, {summary['current']} current, "
+              f"{len(summary['removed'])} removed, {len(summary['failed'])} failed "
+              f"({time.perf_counter() - start:.2f} s)")
+        sys.exit(1 if summary["failed"] else 0)
+
+    elif args.command == "list":
+        runs = catalog.find(test=args.test, since=args.since, until=args.until, channel=args.channel)
+        for run_id in runs:
+            entry = catalog.runs[run_id]
+            span = ""
+            if entry.get("t_start") is not None:
+                span = f"  t {entry['t_start']:g}-{entry['t_end']:g} s"
+            print(f"{run_id:<40} {entry['rows']:>10,} rows  {len(entry['channels']):>3} channels{span}")
+        print(f"\n{len(runs)} of {len(catalog.runs)} runs")
+
+    elif args.command == "show":
+        try:
+            entry = catalog.entry(args.run)
+        except KeyError as e:
+            print(f"ERROR: {e.args[0]}")
+            sys.exit(1)
+        print(f"{entry['run']}  ({entry['source']}, {entry['rows']:,} rows)")
+        if entry.get("sample_rate_hz"):
+            print(f"  Sample rate: {entry['sample_rate_hz']:g} Hz, t {entry['t_start']:g}-{entry['t_end']:g} s")
+        for key, value in entry["metadata"].items():
+            print(f"  {key}: {value}")
+        print("  Channels:")
+        for name, channel in entry["channels"].items():
+            print(f"    {name}" + (f" [{channel['unit']}]" if channel["unit"] else ""))
+
+    elif args.command == "chart":
+        try:
+            data = catalog.overview(args.run, args.channel, t=args.t, width=args.width)
+            title = f"{args.run} - {args.channel}" + (f" [{data['unit']}]" if data["unit"] else "")
+            svg = chart_svg(data, title, width=args.width, height=args.height)
+        except (KeyError, ValueError) as e:
+            print(f"ERROR: {e.args[0]}")
+            sys.exit(1)
+        out = Path(args.out) if args.out else RESULTS_DIR / f"{args.run}_{channel_file(args.channel)}.svg"
+        out.parent.mkdir(parents=True, exist_ok=True)
+        out.write_text(svg, encoding="utf-8")
+        print(f"Wrote {out} ({len(data['time']):,} points, {data['block']} samples each)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,637 @@
+#!/usr/bin/env python3
+"""
+Streaming Test Data Pipeline
+
+Processes test data in fixed-size chunks - reader -> stages -> sinks - so
+memory stays flat however long the capture is. Stages are vectorized NumPy
+and carry just enough state across chunk boundaries (filter history, a
+partial decimation block, the rolling window) that the output matches
+processing the whole run at once.
+
+The reader and the sinks each run in a background thread behind bounded
+queues, so disk reads and writes overlap with computation.
+
+In a notebook (testing/analysis/):
+    sys.path.append('../../scripts')
+    from testdata_stream import Pipeline, RunReader, MovingAverage, Decimate, Rolling, Summary, NpzWriter
+
+    summary = Summary()
+    Pipeline(RunReader("2025-03-01_hot-fire-3", channels=["EGT", "RPM"]),
+             [MovingAverage(50), Decimate(10), Rolling(1000, stats=("mean", "max"))],
+             [summary, NpzWriter("testing/results/2025-03-01_hot-fire-3_processed.npz")]).run()
+    print(summary.to_markdown())
+
+Run:
+    python scripts/testdata_stream.py 2025-03-01_hot-fire-3 --channels EGT RPM --decimate 10 --rolling 1.0
+    (writes testing/results/<run>_summary.md and .json)
+"""
+
+import argparse
+import json
+import os
+import queue
+import sys
+import threading
+import time
+import zipfile
+from pathlib import Path
+
+try:
+    import numpy as np
+except ImportError:
+    print("ERROR: numpy is required (pip install -r requirements-engineering.txt)")
+    sys.exit(1)
+
+from param_registry import PROJECT_ROOT
+from testdata import Catalog, parse_chunk, split_unit
+
+RESULTS_DIR = PROJECT_ROOT / "testing" / "results"
+CHUNK_ROWS = 1_000_000
+QUEUE_DEPTH = 2     # Chunks in flight per queue - bounds memory at a few chunks
+
+
+# ---------------------------------------------------------------------------
+# Readers - iterables of {channel: array} chunks
+# ---------------------------------------------------------------------------
+
+class RunReader:
+    """Chunks of an ingested run (see testdata.py), read from the memory-mapped store."""
+
+    def __init__(self, run_id: str, channels=None, t=None, chunk_rows: int = CHUNK_ROWS, catalog=None):
+        self.catalog = catalog or Catalog()
+        self.entry = self.catalog.entry(run_id)
+        self.run_id = run_id
+        self.channels = list(self.entry["channels"]) if channels is None else list(channels)
+        time_channel = self.entry.get("time_channel")
+        if time_channel and time_channel not in self.channels:
+            self.channels.insert(0, time_channel)
+        self.rows = self.catalog.time_slice(run_id, t)
+        self.chunk_rows = chunk_rows
+        self.units = {name: self.entry["channels"][name]["unit"] for name in self.channels}
+
+    def __iter__(self):
+        arrays = {name: self.catalog.channel(self.run_id, name) for name in self.channels}
+        for start in range(self.rows.start, self.rows.stop, self.chunk_rows):
+            stop = min(start + self.chunk_rows, self.rows.stop)
+            # np.array copies out of the mapping, so pages are released as we go
+            yield {name: np.array(array[start:stop]) for name, array in arrays.items()}
+
+
+class CsvReader:
+    """Chunks of a raw CSV that has not been ingested."""
+
+    def __init__(self, path, channels=None, chunk_rows: int = CHUNK_ROWS):
+        self.path = Path(path)
+        with open(self.path, encoding="utf-8-sig") as f:
+            header = f.readline().rstrip("\r\n").split(",")
+        names, units = zip(*(split_unit(c) for c in header))
+        self.columns = ["time" if n.lower() in ("time", "t", "timestamp", "time_s") else n for n in names]
+        self.units = dict(zip(self.columns, units))
+        self.channels = self.columns if channels is None else \
+            [c for c in self.columns if c in channels or c == "time"]
+        self.chunk_rows = chunk_rows
+
+    def __iter__(self):
+        index = [self.columns.index(c) for c in self.channels]
+        with open(self.path, encoding="utf-8-sig") as f:
+            f.readline()
+            while True:
+                lines = [line for _, line in zip(range(self.chunk_rows), f) if line.strip()]
+                if not lines:
+                    break
+                block = parse_chunk(lines, len(self.columns))
+                yield {c: block[:, i].copy() for c, i in zip(self.channels, index)}
+
+
+# ---------------------------------------------------------------------------
+# Kernels
+# ---------------------------------------------------------------------------
+
+def sliding_sum(x: np.ndarray, window: int) -> np.ndarray:
+    """sum(x[i:i+window]) for every full window.
+
+    Uses block prefix/suffix sums rather than one running cumsum, so each
+    result adds at most `window` terms and precision does not degrade along
+    a long chunk.
+    """
+    n = len(x)
+    pad = (-n) % window
+    blocks = np.concatenate((x, np.zeros(pad))).reshape(-1, window)
+    prefix = np.cumsum(blocks, axis=1).ravel()
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    starts = np.arange(n - window + 1)
+    sums = suffix[starts] + prefix[starts + window - 1]
+    aligned = starts % window == 0   # Window is exactly one block
+    sums[aligned] = suffix[starts[aligned]]
+    return sums
+
+
+def with_history(ext: np.ndarray, window: int, n: int) -> np.ndarray:
+    """The last n samples of ext preceded by exactly window - 1 samples of history (NaN where none)."""
+    history = min(len(ext) - n, window - 1)
+    return np.concatenate((np.full(window - 1 - history, np.nan), ext[len(ext) - n - history:]))
+
+
+def trailing_sums(ext: np.ndarray, window: int, n: int) -> tuple:
+    """Sum and count of finite values over the window ending at each of the last n samples of ext."""
+    padded = with_history(ext, window, n)
+    finite = np.isfinite(padded)
+    return sliding_sum(np.where(finite, padded, 0.0), window), sliding_sum(finite.astype(float), window)
+
+
+def block_means(values: np.ndarray, factor: int) -> np.ndarray:
+    """Mean of each run of `factor` samples, ignoring NaNs (all-NaN blocks give NaN)."""
+    blocks = values.reshape(-1, factor)
+    finite = np.isfinite(blocks)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        return np.where(finite, blocks, 0.0).sum(axis=1) / finite.sum(axis=1)
+
+
+def sliding_max(x: np.ndarray, window: int) -> np.ndarray:
+    """max(x[i:i+window]) for every full window - O(n) via block prefix/suffix maxima."""
+    n = len(x)
+    pad = (-n) % window
+    blocks = np.concatenate((x, np.full(pad, -np.inf))).reshape(-1, window)
+    prefix = np.maximum.accumulate(blocks, axis=1).ravel()
+    suffix = np.maximum.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    return np.maximum(suffix[:n - window + 1], prefix[window - 1:n])
+
+
+# ---------------------------------------------------------------------------
+# Stages - process(chunk) -> chunk, finish() -> final chunk or None
+# ---------------------------------------------------------------------------
+
+class Stage:
+    time_channel = "time"
+
+    def process(self, chunk: dict) -> dict:
+        raise NotImplementedError
+
+    def finish(self):
+        return None
+
+    def data_channels(self, chunk: dict) -> list:
+        return [name for name in chunk if name != self.time_channel]
+
+
+class Where(Stage):
+    """Keep rows where condition(chunk) is True, e.g. Where(lambda c: c["RPM"] > 50000)."""
+
+    def __init__(self, condition):
+        self.condition = condition
+
+    def process(self, chunk):
+        mask = np.asarray(self.condition(chunk), dtype=bool)
+        return {name: values[mask] for name, values in chunk.items()}
+
+
+class MovingAverage(Stage):
+    """Causal moving-average low-pass over `window` samples (NaNs ignored)."""
+
+    def __init__(self, window: int, channels=None):
+        self.window = int(window)
+        self.channels = channels
+        self.carry = {}
+
+    def process(self, chunk):
+        out = dict(chunk)
+        for name in self.channels or self.data_channels(chunk):
+            ext = np.concatenate((self.carry.get(name, np.empty(0)), chunk[name]))
+            sums, counts = trailing_sums(ext, self.window, len(chunk[name]))
+            with np.errstate(invalid="ignore", divide="ignore"):
+                out[name] = np.where(counts > 0, sums / counts, np.nan)
+            self.carry[name] = ext[-(self.window - 1):] if self.window > 1 else np.empty(0)
+        return out
+
+
+class Decimate(Stage):
+    """Average every `factor` samples into one (time included), carrying partial blocks."""
+
+    def __init__(self, factor: int):
+        self.factor = int(factor)
+        self.carry = None
+
+    def process(self, chunk):
+        if self.carry:
+            chunk = {name: np.concatenate((self.carry[name], values)) for name, values in chunk.items()}
+        n = len(next(iter(chunk.values()), ()))
+        full = n - n % self.factor
+        self.carry = {name: values[full:] for name, values in chunk.items()}
+        return {name: block_means(values[:full], self.factor) for name, values in chunk.items()}
+
+    def finish(self):
+        if not self.carry or not len(next(iter(self.carry.values()))):
+            return None
+        return {name: block_means(values, len(values)) for name, values in self.carry.items()}
+
+
+class Resample(Stage):
+    """Linear interpolation onto a uniform time grid at rate_hz (time must be increasing)."""
+
+    def __init__(self, rate_hz: float):
+        self.step = 1.0 / rate_hz
+        self.next_t = None
+        self.last = None
+
+    def process(self, chunk):
+        t = chunk[self.time_channel]
+        if not len(t):
+            return chunk
+        if self.last is not None:
+            chunk = {name: np.concatenate(([self.last[name]], values)) for name, values in chunk.items()}
+            t = chunk[self.time_channel]
+        if self.next_t is None:
+            self.next_t = t[0]
+        count = int(np.floor((t[-1] - self.next_t) / self.step)) + 1 if t[-1] >= self.next_t else 0
+        grid = self.next_t + self.step * np.arange(count)
+        self.next_t = self.next_t + self.step * count
+        self.last = {name: values[-1] for name, values in chunk.items()}
+        out = {self.time_channel: grid}
+        for name in self.data_channels(chunk):
+            out[name] = np.interp(grid, t, chunk[name])
+        return out
+
+
+class Rolling(Stage):
+    """Add trailing-window statistics as <channel>_<stat> columns (mean, std, min, max)."""
+
+    STATS = ("mean", "std", "min", "max")
+
+    def __init__(self, window: int, stats=("mean", "std", "min", "max"), channels=None):
+        unknown = set(stats) - set(self.STATS)
+        if unknown:
+            raise ValueError(f"Unknown rolling statistics: {', '.join(sorted(unknown))}")
+        self.window = int(window)
+        self.stats = tuple(stats)
+        self.channels = channels
+        self.carry = {}
+
+    def process(self, chunk):
+        out = dict(chunk)
+        w = self.window
+        for name in self.channels or self.data_channels(chunk):
+            x = chunk[name]
+            n = len(x)
+            ext = np.concatenate((self.carry.get(name, np.empty(0)), x))
+            if "mean" in self.stats or "std" in self.stats:
+                # Shift to the chunk's mean first: sums of squares of raw
+                # values (EGT ~ 600) would cancel catastrophically
+                finite = np.isfinite(ext)
+                shift = ext[finite].mean() if finite.any() else 0.0
+                centred = ext - shift
+                sums, counts = trailing_sums(centred, w, n)
+                with np.errstate(invalid="ignore", divide="ignore"):
+                    offset = np.where(counts > 0, sums / counts, np.nan)
+                    if "mean" in self.stats:
+                        out[f"{name}_mean"] = offset + shift
+                    if "std" in self.stats:
+                        squares, _ = trailing_sums(centred * centred, w, n)
+                        var = np.where(counts > 1, (squares - counts * offset * offset) / np.maximum(counts - 1, 1),
+                                       np.nan)
+                        out[f"{name}_std"] = np.sqrt(np.maximum(var, 0.0))
+            if "min" in self.stats or "max" in self.stats:
+                padded = with_history(ext, w, n)
+                if "max" in self.stats:
+                    high = sliding_max(np.where(np.isnan(padded), -np.inf, padded), w)
+                    out[f"{name}_max"] = np.where(np.isneginf(high), np.nan, high)
+                if "min" in self.stats:
+                    low = -sliding_max(np.where(np.isnan(padded), -np.inf, -padded), w)
+                    out[f"{name}_min"] = np.where(np.isposinf(low), np.nan, low)
+            self.carry[name] = ext[-(w - 1):] if w > 1 else np.empty(0)
+        return out
+
+
+# ---------------------------------------------------------------------------
+# Sinks - consume(chunk), then close() on success or abort() on failure
+# ---------------------------------------------------------------------------
+
+class Summary:
+    """Per-channel count, mean, std, min and max (with time of min/max), merged chunk by chunk."""
+
+    def __init__(self, time_channel: str = "time"):
+        self.time_channel = time_channel
+        self.stats = {}
+        self.units = {}
+
+    def consume(self, chunk: dict):
+        t = chunk.get(self.time_channel)
+        for name, values in chunk.items():
+            if name == self.time_channel:
+                continue
+            finite = np.isfinite(values)
+            n = int(finite.sum())
+            if not n:
+                continue
+            x = values[finite]
+            mean, m2 = float(x.mean()), float(((x - x.mean()) ** 2).sum())
+            i_min, i_max = int(np.argmin(x)), int(np.argmax(x))
+            times = t[finite] if t is not None else None
+            s = self.stats.get(name)
+            if s is None:
+                self.stats[name] = {"count": n, "mean": mean, "m2": m2, "min": float(x[i_min]), "max": float(x[i_max]),
+                                    "t_min": float(times[i_min]) if times is not None else None,
+                                    "t_max": float(times[i_max]) if times is not None else None}
+                continue
+            # Chan et al. parallel merge of mean/variance
+            total = s["count"] + n
+            delta = mean - s["mean"]
+            s["mean"] += delta * n / total
+            s["m2"] += m2 + delta * delta * s["count"] * n / total
+            s["count"] = total
+            if x[i_min] < s["min"]:
+                s["min"], s["t_min"] = float(x[i_min]), float(times[i_min]) if times is not None else None
+            if x[i_max] > s["max"]:
+                s["max"], s["t_max"] = float(x[i_max]), float(times[i_max]) if times is not None else None
+
+    def close(self):
+        pass
+
+    def abort(self):
+        pass
+
+    def results(self) -> dict:
+        return {name: {"count": s["count"], "mean": s["mean"],
+                       "std": (s["m2"] / (s["count"] - 1)) ** 0.5 if s["count"] > 1 else 0.0,
+                       "min": s["min"], "max": s["max"], "t_min": s["t_min"], "t_max": s["t_max"],
+                       "unit": self.unit(name)}
+                for name, s in self.stats.items()}
+
+    def unit(self, name: str) -> str:
+        """Unit of a channel, or of the channel a rolling column (EGT_mean) derives from."""
+        if name in self.units:
+            return self.units[name]
+        base, _, stat = name.rpartition("_")
+        return self.units.get(base, "") if stat in Rolling.STATS else ""
+
+    def to_markdown(self) -> str:
+        """Measured-values table in the layout of templates/test-results-template.md."""
+        lines = ["| Channel | Mean | Std | Min | Max | Units | Samples |",
+                 "|---------|------|-----|-----|-----|-------|---------|"]
+        for name, r in self.results().items():
+            lines.append(f"| {name} | {r['mean']:.4g} | {r['std']:.3g} | {r['min']:.4g} | {r['max']:.4g} "
+                         f"| {r['unit'] or '-'} | {r['count']:,} |")
+        return "\n".join(lines)
+
+
+class CsvWriter:
+    """Append processed chunks to a CSV file (written under a temporary name until the run completes)."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self.file = None
+        self.columns = None
+
+    def consume(self, chunk: dict):
+        if self.file is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self.file = open(self.tmp_path, "w", encoding="utf-8")
+            self.columns = list(chunk)
+            self.file.write(",".join(self.columns) + "\n")
+        np.savetxt(self.file, np.column_stack([chunk[c] for c in self.columns]), delimiter=",", fmt="%.9g")
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            os.replace(self.tmp_path, self.path)
+
+    def abort(self):
+        if self.file is not None:
+            self.file.close()
+        self.tmp_path.unlink(missing_ok=True)
+
+
+class NpzWriter:
+    """Stream processed chunks into an .npz (one array per channel) without holding them in memory."""
+
+    def __init__(self, path):
+        self.path = Path(path)
+        self.parts = {}
+        self.counts = {}
+
+    def consume(self, chunk: dict):
+        for name, values in chunk.items():
+            if name not in self.parts:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self.parts[name] = open(self.path.with_name(f".{self.path.name}.{len(self.parts)}.part"), "w+b")
+                self.counts[name] = 0
+            np.asarray(values, dtype=float).tofile(self.parts[name])
+            self.counts[name] += len(values)
+
+    def close(self):
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        with zipfile.ZipFile(tmp_path, "w", allowZip64=True) as archive:
+            for name, part in self.parts.items():
+                part.seek(0)
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as entry:
+                    np.lib.format.write_array_header_2_0(
+                        entry, {"descr": "<f8", "fortran_order": False, "shape": (self.counts[name],)})
+                    while True:
+                        block = part.read(1 << 24)
+                        if not block:
+                            break
+                        entry.write(block)
+                part.close()
+                os.remove(part.name)
+        os.replace(tmp_path, self.path)
+
+    def abort(self):
+        for part in self.parts.values():
+            part.close()
+            Path(part.name).unlink(missing_ok=True)
+        self.parts = {}
+        self.path.with_name(self.path.name + ".tmp").unlink(missing_ok=True)
+
+
+# ---------------------------------------------------------------------------
+# Pipeline
+# ---------------------------------------------------------------------------
+
+_DONE = object()
+_FAILED = object()      # Like _DONE, but the sinks discard their output instead of publishing it
+
+
+class Pipeline:
+    """reader -> stages -> sinks, with reading and writing on background threads."""
+
+    def __init__(self, reader, stages=(), sinks=()):
+        self.reader = reader
+        self.stages = list(stages)
+        self.sinks = list(sinks)
+        for sink in self.sinks:
+            if isinstance(sink, Summary) and hasattr(reader, "units"):
+                sink.units.update(reader.units)
+
+    def run(self) -> dict:
+        """
+        Run to completion.
+
+        Returns:
+            dict: {"chunks", "rows_in", "rows_out", "seconds"}
+        """
+        inbox = queue.Queue(maxsize=QUEUE_DEPTH)
+        outbox = queue.Queue(maxsize=QUEUE_DEPTH)
+        errors = []
+        stop = threading.Event()
+
+        def read():
+            try:
+                for chunk in self.reader:
+                    while not stop.is_set():
+                        try:
+                            inbox.put(chunk, timeout=0.1)
+                            break
+                        except queue.Full:
+                            continue
+                    if stop.is_set():
+                        return
+            except BaseException as e:
+                errors.append(e)
+            inbox.put(_DONE)
+
+        def abort_sinks():
+            for sink in self.sinks:
+                try:
+                    sink.abort()
+                except OSError:
+                    pass
+
+        def write():
+            try:
+                while True:
+                    chunk = outbox.get()
+                    if chunk is _DONE or chunk is _FAILED:
+                        break
+                    for sink in self.sinks:
+                        sink.consume(chunk)
+                if chunk is _FAILED:
+                    abort_sinks()
+                else:
+                    for sink in self.sinks:
+                        sink.close()
+            except BaseException as e:
+                errors.append(e)
+                stop.set()
+                abort_sinks()
+                while outbox.get() not in (_DONE, _FAILED):  # Keep draining so the producer never blocks
+                    pass
+
+        start = time.perf_counter()
+        stats = {"chunks": 0, "rows_in": 0, "rows_out": 0}
+        reader_thread = threading.Thread(target=read, daemon=True)
+        writer_thread = threading.Thread(target=write, daemon=True)
+        reader_thread.start()
+        writer_thread.start()
+
+        def emit(chunk):
+            if chunk is not None and len(next(iter(chunk.values()), ())):
+                stats["rows_out"] += len(next(iter(chunk.values())))
+                outbox.put(chunk)
+
+        failed = False
+        try:
+            while not stop.is_set():
+                chunk = inbox.get()
+                if chunk is _DONE:
+                    break
+                stats["chunks"] += 1
+                stats["rows_in"] += len(next(iter(chunk.values()), ()))
+                for stage in self.stages:
+                    chunk = stage.process(chunk)
+                emit(chunk)
+            # Flush stage state, each flushed chunk passing through the later stages
+            for i, stage in enumerate(self.stages):
+                tail = stage.finish()
+                for later in self.stages[i + 1:]:
+                    if tail is not None:
+                        tail = later.process(tail)
+                emit(tail)
+        except BaseException:
+            stop.set()
+            failed = True
+            raise
+        finally:
+            # A stage, reader or writer error must not publish a truncated output
+            outbox.put(_FAILED if failed or errors else _DONE)
+            writer_thread.join()
+            stop.set()
+            reader_thread.join(timeout=1)
+
+        if errors:
+            raise errors[0]
+        stats["seconds"] = time.perf_counter() - start
+        return stats
+
+
+def write_summary(summary: Summary, run_id: str, settings: dict, results_dir: Path = RESULTS_DIR) -> tuple:
+    """Write <run>_summary.md and .json to testing/results. Returns the two paths."""
+    results_dir.mkdir(parents=True, exist_ok=True)
+    md_path = results_dir / f"{run_id}_summary.md"
+    json_path = results_dir / f"{run_id}_summary.json"
+    settings_text = ", ".join(f"{k}={v}" for k, v in settings.items() if v not in (None, False)) or "raw data"
+    md_path.write_text(f"# Test Data Summary - {run_id}\n\n"
+                       f"**Generated:** {time.strftime('%Y-%m-%d %H:%M')} by scripts/testdata_stream.py\n"
+                       f"**Processing:** {settings_text}\n\n"
+                       f"## Measured Values\n\n{summary.to_markdown()}\n", encoding="utf-8")
+    json_path.write_text(json.dumps({"run": run_id, "settings": settings, "channels": summary.results()},
+                                    indent=2) + "\n", encoding="utf-8")
+    return md_path, json_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stream an ingested test run through filters and summarize it")
+    parser.add_argument("run", help="Run id from `testdata.py list`")
+    parser.add_argument("--channels", nargs="+", help="Channels to process (default: all)")
+    parser.add_argument("--t", help="Time window start:end in seconds")
+    parser.add_argument("--lowpass", type=float, help="Moving-average window in seconds")
+    parser.add_argument("--decimate", type=int, help="Average every N samples")
+    parser.add_argument("--resample", type=float, help="Resample to this rate in Hz")
+    parser.add_argument("--rolling", type=float, help="Add rolling mean/std/min/max over this many seconds")
+    parser.add_argument("--series", help="Also write the processed series (.npz or .csv)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS, help="Samples per chunk")
+
+    args = parser.parse_args()
+
+    catalog = Catalog()
+    try:
+        t = tuple(float(v) if v else None for v in args.t.split(":")) if args.t else None
+        reader = RunReader(args.run, args.channels, t=t, chunk_rows=args.chunk_rows, catalog=catalog)
+    except (KeyError, ValueError) as e:
+        print(f"ERROR: {e.args[0]}")
+        sys.exit(1)
+
+    rate = reader.entry.get("sample_rate_hz")
+    if (args.lowpass or args.rolling) and not rate:
+        print("ERROR: --lowpass/--rolling need a run with a time channel (to convert seconds to samples)")
+        sys.exit(1)
+
+    stages = []
+    if args.lowpass:
+        stages.append(MovingAverage(max(1, round(args.lowpass * rate))))
+    if args.decimate:
+        stages.append(Decimate(args.decimate))
+        rate = rate / args.decimate if rate else None
+    if args.resample:
+        stages.append(Resample(args.resample))
+        rate = args.resample
+    if args.rolling:
+        stages.append(Rolling(max(1, round(args.rolling * rate))))
+
+    summary = Summary()
+    sinks = [summary]
+    if args.series:
+        sinks.append(CsvWriter(args.series) if args.series.endswith(".csv") else NpzWriter(args.series))
+
+    stats = Pipeline(reader, stages, sinks).run()
+    settings = {"channels": args.channels, "t": args.t, "lowpass_s": args.lowpass, "decimate": args.decimate,
+                "resample_hz": args.resample, "rolling_s": args.rolling}
+    md_path, json_path = write_summary(summary, args.run, settings)
+
+    print(summary.to_markdown())
+    print(f"\n{stats['rows_in']:,} samples in {stats['chunks']} chunks -> {stats['rows_out']:,} "
+          f"in {stats['seconds']:.2f} s")
+    print(f"Wrote {md_path.relative_to(PROJECT_ROOT)} and {json_path.relative_to(PROJECT_ROOT)}")
+
+
+if __name__ == "__main__":
+    main()
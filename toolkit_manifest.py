@@ -0,0 +1,131 @@
+"""
+Toolkit file manifest shared by init-project.py and update-project.py.
+
+Maps toolkit source files to their location inside a project and records the
+content hash of every installed toolkit file in the project's .toolkit-version:
+
+    1.1.0
+
+    # Toolkit manifest (sha256, project path) - maintained by update-project.py
+    3f2a...  .claude/hooks/check-context-update.py
+    ...
+
+The first line stays the plain version string so `head -1 .toolkit-version`
+(and older tooling) keeps working.
+"""
+
+import hashlib
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Toolkit directory -> project directory, copied recursively
+MANAGED_TREES = [
+    ("claude/hooks", ".claude/hooks"),
+    ("claude/commands", ".claude/commands"),
+    ("claude/agents", ".claude/agents"),
+    ("claude/skills", ".claude/skills"),
+    ("claude/SKILL.md", ".claude/SKILL.md"),
+    ("scripts", "scripts"),
+    ("templates", "templates"),
+]
+
+# Toolkit file -> project file
+MANAGED_FILES = [
+    ("claude/settings.json.template", ".claude/settings.json"),
+    ("claude/README.md", ".claude/README.md"),
+    ("requirements-engineering.txt", "requirements-engineering.txt"),
+]
+
+# Installed once if missing, never updated (user-owned afterwards)
+SEED_FILES = [
+    ("claude/settings.local.json", ".claude/settings.local.json"),
+]
+
+IGNORED_DIRS = {"__pycache__", ".ipynb_checkpoints"}
+IGNORED_SUFFIXES = (".pyc", ".pyo")
+
+MANIFEST_HEADER = "# Toolkit manifest (sha256, project path) - maintained by update-project.py"
+
+
+def toolkit_files(toolkit_root: Path) -> dict:
+    """Map project-relative path (posix str) -> toolkit source Path for every managed file."""
+    files = {}
+    for src_rel, dest_rel in MANAGED_TREES:
+        src_dir = toolkit_root / src_rel
+        if not src_dir.is_dir():
+            continue
+        for root, dirs, filenames in os.walk(src_dir):
+            dirs[:] = [d for d in dirs if d not in IGNORED_DIRS]
+            rel_root = Path(root).relative_to(src_dir)
+            for filename in filenames:
+                if filename.endswith(IGNORED_SUFFIXES):
+                    continue
+                files[(Path(dest_rel) / rel_root / filename).as_posix()] = Path(root) / filename
+
+    for src_rel, dest_rel in MANAGED_FILES:
+        src = toolkit_root / src_rel
+        if src.is_file():
+            files[dest_rel] = src
+    return files
+
+
+def file_hash(path: Path):
+    """sha256 hex digest of a file, or None if it does not exist."""
+    digest = hashlib.sha256()
+    try:
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    return digest.hexdigest()
+
+
+def hash_files(paths: dict, workers: int = 8) -> dict:
+    """Hash {key: Path} concurrently. Returns {key: digest or None}."""
+    keys = list(paths)
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(lambda key: file_hash(paths[key]), keys)
+        return dict(zip(keys, digests))
+
+
+def read_version_file(path: Path):
+    """
+    Read .toolkit-version.
+
+    Returns:
+        tuple: (version or "unknown", manifest dict or None for pre-manifest projects)
+    """
+    try:
+        lines = path.read_text(encoding="utf-8").splitlines()
+    except FileNotFoundError:
+        return "unknown", None
+    if not lines:
+        return "unknown", None
+
+    version = lines[0].strip() or "unknown"
+    manifest = None
+    for line in lines[1:]:
+        line = line.strip()
+        if line == MANIFEST_HEADER:
+            manifest = {}
+        elif line and not line.startswith("#") and manifest is not None:
+            digest, rel_path = line.split(None, 1)
+            manifest[rel_path] = digest
+    return version, manifest
+
+
+def write_version_file(path: Path, version: str, manifest: dict):
+    """Atomically write .toolkit-version with the version and file manifest."""
+    lines = [version, "", MANIFEST_HEADER]
+    lines += [f"{digest}  {rel_path}" for rel_path, digest in sorted(manifest.items())]
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+    os.replace(tmp_path, path)
+
+
+def toolkit_version(toolkit_root: Path) -> str:
+    """Version string of the toolkit checkout."""
+    version_file = toolkit_root / "VERSION"
+    return version_file.read_text().strip() if version_file.is_file() else "1.0.0"
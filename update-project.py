@@ -7,26 +7,229 @@ This updates:
 - scripts/
 - templates/
 
+Only files whose content differs from the toolkit are written. Toolkit files
+that were edited locally since the last update are never overwritten: the
+new toolkit version is written next to them as <file>.toolkit-new instead
+(use --overwrite-local to replace them).
+
 It preserves:
 - All project work (calculations, docs, design, etc.)
 - project_params.py
-- CONTEXT.md, CLAUDE.md, WORKFLOW.md (unless forced)
+- CONTEXT.md, CLAUDE.md, WORKFLOW.md
+- Custom scripts and templates
+- .claude/settings.local.json
 
 Usage:
     python update-project.py <project-path>
-    python update-project.py ../projects/my-project --force
+    python update-project.py ../projects/my-project --dry-run
+    python update-project.py ../projects/my-project --overwrite-local
+    python update-project.py --all ../projects --workers 8
 """
 
 import argparse
+import hashlib
+import os
 import shutil
+import subprocess
 import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+from toolkit_manifest import (
+    SEED_FILES,
+    hash_files,
+    read_version_file,
+    toolkit_files,
+    toolkit_version,
+    write_version_file,
+)
+
 TOOLKIT_ROOT = Path(__file__).parent.resolve()
 
+CONFLICT_SUFFIX = ".toolkit-new"
+
+# Generated by toolkit scripts; projects created before it existed lack the entry
+GITIGNORE_ENTRIES = [".toolkit-cache/"]
+
+# Never searched for projects by --all
+DISCOVERY_SKIP_DIRS = {"node_modules", "__pycache__", "chroma_db"}
+
+
+@lru_cache(maxsize=1)
+def toolkit_state() -> tuple:
+    """(sources, hashes) of the managed toolkit files - computed once per run, shared by --all workers."""
+    sources = toolkit_files(TOOLKIT_ROOT)
+    return sources, hash_files(sources)
+
+
+def git_blob_id(path: Path):
+    """git's object id of a file's content (sha1 of 'blob <size>\\0' + data), or None if missing."""
+    try:
+        data = path.read_bytes()
+    except (FileNotFoundError, IsADirectoryError, NotADirectoryError):
+        return None
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def toolkit_history(sources: dict) -> dict:
+    """
+    Every version of each toolkit file ever committed to the toolkit's git history.
+
+    Lets a project without a manifest tell an unedited copy of an older toolkit
+    release apart from a local edit.
+
+    Returns:
+        dict: {project-relative path: set of git blob ids}; {} if the toolkit is not a git checkout
+    """
+    by_source = {src.relative_to(TOOLKIT_ROOT).as_posix(): rel for rel, src in sources.items()}
+    try:
+        out = subprocess.run(
+            ["git", "-c", "core.quotepath=off", "log", "--format=", "--raw", "--no-abbrev", "--no-renames",
+             "--relative"],
+            cwd=TOOLKIT_ROOT, capture_output=True, text=True, check=True
+        ).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+    history = {}
+    for line in out.splitlines():
+        if not line.startswith(":") or "\t" not in line:
+            continue
+        meta, path = line.split("\t", 1)
+        rel = by_source.get(path)
+        if rel is not None:
+            # ':<mode> <mode> <old blob> <new blob> <status>' - all-zero ids mark added/deleted sides
+            history.setdefault(rel, set()).update(b for b in meta.split()[2:4] if b.strip("0"))
+    return history
+
+
+def plan_update(project_path: Path, base: dict, overwrite_local: bool = False) -> dict:
+    """
+    Three-way compare toolkit (theirs), project (ours) and recorded manifest (base).
+
+    Args:
+        project_path: Project root
+        base: Manifest recorded at the last install/update (None if unknown)
+        overwrite_local: Replace locally modified toolkit files
+
+    Returns:
+        dict: Actions keyed by kind, each a list of project-relative paths,
+              plus 'sources', 'theirs' and 'ours' hash maps
+    """
+    sources, theirs = toolkit_state()
+    tracked = set(sources) | set(base or {})
+    ours = hash_files({rel: project_path / rel for rel in tracked})
+    # No manifest yet (project created before manifests existed): files equal to
+    # any committed toolkit version are unedited and can be updated
+    history = toolkit_history(sources) if base is None else {}
+    base = base or {}
+
+    plan = {kind: [] for kind in ("add", "update", "remove", "conflict", "overwrite",
+                                  "kept_local", "kept_deleted", "unchanged")}
+    for rel in sorted(tracked):
+        new, cur, old = theirs.get(rel), ours.get(rel), base.get(rel)
+
+        if new is None:
+            # Dropped from the toolkit: remove only if untouched locally
+            if cur is None:
+                continue
+            plan["remove" if cur == old else "kept_local"].append(rel)
+        elif cur == new:
+            plan["unchanged"].append(rel)
+        elif cur is None:
+            # Deleted locally after install: respect that unless never installed
+            plan["add" if old is None or overwrite_local else "kept_deleted"].append(rel)
+        elif cur == old:
+            plan["update"].append(rel)
+        elif old is None and rel in history and git_blob_id(project_path / rel) in history[rel]:
+            plan["update"].append(rel)
+        elif old == new:
+            # Toolkit unchanged, local edit stays
+            plan["kept_local"].append(rel)
+        elif overwrite_local:
+            plan["overwrite"].append(rel)
+        else:
+            plan["conflict"].append(rel)
+
+    plan["sources"], plan["theirs"], plan["ours"] = sources, theirs, ours
+    return plan
+
 
-def update_project(project_path: Path, force: bool = False, dry_run: bool = False):
-    """Update existing project with latest toolkit files."""
+def apply_plan(project_path: Path, plan: dict):
+    """
+    Stage every new file first, then move them into place.
+
+    Nothing in the project changes if staging fails. Each file is swapped in
+    with an atomic rename; an interrupted apply is completed by re-running,
+    because files already swapped in match the toolkit.
+    """
+    writes = [(rel, project_path / rel) for rel in plan["add"] + plan["update"] + plan["overwrite"]]
+    writes += [(rel, project_path / (rel + CONFLICT_SUFFIX)) for rel in plan["conflict"]]
+    if not writes and not plan["remove"]:
+        return
+
+    staging = Path(tempfile.mkdtemp(prefix=".toolkit-update-", dir=project_path))
+    try:
+        staged = []
+        for i, (rel, dest) in enumerate(writes):
+            tmp = staging / str(i)
+            shutil.copy2(plan["sources"][rel], tmp)
+            staged.append((tmp, dest))
+
+        for tmp, dest in staged:
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            os.replace(tmp, dest)
+        for rel in plan["remove"]:
+            (project_path / rel).unlink(missing_ok=True)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def ensure_gitignore(project_path: Path) -> list:
+    """Append missing GITIGNORE_ENTRIES to the project's .gitignore. Returns the entries added."""
+    gitignore = project_path / ".gitignore"
+    try:
+        text = gitignore.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        text = ""
+    present = {line.strip().rstrip("/") for line in text.splitlines()}
+    missing = [entry for entry in GITIGNORE_ENTRIES if entry.rstrip("/") not in present]
+    if missing:
+        if text and not text.endswith("\n"):
+            text += "\n"
+        block = ("\n" if text else "") + "# Toolkit caches (added by update-project.py)\n" + "\n".join(missing) + "\n"
+        gitignore.write_text(text + block, encoding="utf-8")
+    return missing
+
+
+def next_manifest(plan: dict) -> dict:
+    """Manifest to record after applying the plan."""
+    manifest = {}
+    for rel in plan["add"] + plan["update"] + plan["overwrite"] + plan["unchanged"]:
+        manifest[rel] = plan["theirs"][rel]
+    # Locally edited or deleted files record the toolkit hash as their base, so
+    # the next update still sees them as local changes (and only reports a
+    # conflict again once the toolkit changes the file again)
+    for rel in plan["conflict"] + plan["kept_deleted"] + plan["kept_local"]:
+        if plan["theirs"].get(rel) is not None:
+            manifest[rel] = plan["theirs"][rel]
+    return manifest
+
+
+def update_project(project_path: Path, force: bool = False, dry_run: bool = False,
+                   overwrite_local: bool = False, verbose: bool = True) -> dict:
+    """
+    Update existing project with latest toolkit files.
+
+    Projects whose manifest already matches every toolkit file are skipped
+    unless force is set.
+
+    Returns:
+        dict: Summary with versions, 'status' and the applied plan
+    """
+    log = print if verbose else (lambda *args, **kwargs: None)
 
     project_path = project_path.resolve()
 
@@ -40,131 +243,184 @@ def update_project(project_path: Path, force: bool = False, dry_run: bool = Fals
         sys.exit(1)
 
     # Read current and new versions
-    old_version = "unknown"
     version_file = project_path / ".toolkit-version"
-    if version_file.is_file():
-        old_version = version_file.read_text().strip()
-
-    new_version_file = TOOLKIT_ROOT / "VERSION"
-    new_version = new_version_file.read_text().strip() if new_version_file.is_file() else "1.0.0"
-
-    print(f"Updating project: {project_path}")
-    print(f"  Current version: {old_version}")
-    print(f"  New version: {new_version}")
-    print()
+    old_version, base = read_version_file(version_file)
+    new_version = toolkit_version(TOOLKIT_ROOT)
+
+    log(f"Updating project: {project_path}")
+    log(f"  Current version: {old_version}")
+    log(f"  New version: {new_version}")
+    if base is None:
+        log("  No file manifest recorded - files matching an earlier toolkit version are updated, "
+            "other differences are treated as local edits")
+    log()
+
+    if base is not None and base == toolkit_state()[1] and not force:
+        log("Toolkit files unchanged since the last update - nothing to do (use --force to re-check files)")
+        if not dry_run:
+            for entry in ensure_gitignore(project_path):
+                log(f"Added {entry} to .gitignore")
+        return {"old_version": old_version, "new_version": new_version, "status": "skipped",
+                "changed": 0, "conflicts": 0}
+
+    log("[1/4] Comparing toolkit and project files...")
+    plan = plan_update(project_path, base, overwrite_local=overwrite_local)
+
+    log("[2/4] Planned changes:")
+    for kind, label in (("add", "add"), ("update", "update"), ("overwrite", "overwrite local edit"),
+                        ("remove", "remove"), ("conflict", "conflict"), ("kept_local", "keep local edit"),
+                        ("kept_deleted", "keep deleted")):
+        for rel in plan[kind]:
+            log(f"       {label:<20} {rel}")
+    log(f"       {len(plan['unchanged'])} files already up to date")
+
+    changed = len(plan["add"]) + len(plan["update"]) + len(plan["overwrite"]) + len(plan["remove"])
+    summary = {
+        "old_version": old_version,
+        "new_version": new_version,
+        "status": "dry-run" if dry_run else ("conflicts" if plan["conflict"] else "updated"),
+        "changed": changed,
+        "conflicts": len(plan["conflict"]),
+        "plan": plan,
+    }
 
     if dry_run:
-        print("DRY RUN - Would update:")
-        print("  - .claude/ (hooks, commands, agents, skills, SKILL.md, settings)")
-        print("  - scripts/")
-        print("  - templates/")
-        return
+        log()
+        log("DRY RUN - no files were changed")
+        return summary
+
+    log("[3/4] Applying changes...")
+    apply_plan(project_path, plan)
+
+    # Seed user-owned files (e.g. settings.local.json) only if missing
+    for src_rel, dest_rel in SEED_FILES:
+        src, dest = TOOLKIT_ROOT / src_rel, project_path / dest_rel
+        if src.is_file() and not dest.exists():
+            dest.parent.mkdir(parents=True, exist_ok=True)
+            shutil.copy2(src, dest)
+    for entry in ensure_gitignore(project_path):
+        log(f"      Added {entry} to .gitignore")
+
+    # Update version marker last, so an interrupted update is retried in full
+    log("[4/4] Updating version marker...")
+    write_version_file(version_file, new_version, next_manifest(plan))
+
+    log()
+    log("=" * 60)
+    log(f"UPDATE COMPLETE: {old_version} -> {new_version}")
+    log("=" * 60)
+    log()
+    log(f"Changed: {changed} files "
+        f"({len(plan['add'])} added, {len(plan['update']) + len(plan['overwrite'])} updated, "
+        f"{len(plan['remove'])} removed)")
+    log(f"Unchanged: {len(plan['unchanged'])} files")
+    if plan["kept_local"] or plan["kept_deleted"]:
+        log(f"Local edits kept: {len(plan['kept_local']) + len(plan['kept_deleted'])} files")
+    if plan["conflict"]:
+        log()
+        log(f"CONFLICTS: {len(plan['conflict'])} locally edited files also changed in the toolkit.")
+        log(f"The new toolkit version was written next to each as *{CONFLICT_SUFFIX}:")
+        for rel in plan["conflict"]:
+            log(f"  - {rel}")
+        log("Merge by hand, or re-run with --overwrite-local to take the toolkit versions.")
+    log()
+    log("Preserved:")
+    log("  - All project content (calculations, docs, design, etc.)")
+    log("  - project_params.py")
+    log("  - CONTEXT.md, CLAUDE.md, WORKFLOW.md")
+    log("  - Custom scripts and templates")
+    log("  - .claude/settings.local.json")
+    log()
+    log("Next: Run 'python verify-setup.py' to verify the update")
+
+    return summary
+
+
+def discover_projects(root: Path, max_depth: int = 3) -> list:
+    """Find toolkit projects (directories with .toolkit-version) below root."""
+    projects = []
+
+    def walk(directory: Path, depth: int):
+        if (directory / ".toolkit-version").is_file():
+            projects.append(directory)
+            return  # Projects don't nest
+        if depth >= max_depth:
+            return
+        try:
+            with os.scandir(directory) as it:
+                subdirs = sorted(entry.path for entry in it
+                                 if entry.is_dir(follow_symlinks=False)
+                                 and not entry.name.startswith(".")
+                                 and entry.name not in DISCOVERY_SKIP_DIRS)
+        except PermissionError:
+            return
+        for subdir in subdirs:
+            walk(Path(subdir), depth + 1)
+
+    walk(root.resolve(), 0)
+    return projects
+
+
+def update_all(root: Path, workers: int = 4, force: bool = False, dry_run: bool = False,
+               overwrite_local: bool = False, max_depth: int = 3) -> int:
+    """Update every project below root concurrently. Returns the number of failures."""
+    root = root.resolve()
+    if not root.is_dir():
+        print(f"ERROR: Directory not found: {root}")
+        sys.exit(1)
 
-    # Update .claude directory
-    print("[1/4] Updating Claude configuration...")
-    claude_src = TOOLKIT_ROOT / "claude"
-    claude_dest = project_path / ".claude"
-
-    if claude_src.is_dir():
-        # Remove old hooks, commands, agents, skills (but preserve settings.local.json if exists)
-        settings_local = None
-        settings_local_path = claude_dest / "settings.local.json"
-        if settings_local_path.is_file():
-            settings_local = settings_local_path.read_text()
-
-        # Remove and replace subdirectories
-        for subdir in ["hooks", "commands", "agents", "skills", "SKILL.md"]:
-            dest_subdir = claude_dest / subdir
-            if dest_subdir.is_dir():
-                shutil.rmtree(dest_subdir)
-            src_subdir = claude_src / subdir
-            if src_subdir.is_dir():
-                shutil.copytree(src_subdir, dest_subdir)
-
-        # Update settings.json
-        settings_template = claude_src / "settings.json.template"
-        if settings_template.is_file():
-            shutil.copy2(settings_template, claude_dest / "settings.json")
-
-        # Update README
-        readme_src = claude_src / "README.md"
-        if readme_src.is_file():
-            shutil.copy2(readme_src, claude_dest / "README.md")
-
-        # Restore settings.local.json (or add default from toolkit)
-        if settings_local is not None:
-            settings_local_path.write_text(settings_local)
-        else:
-            settings_local_src = claude_src / "settings.local.json"
-            if settings_local_src.is_file() and not settings_local_path.is_file():
-                shutil.copy2(settings_local_src, settings_local_path)
-
-    # Update scripts
-    print("[2/4] Updating scripts...")
-    scripts_src = TOOLKIT_ROOT / "scripts"
-    scripts_dest = project_path / "scripts"
-
-    if scripts_src.is_dir():
-        # Backup any custom scripts
-        custom_scripts = []
-        if scripts_dest.is_dir():
-            toolkit_scripts = {f.name for f in scripts_src.iterdir() if f.is_file()}
-            for script in scripts_dest.iterdir():
-                if script.is_file() and script.name not in toolkit_scripts:
-                    custom_scripts.append((script.name, script.read_text()))
-
-        # Remove and replace
-        if scripts_dest.is_dir():
-            shutil.rmtree(scripts_dest)
-        shutil.copytree(scripts_src, scripts_dest)
-
-        # Restore custom scripts
-        for name, content in custom_scripts:
-            (scripts_dest / name).write_text(content)
-            print(f"       Preserved custom script: {name}")
-
-    # Update templates
-    print("[3/4] Updating templates...")
-    templates_src = TOOLKIT_ROOT / "templates"
-    templates_dest = project_path / "templates"
-
-    if templates_src.is_dir():
-        if templates_dest.is_dir():
-            shutil.rmtree(templates_dest)
-        shutil.copytree(templates_src, templates_dest)
-
-    # Update version marker
-    print("[4/4] Updating version marker...")
-    (project_path / ".toolkit-version").write_text(f"{new_version}\n")
-
-    # Update requirements if they exist
-    req_src = TOOLKIT_ROOT / "requirements-engineering.txt"
-    if req_src.is_file():
-        shutil.copy2(req_src, project_path / "requirements-engineering.txt")
+    projects = discover_projects(root, max_depth)
+    if not projects:
+        print(f"No toolkit projects (.toolkit-version) found under {root}")
+        return 0
 
+    new_version = toolkit_version(TOOLKIT_ROOT)
+    print(f"Updating {len(projects)} projects under {root} to {new_version} ({workers} workers)"
+          + (" - DRY RUN" if dry_run else ""))
     print()
-    print("=" * 60)
-    print(f"UPDATE COMPLETE: {old_version} -> {new_version}")
-    print("=" * 60)
-    print()
-    print("Updated:")
-    print("  - .claude/hooks/")
-    print("  - .claude/commands/")
-    print("  - .claude/agents/")
-    print("  - .claude/skills/")
-    print("  - .claude/SKILL.md/")
-    print("  - .claude/settings.json")
-    print("  - scripts/")
-    print("  - templates/")
-    print("  - requirements-engineering.txt")
-    print()
-    print("Preserved:")
-    print("  - All project content (calculations, docs, design, etc.)")
-    print("  - project_params.py")
-    print("  - CONTEXT.md, CLAUDE.md, WORKFLOW.md")
-    print("  - .claude/settings.local.json")
+
+    def run(project):
+        start = time.perf_counter()
+        try:
+            summary = update_project(project, force=force, dry_run=dry_run,
+                                     overwrite_local=overwrite_local, verbose=False)
+        except SystemExit:
+            # update_project already printed the ERROR line
+            summary = {"old_version": "?", "new_version": new_version, "status": "failed",
+                       "changed": 0, "conflicts": 0}
+        except OSError as e:
+            print(f"ERROR: {project}: {e}")
+            summary = {"old_version": "?", "new_version": new_version, "status": "failed",
+                       "changed": 0, "conflicts": 0}
+        return project, summary, time.perf_counter() - start
+
+    results = []
+    batch_start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as executor:
+        futures = [executor.submit(run, project) for project in projects]
+        for done, future in enumerate(as_completed(futures), 1):
+            project, summary, elapsed = future.result()
+            print(f"  [{done}/{len(projects)}] {summary['status']:<9} {project.relative_to(root)} ({elapsed:.2f} s)")
+            results.append((project, summary, elapsed))
+    batch_elapsed = time.perf_counter() - batch_start
+
     print()
-    print("Next: Run 'python verify-setup.py' to verify the update")
+    print("=" * 80)
+    print(f" {'Project':<32}{'Status':<11}{'Version':<20}{'Changed':>8}{'Conflicts':>10}{'Time':>9}")
+    print("-" * 80)
+    for project, summary, elapsed in sorted(results, key=lambda r: str(r[0])):
+        versions = f"{summary['old_version']} -> {summary['new_version']}"
+        print(f" {str(project.relative_to(root))[:31]:<32}{summary['status']:<11}{versions[:19]:<20}"
+              f"{summary['changed']:>8}{summary['conflicts']:>10}{elapsed:>8.2f}s")
+    print("-" * 80)
+    counts = {}
+    for _, summary, _ in results:
+        counts[summary["status"]] = counts.get(summary["status"], 0) + 1
+    print(" " + ", ".join(f"{count} {status}" for status, count in sorted(counts.items()))
+          + f" in {batch_elapsed:.2f} s")
+    if counts.get("conflicts"):
+        print(" Projects with conflicts have *.toolkit-new files to merge (see README).")
+    return counts.get("failed", 0)
 
 
 if __name__ == "__main__":
@@ -172,12 +428,30 @@ if __name__ == "__main__":
         description="Update existing project with latest toolkit"
     )
 
-    parser.add_argument("path", help="Project path to update")
+    parser.add_argument("path", nargs="?", help="Project path to update")
+    parser.add_argument("--all", metavar="DIR",
+                        help="Update every project (directory with .toolkit-version) under DIR")
+    parser.add_argument("--workers", type=int, default=4,
+                        help="Projects updated concurrently with --all (default: 4)")
+    parser.add_argument("--depth", type=int, default=3,
+                        help="How deep --all searches for projects (default: 3)")
     parser.add_argument("--force", action="store_true",
-                        help="Force update even if versions match")
+                        help="Re-check every file even if the toolkit is unchanged since the last update")
     parser.add_argument("--dry-run", action="store_true",
                         help="Show what would be updated")
+    parser.add_argument("--overwrite-local", action="store_true",
+                        help="Replace locally edited toolkit files instead of writing *.toolkit-new")
 
     args = parser.parse_args()
 
-    update_project(Path(args.path), force=args.force, dry_run=args.dry_run)
+    if args.all:
+        if args.path:
+            parser.error("give either a project path or --all DIR, not both")
+        failures = update_all(Path(args.all), workers=args.workers, force=args.force, dry_run=args.dry_run,
+                              overwrite_local=args.overwrite_local, max_depth=args.depth)
+        sys.exit(1 if failures else 0)
+    if not args.path:
+        parser.error("a project path is required (or use --all DIR)")
+
+    update_project(Path(args.path), force=args.force, dry_run=args.dry_run,
+                   overwrite_local=args.overwrite_local)
@@ -3,17 +3,37 @@
 Verify engineering project setup against toolkit requirements.
 
 Usage:
-    python verify-setup.py [project-path]
+    python verify-setup.py [project-path ...]
     python verify-setup.py ../projects/pump-design
     python verify-setup.py --strict  # Treat warnings as errors
+    python verify-setup.py ../projects/* --json > report.json
+
+Besides structure checks, one walk over the project tree validates notebook
+JSON, decision record headers, relative markdown links, parameter references
+in calculations and hook/script syntax (skip with --skip-content).
+
+Check groups run concurrently. Each group's result is cached in
+<project>/.toolkit-cache/verify-cache.json, keyed on the mtimes of the paths
+it depends on, so unchanged projects verify without re-running the checks.
+In a git project the cache is only written when .gitignore covers it, so
+verification never dirties the working tree.
 """
 
 import argparse
+import ast
+import hashlib
 import json
+import os
+import re
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Decision header patterns are shared with the index (scripts/decisions.py) so the two agree
+sys.path.insert(0, str(Path(__file__).resolve().parent / "scripts"))
+from decisions import DATE_FIELD_PATTERN, STATUS_FIELD_PATTERN
+
 # Required directories
 REQUIRED_DIRS = [
     ".claude",
@@ -93,13 +113,46 @@ REQUIRED_SCRIPTS = [
 ]
 
 
-class Verifier:
-    def __init__(self, project_path: Path, strict: bool = False):
-        self.project_path = project_path.resolve()
-        self.strict = strict
+# Directories the content scan never enters
+SCAN_SKIP_DIRS = {
+    ".git", ".venv", "venv", "node_modules", "__pycache__", ".ipynb_checkpoints",
+    "chroma_db", ".toolkit-cache", ".env-cache", ".pytest_cache",
+}
+
+# Toolkit-managed directories: their markdown holds placeholder links (URL, DEC-NNN)
+LINK_CHECK_SKIP_DIRS = {".claude", "templates", "scripts"}
+
+# Python files whose syntax is checked
+SYNTAX_CHECK_DIRS = {".claude/hooks", "scripts"}
+
+DECISION_STATUSES = {"proposed", "accepted", "deprecated", "superseded"}
+
+MD_LINK_PATTERN = re.compile(r'!?\[[^\]]*\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+INLINE_CODE_PATTERN = re.compile(r'`[^`]*`')
+URL_SCHEME_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*:')
+DEC_FILE_PATTERN = re.compile(r'^DEC-(\d+)')
+INLINE_STRING_PATTERN = re.compile(r'"[^"\n]*"|\'[^\'\n]*\'')
+PARAM_NAME_PATTERN = re.compile(r'\b[A-Z][A-Z0-9]*(?:_[A-Z0-9]+)+\b')
+PARAMS_IMPORT_PATTERN = re.compile(r'^\s*(?:from\s+project_params\s+import|import\s+project_params)', re.MULTILINE)
+
+CACHE_PATH = Path(".toolkit-cache") / "verify-cache.json"
+
+# Cached results are invalid once this script (and its required lists) change
+VERIFIER_HASH = hashlib.sha256(Path(__file__).read_bytes()
+                               + (Path(__file__).resolve().parent / "scripts" / "decisions.py").read_bytes()
+                               ).hexdigest()[:16]
+
+
+class CheckGroup:
+    """Results of one group of checks, printed as one [Section] of the report."""
+
+    def __init__(self, name: str):
+        self.name = name
         self.passes = 0
         self.warnings = 0
         self.errors = 0
+        self.lines = []  # (level, message); level is PASS/WARN/FAIL/INFO or "" for plain text
+        self.cached = False
 
     def check(self, condition: bool, message: str, is_warning: bool = False) -> bool:
         """Record a check result."""
@@ -108,57 +161,374 @@ class Verifier:
             return True
         elif is_warning:
             self.warnings += 1
-            print(f"  [WARN] {message}")
+            self.lines.append(("WARN", message))
             return False
         else:
             self.errors += 1
-            print(f"  [FAIL] {message}")
+            self.lines.append(("FAIL", message))
+            return False
+
+    def report(self, level: str, message: str):
+        """Record an output line that does not count as a check."""
+        self.lines.append((level, message))
+
+    def print(self):
+        print(f"\n[{self.name}]")
+        for level, message in self.lines:
+            print(f"  [{level}] {message}" if level else f"  {message}")
+
+    def to_dict(self) -> dict:
+        return {
+            "name": self.name,
+            "passes": self.passes,
+            "warnings": self.warnings,
+            "errors": self.errors,
+            "cached": self.cached,
+            "findings": [{"level": level or "TEXT", "message": message} for level, message in self.lines],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "CheckGroup":
+        group = cls(data["name"])
+        group.passes, group.warnings, group.errors = data["passes"], data["warnings"], data["errors"]
+        group.lines = [("" if f["level"] == "TEXT" else f["level"], f["message"]) for f in data["findings"]]
+        return group
+
+
+class ProjectScanner:
+    """
+    Validate project content in a single walk of the tree.
+
+    Every file is visited once via os.scandir and read at most once. Checks that
+    need the whole tree (link targets, parameter definitions) are resolved after
+    the walk against what it collected, without touching the filesystem again.
+    """
+
+    def __init__(self, project_path: Path):
+        self.project_path = project_path
+        self.paths = set()          # Every file and directory seen (posix, relative)
+        self.links = []             # (source, line, target path, raw target)
+        self.param_uses = []        # (source, {name: line}, locally assigned names)
+        self.defined_params = None  # Names assigned in project_params.py
+        self.findings = []          # (level, path, line, message)
+        self.files_scanned = 0
+
+    def finding(self, level: str, rel_path: str, line, message: str):
+        self.findings.append((level, rel_path, line, message))
+
+    def scan(self) -> list:
+        """Walk the project and return findings sorted by path."""
+        self.walk(self.project_path, "")
+        self.check_links()
+        self.check_param_uses()
+        return sorted(self.findings, key=lambda f: (f[1], f[2] or 0))
+
+    def walk(self, directory: Path, rel_dir: str):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name in SCAN_SKIP_DIRS:
+                    continue
+                self.paths.add(rel_path)
+                self.walk(Path(entry.path), rel_path)
+            elif entry.is_file():
+                self.paths.add(rel_path)
+                self.scan_file(Path(entry.path), rel_path, rel_dir)
+
+    def scan_file(self, path: Path, rel_path: str, rel_dir: str):
+        name = path.name
+        suffix = path.suffix.lower()
+        top_dir = rel_path.split("/", 1)[0] if "/" in rel_path else ""
+
+        wants_links = suffix == ".md" and top_dir not in LINK_CHECK_SKIP_DIRS
+        is_decision = suffix == ".md" and rel_dir == "docs/decisions" and DEC_FILE_PATTERN.match(name)
+        is_notebook = suffix == ".ipynb"
+        is_python = suffix == ".py"
+        if not (wants_links or is_decision or is_notebook or is_python):
+            return
+
+        try:
+            text = path.read_text(encoding='utf-8')
+        except (OSError, UnicodeDecodeError) as e:
+            self.finding("FAIL", rel_path, None, f"unreadable: {e}")
+            return
+        self.files_scanned += 1
+
+        if wants_links:
+            self.collect_links(text, rel_path, rel_dir)
+        if is_decision:
+            self.check_decision(text, rel_path, name)
+        if is_notebook:
+            self.check_notebook(text, rel_path)
+        if is_python:
+            if rel_path == "project_params.py":
+                self.collect_params(text, rel_path)
+            elif rel_dir in SYNTAX_CHECK_DIRS:
+                self.check_syntax(text, rel_path)
+            elif top_dir == "calculations":
+                self.collect_param_uses([("line", text)], rel_path)
+
+    def collect_links(self, text: str, rel_path: str, rel_dir: str):
+        in_fence = False
+        for line_no, line in enumerate(text.splitlines(), 1):
+            if line.lstrip().startswith(("```", "~~~")):
+                in_fence = not in_fence
+                continue
+            if in_fence:
+                continue
+            for match in MD_LINK_PATTERN.finditer(INLINE_CODE_PATTERN.sub("", line)):
+                raw = match.group(1)
+                if raw.startswith(("#", "/")) or URL_SCHEME_PATTERN.match(raw):
+                    continue
+                target = raw.split("#", 1)[0].split("?", 1)[0]
+                if target:
+                    resolved = os.path.normpath(os.path.join(rel_dir, target)).replace(os.sep, "/")
+                    self.links.append((rel_path, line_no, resolved, raw))
+
+    def check_links(self):
+        for rel_path, line_no, target, raw in self.links:
+            if target in self.paths or target == ".":
+                continue
+            top_dir = target.split("/", 1)[0]
+            if target.startswith("../") or top_dir in SCAN_SKIP_DIRS:
+                # Outside the scanned tree - the only case that needs a stat
+                if (self.project_path / target).exists():
+                    continue
+            self.finding("WARN", rel_path, line_no, f"broken link: {raw}")
+
+    def check_decision(self, text: str, rel_path: str, name: str):
+        number = int(DEC_FILE_PATTERN.match(name).group(1))
+        title = re.search(r'^# (.+)', text, re.MULTILINE)
+        if not title:
+            self.finding("WARN", rel_path, None, "decision record has no '# DEC-NNN: Title' heading")
+        else:
+            title_number = re.match(r'DEC-(\d+)', title.group(1).strip())
+            if title_number and int(title_number.group(1)) != number:
+                self.finding("WARN", rel_path, None,
+                             f"heading says DEC-{title_number.group(1)} but file is DEC-{number:03d}")
+        date = DATE_FIELD_PATTERN.search(text)
+        if not date or not date.group(1).strip():
+            self.finding("WARN", rel_path, None, "decision record missing **Date:**")
+        status = STATUS_FIELD_PATTERN.search(text)
+        if not status or not status.group(1).strip():
+            self.finding("WARN", rel_path, None, "decision record missing **Status:**")
+        else:
+            word = status.group(1).strip().split()[0].strip("*,.").lower()
+            if word not in DECISION_STATUSES:
+                self.finding("WARN", rel_path, None,
+                             f"unknown decision status '{status.group(1).strip()}' "
+                             f"(expected {', '.join(sorted(s.title() for s in DECISION_STATUSES))})")
+
+    def check_notebook(self, text: str, rel_path: str):
+        try:
+            notebook = json.loads(text)
+        except json.JSONDecodeError as e:
+            self.finding("FAIL", rel_path, e.lineno, f"notebook is invalid JSON: {e.msg}")
+            return
+        if not isinstance(notebook, dict) or not isinstance(notebook.get("cells"), list) \
+                or "nbformat" not in notebook:
+            self.finding("FAIL", rel_path, None, "notebook is missing 'cells' or 'nbformat'")
+            return
+        if rel_path.split("/", 1)[0] == "calculations":
+            cells = [(f"cell {i}", "".join(cell.get("source", "")))
+                     for i, cell in enumerate(notebook["cells"], 1) if cell.get("cell_type") == "code"]
+            self.collect_param_uses(cells, rel_path)
+
+    def check_syntax(self, text: str, rel_path: str):
+        try:
+            compile(text, rel_path, "exec", dont_inherit=True)
+        except SyntaxError as e:
+            self.finding("FAIL", rel_path, e.lineno, f"syntax error: {e.msg}")
+
+    def collect_params(self, text: str, rel_path: str):
+        try:
+            tree = ast.parse(text, rel_path)
+        except SyntaxError as e:
+            self.finding("FAIL", rel_path, e.lineno, f"syntax error: {e.msg}")
+            self.defined_params = None
+            return
+        self.defined_params = assigned_names(tree)
+
+    def collect_param_uses(self, chunks: list, rel_path: str):
+        """Record UPPER_CASE names used by code that imports project_params.
+
+        chunks: (label, code) pairs - a notebook's code cells, or ("line", source) for a .py file
+        """
+        code = "\n".join(chunk for _, chunk in chunks)
+        if not PARAMS_IMPORT_PATTERN.search(code):
+            return
+        uses = {}
+        for label, chunk in chunks:
+            for line_no, line in enumerate(chunk.splitlines(), 1):
+                stripped = line.split("#", 1)[0]
+                for name in PARAM_NAME_PATTERN.findall(INLINE_STRING_PATTERN.sub("", stripped)):
+                    uses.setdefault(name, f"{label} {line_no}" if label == "line" else label)
+        try:
+            local = assigned_names(ast.parse(code))
+        except SyntaxError:
+            # IPython magics etc. - fall back to simple "NAME =" detection
+            local = set(re.findall(r'^\s*([A-Z][A-Z0-9_]*)\s*=(?!=)', code, re.MULTILINE))
+        self.param_uses.append((rel_path, uses, local))
+
+    def check_param_uses(self):
+        if self.defined_params is None:
+            return
+        for rel_path, uses, local in self.param_uses:
+            for name, location in uses.items():
+                if name not in self.defined_params and name not in local:
+                    self.finding("WARN", rel_path, None, f"{location}: {name} is not defined in project_params.py")
+
+
+def assigned_names(tree: ast.AST) -> set:
+    """Names bound anywhere in a module (assignments, imports, defs, loops)."""
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Name) and isinstance(node.ctx, ast.Store):
+            names.add(node.id)
+        elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            names.add(node.name)
+        elif isinstance(node, (ast.Import, ast.ImportFrom)):
+            for alias in node.names:
+                names.add((alias.asname or alias.name).split(".")[0])
+        elif isinstance(node, ast.arg):
+            names.add(node.arg)
+    return names
+
+
+class Verifier:
+    def __init__(self, project_path: Path, strict: bool = False, use_cache: bool = True,
+                 scan_content: bool = True):
+        self.project_path = project_path.resolve()
+        self.strict = strict
+        self.use_cache = use_cache
+        self.scan_content = scan_content
+        self.passes = 0
+        self.warnings = 0
+        self.errors = 0
+        self.groups = []
+
+    # Each entry: (method, paths whose mtimes key the cached result, or None
+    # to always run). Existence checks depend on the containing directory (its
+    # mtime changes when entries are added or removed); content checks depend
+    # on the file.
+    def check_groups(self) -> list:
+        groups = [
+            (self.verify_structure, ["."]),
+            (self.verify_core_files, ["."]),
+            (self.verify_context_md, ["CONTEXT.md"]),
+            (self.verify_claude_config, [".claude", ".claude/settings.json", ".claude/settings.local.json",
+                                         ".claude/hooks", ".claude/commands", ".claude/agents",
+                                         ".claude/skills", ".claude/SKILL.md"]),
+            (self.verify_scripts, ["scripts"]),
+            (self.verify_templates, ["templates"]),
+            (self.verify_git, [".git", ".git/HEAD", ".git/refs/heads", ".git/packed-refs"]),
+            (self.verify_optional, ["."]),
+        ]
+        if self.scan_content:
+            groups.append((self.verify_content, None))
+        return groups
+
+    def cache_key(self, paths: list) -> list:
+        """mtime/size fingerprint of the given project-relative paths."""
+        key = [VERIFIER_HASH]
+        for rel_path in paths:
+            try:
+                stat = os.stat(self.project_path / rel_path)
+                key.append([rel_path, stat.st_mtime_ns, stat.st_size])
+            except OSError:
+                key.append([rel_path, None, None])
+        return key
+
+    def load_cache(self) -> dict:
+        try:
+            return json.loads((self.project_path / CACHE_PATH).read_text(encoding='utf-8'))
+        except (OSError, json.JSONDecodeError):
+            return {}
+
+    def cache_ignored(self) -> bool:
+        """True unless the project is a git repository that would track the cache file."""
+        if not (self.project_path / ".git").exists():
+            return True
+        try:
+            result = subprocess.run(["git", "check-ignore", "-q", CACHE_PATH.as_posix()],
+                                    cwd=self.project_path, capture_output=True)
+        except OSError:
             return False
+        return result.returncode == 0
 
-    def verify_structure(self) -> int:
+    def save_cache(self, cache: dict):
+        cache_path = self.project_path / CACHE_PATH
+        if not self.cache_ignored():
+            return  # Older project without .toolkit-cache/ in .gitignore (update-project adds it)
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(cache, separators=(',', ':')), encoding='utf-8')
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            pass  # Read-only project - caching is best effort
+
+    def run_group(self, method, paths: list, cache: dict) -> tuple:
+        """Run one check group, or reuse its cached result if its inputs are unchanged."""
+        if paths is None:
+            return method(), None
+        key = self.cache_key(paths)
+        entry = cache.get(method.__name__)
+        if self.use_cache and entry and entry.get("key") == key:
+            group = CheckGroup.from_dict(entry["result"])
+            group.cached = True
+            return group, None
+        group = method()
+        return group, {"key": key, "result": group.to_dict()}
+
+    def verify_structure(self) -> CheckGroup:
         """Verify required directories exist."""
-        print("\n[Structure]")
+        group = CheckGroup("Structure")
         count = 0
         for dir_path in REQUIRED_DIRS:
             full_path = self.project_path / dir_path
-            if self.check(full_path.is_dir(), f"Missing directory: {dir_path}"):
+            if group.check(full_path.is_dir(), f"Missing directory: {dir_path}"):
                 count += 1
-        print(f"  [PASS] {count}/{len(REQUIRED_DIRS)} directories")
-        return count
+        group.report("PASS", f"{count}/{len(REQUIRED_DIRS)} directories")
+        return group
 
-    def verify_core_files(self) -> int:
+    def verify_core_files(self) -> CheckGroup:
         """Verify required core files exist."""
-        print("\n[Core Files]")
+        group = CheckGroup("Core Files")
         count = 0
         for file_path in REQUIRED_FILES:
             full_path = self.project_path / file_path
-            if self.check(full_path.is_file(), f"Missing file: {file_path}"):
+            if group.check(full_path.is_file(), f"Missing file: {file_path}"):
                 count += 1
-        print(f"  [PASS] {count}/{len(REQUIRED_FILES)} core files")
-        return count
+        group.report("PASS", f"{count}/{len(REQUIRED_FILES)} core files")
+        return group
 
-    def verify_context_md(self) -> int:
+    def verify_context_md(self) -> CheckGroup:
         """Verify CONTEXT.md has required sections."""
-        print("\n[CONTEXT.md Validation]")
+        group = CheckGroup("CONTEXT.md Validation")
         context_path = self.project_path / "CONTEXT.md"
 
         if not context_path.is_file():
-            self.errors += 1
-            print("  [FAIL] CONTEXT.md not found")
-            return 0
+            group.check(False, "CONTEXT.md not found")
+            return group
 
         content = context_path.read_text(encoding='utf-8')
         count = 0
         for section in CONTEXT_SECTIONS:
-            if self.check(section in content, f"Missing section: {section}"):
+            if group.check(section in content, f"Missing section: {section}"):
                 count += 1
 
-        print(f"  [PASS] {count}/{len(CONTEXT_SECTIONS)} required sections")
-        return count
+        group.report("PASS", f"{count}/{len(CONTEXT_SECTIONS)} required sections")
+        return group
 
-    def verify_claude_config(self) -> tuple:
+    def verify_claude_config(self) -> CheckGroup:
         """Verify Claude configuration."""
-        print("\n[Claude Configuration]")
+        group = CheckGroup("Claude Configuration")
 
         claude_dir = self.project_path / ".claude"
 
@@ -168,12 +538,12 @@ class Verifier:
         if settings_path.is_file():
             try:
                 json.loads(settings_path.read_text(encoding='utf-8'))
-                self.passes += 1
+                group.passes += 1
                 settings_valid = True
             except json.JSONDecodeError:
-                self.check(False, "settings.json is invalid JSON")
+                group.check(False, "settings.json is invalid JSON")
         else:
-            self.check(False, "settings.json not found")
+            group.check(False, "settings.json not found")
 
         # Check settings.local.json (core-memory config)
         settings_local_path = claude_dir / "settings.local.json"
@@ -181,106 +551,70 @@ class Verifier:
         if settings_local_path.is_file():
             try:
                 json.loads(settings_local_path.read_text(encoding='utf-8'))
-                self.passes += 1
+                group.passes += 1
                 settings_local_valid = True
             except json.JSONDecodeError:
-                self.check(False, "settings.local.json is invalid JSON")
+                group.check(False, "settings.local.json is invalid JSON")
         else:
-            self.check(False, "settings.local.json not found")
-
-        # Check hooks
-        hooks_dir = claude_dir / "hooks"
-        hooks_count = 0
-        for hook in REQUIRED_HOOKS:
-            if (hooks_dir / hook).is_file():
-                hooks_count += 1
-                self.passes += 1
-            else:
-                self.check(False, f"Missing hook: {hook}")
-
-        # Check commands
-        commands_dir = claude_dir / "commands"
-        commands_count = 0
-        for cmd in REQUIRED_COMMANDS:
-            if (commands_dir / cmd).is_file():
-                commands_count += 1
-                self.passes += 1
-            else:
-                self.check(False, f"Missing command: {cmd}")
-
-        # Check agents
-        agents_dir = claude_dir / "agents"
-        agents_count = 0
-        for agent in REQUIRED_AGENTS:
-            if (agents_dir / agent).is_file():
-                agents_count += 1
-                self.passes += 1
-            else:
-                self.check(False, f"Missing agent: {agent}")
-
-        # Check skills
-        skills_count = 0
-        for rel_path in REQUIRED_SKILLS:
-            if (claude_dir / rel_path).is_file():
-                skills_count += 1
-                self.passes += 1
-            else:
-                self.check(False, f"Missing skill file: {rel_path}")
-
-        skill_templates_count = 0
-        for rel_path in REQUIRED_SKILL_TEMPLATES:
-            if (claude_dir / rel_path).is_file():
-                skill_templates_count += 1
-                self.passes += 1
-            else:
-                self.check(False, f"Missing skill template: {rel_path}")
-
-        print(f"  Settings: {'valid' if settings_valid else 'INVALID'}")
-        print(f"  Settings.local: {'valid' if settings_local_valid else 'MISSING/INVALID'}")
-        print(f"  Hooks: {hooks_count}/{len(REQUIRED_HOOKS)}")
-        print(f"  Commands: {commands_count}/{len(REQUIRED_COMMANDS)}")
-        print(f"  Agents: {agents_count}/{len(REQUIRED_AGENTS)}")
-        print(f"  Skills: {skills_count}/{len(REQUIRED_SKILLS)}")
-        print(f"  Skill templates: {skill_templates_count}/{len(REQUIRED_SKILL_TEMPLATES)}")
-
-        return (hooks_count, commands_count, agents_count)
-
-def verify_scripts(self) -> int:
+            group.check(False, "settings.local.json not found")
+
+        # Check hooks, commands, agents and skills
+        counts = {}
+        for label, directory, names, message in (
+            ("Hooks", claude_dir / "hooks", REQUIRED_HOOKS, "Missing hook"),
+            ("Commands", claude_dir / "commands", REQUIRED_COMMANDS, "Missing command"),
+            ("Agents", claude_dir / "agents", REQUIRED_AGENTS, "Missing agent"),
+            ("Skills", claude_dir, REQUIRED_SKILLS, "Missing skill file"),
+            ("Skill templates", claude_dir, REQUIRED_SKILL_TEMPLATES, "Missing skill template"),
+        ):
+            counts[label] = sum(group.check((directory / name).is_file(), f"{message}: {name}") for name in names)
+
+        group.report("", f"Settings: {'valid' if settings_valid else 'INVALID'}")
+        group.report("", f"Settings.local: {'valid' if settings_local_valid else 'MISSING/INVALID'}")
+        group.report("", f"Hooks: {counts['Hooks']}/{len(REQUIRED_HOOKS)}")
+        group.report("", f"Commands: {counts['Commands']}/{len(REQUIRED_COMMANDS)}")
+        group.report("", f"Agents: {counts['Agents']}/{len(REQUIRED_AGENTS)}")
+        group.report("", f"Skills: {counts['Skills']}/{len(REQUIRED_SKILLS)}")
+        group.report("", f"Skill templates: {counts['Skill templates']}/{len(REQUIRED_SKILL_TEMPLATES)}")
+
+        return group
+
+    def verify_scripts(self) -> CheckGroup:
         """Verify required scripts exist."""
-        print("\n[Scripts]")
+        group = CheckGroup("Scripts")
         scripts_dir = self.project_path / "scripts"
         count = 0
         for script in REQUIRED_SCRIPTS:
-            if self.check((scripts_dir / script).is_file(), f"Missing script: {script}"):
+            if group.check((scripts_dir / script).is_file(), f"Missing script: {script}"):
                 count += 1
-        print(f"  [PASS] {count}/{len(REQUIRED_SCRIPTS)} scripts")
-        return count
+        group.report("PASS", f"{count}/{len(REQUIRED_SCRIPTS)} scripts")
+        return group
 
-    def verify_templates(self) -> int:
+    def verify_templates(self) -> CheckGroup:
         """Verify templates directory has content."""
-        print("\n[Templates]")
+        group = CheckGroup("Templates")
         templates_dir = self.project_path / "templates"
         if not templates_dir.is_dir():
-            self.check(False, "templates directory not found")
-            return 0
+            group.check(False, "templates directory not found")
+            return group
 
         templates = list(templates_dir.glob("*.md")) + list(templates_dir.glob("*.ipynb"))
         count = len(templates)
 
-        if self.check(count >= 6, f"Expected at least 6 templates, found {count}"):
-            print(f"  [PASS] {count} templates found")
-        return count
+        if group.check(count >= 6, f"Expected at least 6 templates, found {count}"):
+            group.report("PASS", f"{count} templates found")
+        return group
 
-    def verify_git(self) -> bool:
+    def verify_git(self) -> CheckGroup:
         """Verify git repository (warning only)."""
-        print("\n[Git]")
+        group = CheckGroup("Git")
         git_dir = self.project_path / ".git"
 
         if not git_dir.is_dir():
-            self.check(False, "Not a git repository", is_warning=True)
-            return False
+            group.check(False, "Not a git repository", is_warning=True)
+            return group
 
-        self.passes += 1
+        group.passes += 1
         try:
             result = subprocess.run(
                 ["git", "-C", str(self.project_path), "rev-parse", "--verify", "HEAD"],
@@ -288,74 +622,118 @@ def verify_scripts(self) -> int:
                 text=True
             )
             if result.returncode == 0:
-                self.passes += 1
-                print("  [PASS] Git repository initialized with commits")
-                return True
-            self.check(False, "Git repository has no commits", is_warning=True)
-            return False
+                group.passes += 1
+                group.report("PASS", "Git repository initialized with commits")
+                return group
+            group.check(False, "Git repository has no commits", is_warning=True)
         except FileNotFoundError:
-            self.check(False, "Git not available to verify commits", is_warning=True)
-            return False
+            group.check(False, "Git not available to verify commits", is_warning=True)
+        return group
 
-    def verify_optional(self):
+    def verify_optional(self) -> CheckGroup:
         """Check optional components."""
-        print("\n[Optional Components]")
+        group = CheckGroup("Optional Components")
+
+        for path, is_dir, present, absent in (
+            ("chroma_db", True, "RAG index present", "RAG index not initialized"),
+            (".venv", True, "Virtual environment present", "Virtual environment not created"),
+            ("dashboard.html", False, "Dashboard generated", "Dashboard not generated"),
+        ):
+            full_path = self.project_path / path
+            exists = full_path.is_dir() if is_dir else full_path.is_file()
+            group.report("INFO", present if exists else absent)
+        return group
+
+    def verify_content(self) -> CheckGroup:
+        """Validate notebooks, decision records, links, parameter references and syntax in one walk."""
+        group = CheckGroup("Content Validation")
+        scanner = ProjectScanner(self.project_path)
+        findings = scanner.scan()
+
+        for level, rel_path, line, message in findings:
+            location = f"{rel_path}:{line}" if line else rel_path
+            group.check(False, f"{location} {message}", is_warning=(level == "WARN"))
+        group.passes += scanner.files_scanned - len({f[1] for f in findings})
+        if scanner.defined_params is None and (self.project_path / "project_params.py").is_file():
+            group.report("INFO", "Parameter references not checked (project_params.py did not parse)")
+        group.report("PASS" if not findings else "INFO",
+                     f"{scanner.files_scanned} files scanned, {len(scanner.links)} links, "
+                     f"{len(findings)} findings")
+        return group
+
+    def collect(self, workers: int = 8) -> int:
+        """Run all check groups concurrently. Returns the exit code."""
+        if not self.project_path.is_dir():
+            self.groups = []
+            self.errors = 1
+            return 1
 
-        # RAG
-        chroma_db = self.project_path / "chroma_db"
-        if chroma_db.is_dir():
-            print("  [INFO] RAG index present")
-        else:
-            print("  [INFO] RAG index not initialized")
+        cache = self.load_cache() if self.use_cache else {}
+        groups = self.check_groups()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(lambda g: self.run_group(g[0], g[1], cache), groups))
 
-        # Venv
-        venv = self.project_path / ".venv"
-        if venv.is_dir():
-            print("  [INFO] Virtual environment present")
-        else:
-            print("  [INFO] Virtual environment not created")
+        new_entries = {method.__name__: entry for (method, _), (_, entry) in zip(groups, results) if entry}
+        if new_entries and self.use_cache:
+            self.save_cache({**cache, **new_entries})
 
-        # Dashboard
-        dashboard = self.project_path / "dashboard.html"
-        if dashboard.is_file():
-            print("  [INFO] Dashboard generated")
-        else:
-            print("  [INFO] Dashboard not generated")
+        self.groups = [group for group, _ in results]
+        self.passes = sum(g.passes for g in self.groups)
+        self.warnings = sum(g.warnings for g in self.groups)
+        self.errors = sum(g.errors for g in self.groups)
+        return self.exit_code()
 
-    def run(self) -> int:
-        """Run all verifications."""
+    def exit_code(self) -> int:
+        if self.errors > 0:
+            return 1
+        elif self.warnings > 0 and self.strict:
+            return 2
+        return 0
+
+    def status(self) -> str:
+        if not self.groups and self.errors:
+            return "MISSING"
+        if self.errors > 0:
+            return "INVALID"
+        elif self.warnings > 0 and self.strict:
+            return "INVALID (strict mode)"
+        elif self.warnings > 0:
+            return "VALID (with warnings)"
+        return "VALID"
+
+    def to_dict(self) -> dict:
+        return {
+            "path": str(self.project_path),
+            "status": self.status(),
+            "exit_code": self.exit_code(),
+            "passes": self.passes,
+            "warnings": self.warnings,
+            "errors": self.errors,
+            "groups": [g.to_dict() for g in self.groups],
+        }
+
+    def print_report(self):
+        """Print the human-readable report."""
         print(f"Verifying: {self.project_path}")
 
-        if not self.project_path.is_dir():
+        if not self.groups and self.errors:
             print(f"ERROR: Path does not exist: {self.project_path}")
-            return 1
+            return
 
-        self.verify_structure()
-        self.verify_core_files()
-        self.verify_context_md()
-        self.verify_claude_config()
-        self.verify_scripts()
-        self.verify_templates()
-        self.verify_git()
-        self.verify_optional()
+        for group in self.groups:
+            group.print()
 
         # Summary
         print()
         print("=" * 60)
         print(f"SUMMARY: {self.passes} passed, {self.warnings} warnings, {self.errors} errors")
+        print(f"STATUS: {self.status()}")
 
-        if self.errors > 0:
-            print("STATUS: INVALID")
-            return 1
-        elif self.warnings > 0 and self.strict:
-            print("STATUS: INVALID (strict mode)")
-            return 2
-        elif self.warnings > 0:
-            print("STATUS: VALID (with warnings)")
-            return 0
-        else:
-            print("STATUS: VALID")
-            return 0
+    def run(self) -> int:
+        """Run all verifications."""
+        code = self.collect()
+        self.print_report()
+        return code
 
 
 if __name__ == "__main__":
@@ -365,18 +743,62 @@ if __name__ == "__main__":
     )
 
     parser.add_argument(
-        "path",
-        nargs="?",
-        default=".",
-        help="Project path to verify (default: current directory)"
+        "paths",
+        nargs="*",
+        default=["."],
+        help="Project path(s) to verify (default: current directory)"
     )
     parser.add_argument(
         "--strict",
         action="store_true",
         help="Treat warnings as errors"
     )
+    parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print a JSON report instead of text"
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-run every check instead of reusing cached results"
+    )
+    parser.add_argument(
+        "--skip-content",
+        action="store_true",
+        help="Skip the content scan (notebooks, decisions, links, parameters, syntax)"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=8,
+        help="Projects verified concurrently (default: 8)"
+    )
 
     args = parser.parse_args()
 
-    verifier = Verifier(Path(args.path), strict=args.strict)
-    sys.exit(verifier.run())
+    verifiers = [Verifier(Path(p), strict=args.strict, use_cache=not args.no_cache,
+                          scan_content=not args.skip_content) for p in args.paths]
+    with ThreadPoolExecutor(max_workers=max(1, args.workers)) as pool:
+        codes = list(pool.map(lambda v: v.collect(), verifiers))
+
+    if args.json:
+        print(json.dumps({
+            "projects": [v.to_dict() for v in verifiers],
+            "summary": {
+                "projects": len(verifiers),
+                "valid": sum(1 for code in codes if code == 0),
+                "invalid": sum(1 for code in codes if code != 0),
+            },
+        }, indent=2))
+    else:
+        for i, verifier in enumerate(verifiers):
+            if i:
+                print()
+            verifier.print_report()
+        if len(verifiers) > 1:
+            print()
+            print("=" * 60)
+            print(f"PROJECTS: {sum(1 for c in codes if c == 0)}/{len(verifiers)} valid")
+
+    sys.exit(max(codes))